@@ -11,12 +11,15 @@ Separation of concerns FTW! 🎯
 
 import argparse
 import io
+import os
 import sys
 import logging
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union, cast
 
+from PIL import Image
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.panel import Panel
@@ -45,6 +48,7 @@ from .constants import (
 )
 from .config import ConversionConfig
 from .pixel_to_3mf import convert_image_to_3mf
+from .threemf_writer import warm_color_caches
 
 # Reconfigure stdout to handle Unicode properly on Windows
 # This prevents UnicodeEncodeError when printing emojis in tests
@@ -64,10 +68,29 @@ if isinstance(sys.stderr, io.TextIOWrapper):
 console = Console()
 error_console = Console(stderr=True)
 
+# Batch images up to this many pixels are converted in the main process
+# rather than sent to a worker (see process_batch)
+_INLINE_BATCH_MAX_PIXELS = 64 * 64
 
-def is_image_file(filepath: Path) -> bool:
-    """Check if a file is a supported image format."""
-    return filepath.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS
+
+# Supported extensions without the dot, for matching against str.rpartition()
+_IMAGE_EXTENSIONS = frozenset(ext.lstrip('.') for ext in SUPPORTED_IMAGE_EXTENSIONS)
+
+
+def is_image_file(filepath: Union[Path, str]) -> bool:
+    """
+    Check if a file is a supported image format.
+    
+    Accepts a Path or a bare file name. The extension is found the same way
+    as Path.suffix (so ".png" alone is a hidden file, not an image), but by
+    splitting the name string directly.
+    
+    WHY: Batch discovery calls this once per directory entry; working on
+    the name string skips building a Path and its parsed parts.
+    """
+    name = filepath.name if isinstance(filepath, Path) else filepath
+    stem, dot, extension = name.rpartition('.')
+    return bool(stem and dot) and extension.lower() in _IMAGE_EXTENSIONS
 
 
 def generate_batch_summary(
@@ -88,86 +111,269 @@ def generate_batch_summary(
     Returns:
         Path to the generated summary file
     """
-    timestamp = start_time.strftime("%Y%m%d%H%M%S")
+    # YYYYMMDDHHMMSS, formatted from the fields directly
+    # WHY: Same text as strftime("%Y%m%d%H%M%S") without the locale-aware
+    # C formatting round trip
+    t = start_time
+    timestamp = f"{t.year:04d}{t.month:02d}{t.day:02d}{t.hour:02d}{t.minute:02d}{t.second:02d}"
     summary_path = output_folder / f"batch_summary_{timestamp}.md"
     
-    duration = end_time - start_time
+    # The whole document is built in memory and written in one go
+    summary_path.write_text(_format_batch_summary(results, start_time, end_time), encoding='utf-8')
+    
+    return str(summary_path)
+
+
+def _format_batch_summary(
+    results: Dict[str, List[Dict[str, Any]]],
+    start_time: datetime,
+    end_time: datetime
+) -> str:
+    """
+    Render the Markdown written by generate_batch_summary().
+    
+    Args:
+        results: Dictionary with 'success', 'skipped', and 'failed' lists
+        start_time: When batch processing started
+        end_time: When batch processing finished
+    
+    Returns:
+        The summary document as a string
+    """
+    elapsed = (end_time - start_time).total_seconds()
+    t = start_time
+    succeeded, skipped, failed = results['success'], results['skipped'], results['failed']
     
     # Build the markdown content
-    lines = []
-    lines.append("# Batch Conversion Summary")
-    lines.append(f"**Date:** {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"**Duration:** {duration.total_seconds():.1f} seconds")
-    lines.append("")
-    
-    # Results overview
-    lines.append("## Results Overview")
-    lines.append(f"- ✅ **Successful:** {len(results['success'])} files")
-    lines.append(f"- ⚠️  **Skipped:** {len(results['skipped'])} files")
-    lines.append(f"- ❌ **Failed:** {len(results['failed'])} files")
-    lines.append(f"- 📁 **Total processed:** {len(results['success']) + len(results['skipped']) + len(results['failed'])} files")
-    lines.append("")
-    
-    # Successful conversions
-    if results['success']:
-        lines.append("## ✅ Successful Conversions")
-        lines.append("")
-        lines.append("| Input File | Output File | Regions | Colors | Model Size | File Size |")
-        lines.append("|------------|-------------|---------|--------|------------|-----------|")
-        
-        for item in results['success']:
-            lines.append(
-                f"| {item['input_file']} | {item['output_file']} | "
-                f"{item['num_regions']} | {item['num_colors']} | "
-                f"{item['model_width_mm']:.1f}x{item['model_height_mm']:.1f}mm | "
-                f"{item['file_size']} |"
-            )
+    lines = [
+        "# Batch Conversion Summary",
+        f"**Date:** {t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}:{t.second:02d}",
+        f"**Duration:** {elapsed:.1f} seconds",
+        "",
+        # Results overview
+        "## Results Overview",
+        f"- ✅ **Successful:** {len(succeeded)} files",
+        f"- ⚠️  **Skipped:** {len(skipped)} files",
+        f"- ❌ **Failed:** {len(failed)} files",
+        f"- 📁 **Total processed:** {len(succeeded) + len(skipped) + len(failed)} files",
+        "",
+    ]
+    
+    # Successful conversions - one table row per file
+    if succeeded:
+        lines += [
+            "## ✅ Successful Conversions",
+            "",
+            "| Input File | Output File | Regions | Colors | Model Size | File Size |",
+            "|------------|-------------|---------|--------|------------|-----------|",
+        ]
+        lines.extend(
+            f"| {item['input_file']} | {item['output_file']} | "
+            f"{item['num_regions']} | {item['num_colors']} | "
+            f"{item['model_width_mm']:.1f}x{item['model_height_mm']:.1f}mm | "
+            f"{item['file_size']} |"
+            for item in succeeded
+        )
         lines.append("")
     
     # Skipped files
-    if results['skipped']:
-        lines.append("## ⚠️  Skipped Files")
-        lines.append("")
-        lines.append("These files were skipped due to resolution warnings:")
-        lines.append("")
-        
-        for item in results['skipped']:
-            lines.append(f"### {item['input_file']}")
-            lines.append(f"**Reason:** {item['reason']}")
-            lines.append("")
+    if skipped:
+        lines += [
+            "## ⚠️  Skipped Files",
+            "",
+            "These files were skipped due to resolution warnings:",
+            "",
+        ]
+        for item in skipped:
+            lines += [f"### {item['input_file']}", f"**Reason:** {item['reason']}", ""]
     
     # Failed files
-    if results['failed']:
-        lines.append("## ❌ Failed Files")
-        lines.append("")
-        lines.append("These files encountered errors during conversion:")
-        lines.append("")
-        
-        for item in results['failed']:
-            lines.append(f"### {item['input_file']}")
-            lines.append(f"**Error:** {item['error']}")
-            lines.append("")
+    if failed:
+        lines += [
+            "## ❌ Failed Files",
+            "",
+            "These files encountered errors during conversion:",
+            "",
+        ]
+        for item in failed:
+            lines += [f"### {item['input_file']}", f"**Error:** {item['error']}", ""]
+    
+    return '\n'.join(lines)
+
+
+def _iter_images(root: Path, recurse: bool) -> Iterator[Path]:
+    """
+    Yield the supported image files in a folder, optionally recursing.
     
-    # Write the summary
-    summary_path.write_text('\n'.join(lines), encoding='utf-8')
+    Like filtering Path.iterdir()/Path.rglob('*') with is_file() and
+    is_image_file(): symlinks to files count, symlinked folders are not
+    descended into. Order is unspecified - callers sort.
     
-    return str(summary_path)
+    WHY: os.scandir() hands back each entry's type from the directory
+    listing itself, so there is no extra stat() per entry and no Path
+    object for entries that turn out not to be images.
+    
+    Args:
+        root: Folder to search
+        recurse: If True, also search all subfolders
+    
+    Yields:
+        Path of each image file found
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recurse:
+                        stack.append(entry.path)
+                elif is_image_file(entry.name) and entry.is_file():
+                    yield Path(entry.path)
+
+
+def _configure_logging(log_file: Optional[str], filemode: str = 'w') -> None:
+    """
+    Set up logging for the CLI.
+    
+    With a log file, everything from DEBUG up goes to that file. Without
+    one, logging is effectively disabled so logger.warning() calls from the
+    pipeline don't break the Rich console output.
+    
+    Args:
+        log_file: Path of the log file, or None for no logging
+        filemode: 'w' to start the file fresh, 'a' to add to it
+    """
+    if log_file:
+        # Log to file with DEBUG level when --log-file is specified
+        logging.basicConfig(
+            filename=log_file,
+            level=logging.DEBUG,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            filemode=filemode
+        )
+    else:
+        # When no log file specified, disable all logging output to console
+        # This prevents logger.warning() calls from breaking Rich output
+        logging.basicConfig(
+            level=logging.CRITICAL + 1,  # Higher than CRITICAL = effectively disabled
+            format='%(message)s'
+        )
+
+
+def _init_batch_worker(use_optimized_mesh: bool, log_file: Optional[str]) -> None:
+    """
+    Prepare a batch worker process.
+    
+    Worker processes don't run main(), so the mesh optimization switch and
+    the log file are passed in explicitly, and each worker loads the color
+    palettes once instead of during its first conversion.
+    
+    WHY: Where workers are started fresh (Windows, macOS) nothing would set
+    up their logging, so pipeline warnings would land on stderr through
+    Python's fallback handler and never reach --log-file.
+    
+    Args:
+        use_optimized_mesh: Value for mesh_generator.USE_OPTIMIZED_MESH_GENERATION
+        log_file: Log file main() writes to (None = logging disabled)
+    """
+    # Append - main() already started the file (a no-op where the worker
+    # inherited the parent's logging setup)
+    _configure_logging(log_file, filemode='a')
+    import pixel_to_3mf.mesh_generator as mg
+    mg.USE_OPTIMIZED_MESH_GENERATION = use_optimized_mesh
+    warm_color_caches()
+
+
+def _is_small_image(path: Path) -> bool:
+    """
+    Check from the image header whether process_batch() converts it in-process.
+    
+    Args:
+        path: Path to the input image
+    
+    Returns:
+        True if the image has at most _INLINE_BATCH_MAX_PIXELS pixels;
+        False if it is larger or can't be opened (a worker reports the error)
+    """
+    try:
+        # Image.open() only reads the header - the pixels aren't decoded
+        with Image.open(path) as img:
+            width, height = img.size
+    except Exception:
+        return False
+    return width * height <= _INLINE_BATCH_MAX_PIXELS
+
+
+def _convert_one(input_path: str, output_path: str, config: ConversionConfig) -> Tuple[str, Any]:
+    """
+    Convert a single batch image and classify the outcome.
+    
+    Top-level (picklable) so process_batch() can run it in worker processes.
+    
+    Args:
+        input_path: Path to the input image
+        output_path: Path where the 3MF file should be written
+        config: ConversionConfig object with conversion parameters
+    
+    Returns:
+        ('success', stats) with the stats process_batch() reports,
+        ('skipped', reason) for resolution warnings, or ('failed', error)
+    """
+    try:
+        # All settings including skip_checks and batch_mode are in the config!
+        stats = convert_image_to_3mf(
+            input_path=input_path,
+            output_path=output_path,
+            config=config,
+            progress_callback=None  # No progress in batch mode
+        )
+    except ValueError as e:
+        error_msg = str(e)
+        # Check if this is a resolution warning
+        # The error message from the resolution check contains this specific text
+        if "resolution too high" in error_msg.lower():
+            return 'skipped', error_msg
+        # Other ValueError = actual failure (e.g., too many colors)
+        return 'failed', error_msg
+    except Exception as e:
+        # Any other error = failure
+        return 'failed', str(e)
+    
+    # Only send back what the batch report uses (the full stats hold the
+    # config and color mapping, which would just be pickled for nothing)
+    return 'success', {
+        key: stats[key] for key in (
+            'num_regions', 'num_colors', 'model_width_mm', 'model_height_mm',
+            'num_vertices', 'num_triangles', 'file_size'
+        )
+    }
 
 
 def process_batch(
     input_folder: Path,
     output_folder: Path,
     config: ConversionConfig,
-    recurse: bool = False
+    recurse: bool = False,
+    workers: Optional[int] = None,
+    log_file: Optional[str] = None
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Process all images in a folder in batch mode.
     
+    Images are independent, so with more than one worker they are converted
+    in parallel worker processes (small images are converted in this
+    process alongside them). Results are still reported (and returned) in
+    sorted file order.
+    
     Args:
         input_folder: Folder containing input images
         output_folder: Folder where output files should be written
         config: ConversionConfig object with conversion parameters (including skip_checks and batch_mode flags)
         recurse: If True, process subfolders recursively and maintain folder structure
+        workers: Number of worker processes (None = one per CPU). With 1
+                worker, or a single image, everything runs in this process.
+        log_file: Log file the worker processes should write to, as set up
+                by main() (None = logging disabled in the workers)
         
     Returns:
         Dictionary with 'success', 'skipped', and 'failed' results
@@ -177,15 +383,14 @@ def process_batch(
         'skipped': [],
         'failed': []
     }
+    # Bound once - the report loop appends to these for every file
+    succeeded, skipped, failed = results['success'], results['skipped'], results['failed']
     
     # Make sure output folder exists
     output_folder.mkdir(parents=True, exist_ok=True)
     
     # Find all image files (recursively or not)
-    if recurse:
-        image_files = [f for f in input_folder.rglob('*') if f.is_file() and is_image_file(f)]
-    else:
-        image_files = [f for f in input_folder.iterdir() if f.is_file() and is_image_file(f)]
+    image_files = list(_iter_images(input_folder, recurse))
     
     if not image_files:
         console.print(f"[yellow]⚠️  No image files found in {input_folder}[/yellow]")
@@ -194,10 +399,12 @@ def process_batch(
     console.print(f"[cyan]📁 Found {len(image_files)} image(s) to process[/cyan]")
     console.print()
     
-    # Process each file
-    for i, input_path in enumerate(sorted(image_files), start=1):
-        console.print(f"[cyan][{i}/{len(image_files)}] Processing: {input_path.name}[/cyan]")
-        
+    # Load color palettes once up front instead of inside the first conversion
+    warm_color_caches()
+    
+    # Pair each input with its output path
+    jobs = []
+    for input_path in sorted(image_files):
         # Determine output path - preserve folder structure if recursive
         if recurse:
             # Calculate relative path from input folder
@@ -210,70 +417,86 @@ def process_batch(
             # Flat structure - all files go to output folder root
             output_filename = input_path.stem + DEFAULT_OUTPUT_SUFFIX + '.3mf'
             output_file_path = output_folder / output_filename
-        
-        try:
-            # Try to convert the image
-            # All settings including skip_checks and batch_mode are in the config!
-            stats = convert_image_to_3mf(
-                input_path=str(input_path),
-                output_path=str(output_file_path),
-                config=config,
-                progress_callback=None  # No progress in batch mode
+        jobs.append((input_path, output_file_path))
+    
+    # WHY: Each conversion is CPU-bound pure Python/NumPy work that shares
+    # nothing with the others, so worker processes scale with the core count
+    # where threads would serialize on the GIL. Small images aren't worth
+    # shipping to a worker: they are converted right here, in order, while
+    # the workers get on with the large ones (and if every image is small,
+    # no worker processes are started at all).
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+    executor = None
+    futures: Dict[int, Future] = {}
+    if workers > 1:
+        pooled = [index for index, (input_path, _) in enumerate(jobs) if not _is_small_image(input_path)]
+        if pooled:
+            import pixel_to_3mf.mesh_generator as mg
+            executor = ProcessPoolExecutor(
+                max_workers=min(workers, len(pooled)),
+                initializer=_init_batch_worker,
+                initargs=(mg.USE_OPTIMIZED_MESH_GENERATION, log_file)
             )
+            for index in pooled:
+                input_path, output_file_path = jobs[index]
+                futures[index] = executor.submit(_convert_one, str(input_path), str(output_file_path), config)
+    
+    try:
+        # Report each file in order (parallel ones finish in the background)
+        total = len(jobs)
+        for i, (input_path, output_file_path) in enumerate(jobs, start=1):
+            console.print(f"[cyan][{i}/{total}] Processing: {input_path.name}[/cyan]")
             
-            # Success!
-            # Store relative path for better reporting in recursive mode
-            if recurse:
-                output_display = str(output_file_path.relative_to(output_folder))
+            future = futures.get(i - 1)
+            if future is None:
+                status, outcome = _convert_one(str(input_path), str(output_file_path), config)
             else:
-                output_display = output_file_path.name
-                
-            results['success'].append({
-                'input_file': str(input_path.relative_to(input_folder)) if recurse else input_path.name,
-                'output_file': output_display,
-                'num_regions': stats['num_regions'],
-                'num_colors': stats['num_colors'],
-                'model_width_mm': stats['model_width_mm'],
-                'model_height_mm': stats['model_height_mm'],
-                'num_vertices': stats['num_vertices'],
-                'num_triangles': stats['num_triangles'],
-                'file_size': stats['file_size']
-            })
-            console.print(f"[green]   ✅ Success: {stats['num_regions']} regions, "
-                         f"{stats['num_triangles']:,} triangles, {stats['file_size']}[/green]")
-            
-        except ValueError as e:
-            error_msg = str(e)
+                try:
+                    status, outcome = future.result()
+                except Exception as e:
+                    # The worker itself died (e.g. out of memory)
+                    status, outcome = 'failed', str(e)
             
-            # Determine input file display name
+            # Store relative paths for better reporting in recursive mode
             input_display = str(input_path.relative_to(input_folder)) if recurse else input_path.name
             
-            # Check if this is a resolution warning
-            # The error message from the resolution check contains this specific text
-            if "resolution too high" in error_msg.lower():
-                results['skipped'].append({
+            if status == 'success':
+                # ('success', stats) - the other outcomes carry a message
+                stats = cast(Dict[str, Any], outcome)
+                if recurse:
+                    output_display = str(output_file_path.relative_to(output_folder))
+                else:
+                    output_display = output_file_path.name
+                    
+                # _convert_one() already trimmed the stats to the reported keys
+                succeeded.append({
                     'input_file': input_display,
-                    'reason': error_msg
+                    'output_file': output_display,
+                    **stats
+                })
+                console.print(f"[green]   ✅ Success: {stats['num_regions']} regions, "
+                             f"{stats['num_triangles']:,} triangles, {stats['file_size']}[/green]")
+            elif status == 'skipped':
+                skipped.append({
+                    'input_file': input_display,
+                    'reason': outcome
                 })
                 console.print(f"[yellow]   ⚠️  Skipped: Resolution warning[/yellow]")
             else:
-                # Other ValueError = actual failure (e.g., too many colors)
-                results['failed'].append({
+                failed.append({
                     'input_file': input_display,
-                    'error': error_msg
+                    'error': outcome
                 })
-                error_console.print(f"[red]   ❌ Failed: {error_msg}[/red]")
-                
-        except Exception as e:
-            # Any other error = failure
-            input_display = str(input_path.relative_to(input_folder)) if recurse else input_path.name
-            results['failed'].append({
-                'input_file': input_display,
-                'error': str(e)
-            })
-            error_console.print(f"[red]   ❌ Failed: {e}[/red]")
-        
-        console.print()
+                error_console.print(f"[red]   ❌ Failed: {outcome}[/red]")
+            
+            console.print()
+    finally:
+        if executor is not None:
+            # Drop conversions that haven't started, so an error or Ctrl-C
+            # here doesn't wait for the rest of the batch to run
+            executor.shutdown(cancel_futures=True)
     
     return results
 
@@ -355,6 +578,15 @@ The program will:
         help="Process subfolders recursively in batch mode, maintaining folder structure in output"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Number of worker processes for batch mode (default: one per CPU core). "
+             "Use 1 to convert every file in this process, one at a time."
+    )
+    
     # Optional arguments
     parser.add_argument(
         "-o", "--output",
@@ -634,25 +866,11 @@ The program will:
         check_batch_compatibility(args.check_batch)
         return  # Exit after batch check
     
-    # Configure logging
-    import logging
+    # Configure logging (overwrites the log file each run)
+    _configure_logging(args.log_file)
     if args.log_file:
-        # Log to file with DEBUG level when --log-file is specified
-        logging.basicConfig(
-            filename=args.log_file,
-            level=logging.DEBUG,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            filemode='w'  # Overwrite log file each run
-        )
         logging.info("Logging initialized")
         logging.info(f"Command: {' '.join(sys.argv)}")
-    else:
-        # When no log file specified, disable all logging output to console
-        # This prevents logger.warning() calls from breaking Rich output
-        logging.basicConfig(
-            level=logging.CRITICAL + 1,  # Higher than CRITICAL = effectively disabled
-            format='%(message)s'
-        )
     
     # Validate batch mode vs single-file mode
     if args.batch:
@@ -794,6 +1012,10 @@ The program will:
             console.print(f"[red]❌ Error: Input path is not a directory: {input_folder}[/red]")
             sys.exit(1)
         
+        if args.workers is not None and args.workers < 1:
+            console.print(f"[red]❌ Error: --workers must be at least 1, got {args.workers}[/red]")
+            sys.exit(1)
+        
         console.print(f"[cyan]📂 Input folder:  {input_folder}[/cyan]")
         console.print(f"[cyan]📂 Output folder: {output_folder}[/cyan]")
         console.print(f"[cyan]⚙️  Skip checks:   {args.skip_checks}[/cyan]")
@@ -802,7 +1024,10 @@ The program will:
         
         # Process the batch
         start_time = datetime.now()
-        results = process_batch(input_folder, output_folder, config, recurse=args.recurse)
+        results = process_batch(
+            input_folder, output_folder, config,
+            recurse=args.recurse, workers=args.workers, log_file=args.log_file
+        )
         end_time = datetime.now()
         
         # Generate summary
@@ -7,8 +7,10 @@ clean and makes it easy to add new parameters in the future without
 breaking the API.
 """
 
-import re
+import os
+import string
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Tuple, List, Union
 from pathlib import Path
 from .constants import (
@@ -38,10 +40,26 @@ from .constants import (
 )
 
 
+# Characters that make up title words - everything else separates them
+_TITLE_WORD_CHARS = frozenset(string.ascii_letters + string.digits)
+# Byte translation table for ASCII names: word characters map to
+# themselves, every other byte to a space
+_TITLE_SEPARATOR_TABLE = bytes(
+    byte if chr(byte) in _TITLE_WORD_CHARS else ord(' ') for byte in range(256)
+)
+# What Path treats as a directory separator on this platform
+_PATH_SEPARATORS = os.sep + (os.altsep or '')
+
+
+@lru_cache(maxsize=1024)
 def format_title_from_filename(filename: str) -> str:
     """
     Format a filename into a nice title for 3MF metadata.
     
+    The result depends only on the filename, so it is memoized - formatting
+    a name seen before is a dict lookup. Use
+    format_title_from_filename.cache_clear() to reset the cache.
+    
     Converts filenames like:
     - "gameboy-tetris-titlescreen.png" -> "Gameboy Tetris Titlescreen"
     - "nes-samus.png" -> "Nes Samus"
@@ -54,11 +72,11 @@ def format_title_from_filename(filename: str) -> str:
     
     Algorithm:
     1. Remove file extension (only the final .ext, so "image.backup.png" -> "image.backup")
-    2. Remove apostrophes (they're part of the word, not separators)
-    3. Replace ALL other non-alphanumeric characters (including dots) with single space
-    4. Collapse multiple spaces into one
-    5. Trim leading/trailing whitespace
-    6. Title case each word, preserving existing uppercase sequences
+    2. Letters and digits (ASCII) extend the current word
+    3. Apostrophes are dropped without ending the word ("Kirby's" -> "Kirbys")
+    4. ANY other character (space, -, _, ., &, ...) ends the word
+    5. Title case each word, preserving existing uppercase sequences
+    6. Join the words with single spaces (so no leading/trailing/double spaces)
     
     Args:
         filename: Original filename (with or without extension)
@@ -66,42 +84,67 @@ def format_title_from_filename(filename: str) -> str:
     Returns:
         Formatted title string (trimmed, single spaces between words)
     """
-    # Get the base filename without directory, then remove the final extension
-    # WHY: Path.stem removes only the last extension, so "image.backup.png" -> "image.backup"
-    # This is what we want! Then the dot becomes a space below.
-    name = Path(filename).stem
-    
-    # Remove apostrophes entirely (they're part of the word, not separators)
-    # WHY: "Kirby's" should become "Kirbys", not "Kirby S"
-    name = name.replace("'", "")
-    
-    # Replace ALL non-alphanumeric characters (including underscores, hyphens, dots, etc.)
-    # with a single space. [^a-zA-Z0-9] matches anything that's NOT a letter or number
-    # WHY: We want ALL separators (-, _, ., etc.) to become spaces
-    name = re.sub(r'[^a-zA-Z0-9]+', ' ', name)
-    
-    # Collapse multiple spaces into one (in case there were consecutive punctuation marks)
-    # This is redundant with the + in the regex above, but kept for clarity
-    name = re.sub(r'\s+', ' ', name)
-    
-    # Trim leading/trailing whitespace
-    name = name.strip()
+    name = _filename_stem(filename)
+    if name.isascii():
+        # WHY: The usual case. The byte table turns every separator into a
+        # space and deletes apostrophes in one C-level pass, and split()
+        # then drops the empty runs - no per-character Python loop at all.
+        words = name.encode('ascii').translate(_TITLE_SEPARATOR_TABLE, b"'").decode('ascii').split()
+    else:
+        words = _title_words(name)
     
     # Title case each word, but preserve existing uppercase sequences
-    # WHY: We want "nes" -> "Nes" but "NES" -> "NES", "c64" -> "C64" (already caps)
+    # WHY: We want "nes" -> "Nes" but "NES" -> "NES", "c64" -> "C64" (already caps).
+    # A word with any capital after its first letter is kept exactly as written
+    # ("screenShot"); otherwise only the first letter is raised.
+    return ' '.join(
+        word if word[1:] != word[1:].lower() else word[0].upper() + word[1:]
+        for word in words
+    )
+
+
+def _title_words(name: str) -> List[str]:
+    """
+    Split a name into title words in a single pass over its characters.
+    
+    ASCII letters and digits build up words, apostrophes are skipped and
+    anything else (including non-ASCII letters) separates words - the same
+    result as the byte-table path for ASCII names.
+    """
     words = []
-    for word in name.split():
-        # If word is all uppercase or has mixed case, keep it
-        # Otherwise, title case it
-        if word.isupper() or any(c.isupper() for c in word[1:]):
+    word = ''
+    for ch in name:
+        if ch in _TITLE_WORD_CHARS:
+            word += ch
+        elif ch == "'":
+            # Part of the word, not a separator
+            continue
+        elif word:
             words.append(word)
-        else:
-            words.append(word.capitalize())
+            word = ''
+    if word:
+        words.append(word)
+    return words
+
+
+def _filename_stem(filename: str) -> str:
+    """
+    Same as Path(filename).stem, from plain string operations.
     
-    return ' '.join(words)
+    The directory part is dropped, then the final extension: only a dot
+    that isn't the first or last character of the name starts one, so
+    ".gitignore" keeps its whole name and "image.backup.png" becomes
+    "image.backup".
+    """
+    name = os.path.basename(filename.rstrip(_PATH_SEPARATORS))
+    if name == '.':
+        # "folder/." - Path drops the "." part, so let it work out the name
+        name = Path(filename).name
+    dot = name.rfind('.')
+    return name[:dot] if 0 < dot < len(name) - 1 else name
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionConfig:
     """
     Configuration for pixel art to 3MF conversion.
@@ -110,6 +153,13 @@ class ConversionConfig:
     By using a config object instead of individual parameters, we make the API
     more maintainable and easier to extend in the future.
 
+    WHY slots: Instances store their fields in fixed slots instead of a
+    per-instance __dict__, so each config is smaller and quicker to build
+    (batch mode makes one per image), and a misspelled attribute assignment
+    raises AttributeError instead of silently adding a new attribute. It is
+    not frozen - __post_init__ fills in defaults and the converter records
+    the source image on the config.
+
     Attributes:
         max_size_mm: Maximum dimension (width or height) in millimeters
         line_width_mm: Nozzle line width for printability check
@@ -9,7 +9,8 @@ This module handles:
 """
 
 from PIL import Image
-from typing import Tuple, Dict, Set, TYPE_CHECKING
+from itertools import chain
+from typing import Tuple, Dict, Optional, Set, TYPE_CHECKING
 import numpy as np
 from .constants import MAX_MODEL_SIZE_MM
 from .padding_processor import add_padding, should_apply_padding
@@ -26,6 +27,15 @@ class PixelData:
     This is basically our "parsed image" - it holds all the info we need
     to generate the 3D model without having to pass around a million separate
     variables. Think of it as the blueprint! 📐
+    
+    The pixels are available two ways: `pixels`, a dict of (x, y) -> RGBA
+    for the region/mesh code, and `colors` + `mask`, dense NumPy arrays for
+    vectorized work. Whichever one the data wasn't built from is computed on
+    first access and cached; once the dict exists it is the one that counts.
+    
+    WHY: The dict costs ~240 bytes per pixel and building it is a Python
+    loop over the whole image. load_image() builds the arrays straight from
+    the decoded image and only pays for the dict if something asks for it.
     """
     
     def __init__(
@@ -33,7 +43,8 @@ class PixelData:
         width: int,
         height: int,
         pixel_size_mm: float,
-        pixels: Dict[Tuple[int, int], Tuple[int, int, int, int]]
+        pixels: Optional[Dict[Tuple[int, int], Tuple[int, int, int, int]]] = None,
+        colors: Optional[np.ndarray] = None
     ):
         """
         Initialize pixel data.
@@ -44,16 +55,118 @@ class PixelData:
             pixel_size_mm: Size of each pixel in millimeters (already rounded)
             pixels: Dict mapping (x, y) coords to RGBA tuples
                    Only non-transparent pixels are included!
+            colors: Alternatively, a (height, width, 4) uint8 RGBA array
+                   indexed [y, x] in model coordinates (y=0 is the bottom
+                   row). Pixels with alpha 0 are transparent.
         """
+        if pixels is None and colors is None:
+            raise ValueError("PixelData needs pixels or colors")
         self.width = width
         self.height = height
         self.pixel_size_mm = pixel_size_mm
-        self.pixels = pixels
+        self._pixels = pixels
+        self._colors = colors
         
         # Calculate actual model dimensions
         self.model_width_mm = width * pixel_size_mm
         self.model_height_mm = height * pixel_size_mm
     
+    @property
+    def pixels(self) -> Dict[Tuple[int, int], Tuple[int, int, int, int]]:
+        """
+        Dict mapping (x, y) coords to RGBA tuples (non-transparent only).
+        
+        Once built, the dict is the source of truth: the colors array is
+        dropped and rebuilt from it on demand.
+        
+        WHY: Callers may edit the dict in place (del pixels[xy]). If the
+        array stayed authoritative those edits would be invisible to colors,
+        mask and every array path, and the backing plate would cover pixels
+        no region holds.
+        """
+        if self._pixels is None:
+            coords, rgba = self._pixel_arrays()
+            self._pixels = dict(zip(zip(*coords.T.tolist()), zip(*rgba.T.tolist())))
+            self._colors = None
+        return self._pixels
+    
+    @pixels.setter
+    def pixels(self, pixels: Dict[Tuple[int, int], Tuple[int, int, int, int]]) -> None:
+        self._pixels = pixels
+        self._colors = None
+    
+    @property
+    def colors(self) -> np.ndarray:
+        """(height, width, 4) uint8 RGBA array indexed [y, x]; alpha 0 where empty."""
+        if self._colors is None:
+            colors = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+            if self._pixels:
+                count = len(self._pixels)
+                coords = np.fromiter(chain.from_iterable(self._pixels), dtype=np.intp, count=2 * count)
+                rgba = np.fromiter(chain.from_iterable(self._pixels.values()), dtype=np.uint8, count=4 * count)
+                coords = coords.reshape(count, 2)
+                colors[coords[:, 1], coords[:, 0]] = rgba.reshape(count, 4)
+            self._colors = colors
+        return self._colors
+    
+    @property
+    def mask(self) -> np.ndarray:
+        """(height, width) bool array, True where a non-transparent pixel exists."""
+        return self.colors[:, :, 3] > 0
+    
+    @property
+    def is_array_backed(self) -> bool:
+        """True while the colors array is the source of truth (the pixels dict hasn't been built)."""
+        return self._pixels is None
+    
+    @property
+    def pixel_count(self) -> int:
+        """Number of non-transparent pixels, without building the pixels dict."""
+        if self._pixels is None:
+            colors = self._colors
+            assert colors is not None
+            return int(np.count_nonzero(colors[:, :, 3]))
+        return len(self._pixels)
+    
+    def _coords(self) -> np.ndarray:
+        """
+        (N, 2) intp array of x, y for the non-transparent pixels.
+        
+        Array-backed data answers from the alpha channel (image row order)
+        without building the pixels dict; otherwise this is dict order.
+        """
+        if self._pixels is None:
+            colors = self._colors
+            assert colors is not None
+            ys, xs = np.nonzero(colors[:, :, 3])
+            return np.column_stack((xs, ys))
+        count = len(self._pixels)
+        return np.fromiter(chain.from_iterable(self._pixels), dtype=np.intp, count=2 * count).reshape(count, 2)
+    
+    def _pixel_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Coordinates and colors of the non-transparent pixels, in pixels dict order.
+        
+        Array-backed data answers from the colors array without building the
+        pixels dict, so callers can stay on uint8 RGBA throughout.
+        
+        Returns:
+            Tuple of ((N, 2) intp x, y array, (N, 4) uint8 RGBA array)
+        """
+        if self._pixels is None:
+            colors = self._colors
+            assert colors is not None
+            # Same order the per-pixel extraction used: image rows top to
+            # bottom (model y descending), x ascending within a row
+            flipped = colors[::-1]
+            image_ys, xs = np.nonzero(flipped[:, :, 3])
+            coords = np.column_stack((xs, self.height - 1 - image_ys))
+            return coords, flipped[image_ys, xs]
+        count = len(self._pixels)
+        coords = np.fromiter(chain.from_iterable(self._pixels), dtype=np.intp, count=2 * count)
+        rgba = np.fromiter(chain.from_iterable(self._pixels.values()), dtype=np.uint8, count=4 * count)
+        return coords.reshape(count, 2), rgba.reshape(count, 4)
+    
     def get_unique_colors(self) -> Set[Tuple[int, int, int]]:
         """
         Get set of unique RGB colors (excluding alpha).
@@ -61,17 +174,39 @@ class PixelData:
         Returns:
             Set of (R, G, B) tuples
         """
-        return {(r, g, b) for r, g, b, a in self.pixels.values()}
+        if self._pixels is None:
+            colors = self._colors
+            assert colors is not None
+            return _unique_rgb(colors)
+        return {(r, g, b) for r, g, b, a in self._pixels.values()}
     
     def __repr__(self) -> str:
+        count = self.pixel_count
         return (
             f"PixelData({self.width}x{self.height}px, "
             f"{self.model_width_mm:.1f}x{self.model_height_mm:.1f}mm, "
-            f"{len(self.pixels)} non-transparent pixels, "
+            f"{count} non-transparent pixels, "
             f"{len(self.get_unique_colors())} unique colors)"
         )
 
 
+def _unique_rgb(colors: np.ndarray) -> Set[Tuple[int, int, int]]:
+    """
+    Get the set of RGB colors of the non-transparent pixels in an RGBA array.
+    
+    Args:
+        colors: (..., 4) uint8 RGBA array
+    
+    Returns:
+        Set of (R, G, B) tuples
+    """
+    opaque = colors[colors[..., 3] > 0]
+    packed = np.unique(
+        (opaque[:, 0].astype(np.uint32) << 16) | (opaque[:, 1].astype(np.uint32) << 8) | opaque[:, 2]
+    ).tolist()
+    return {(c >> 16, (c >> 8) & 0xFF, c & 0xFF) for c in packed}
+
+
 def calculate_pixel_size(
     image_width: int,
     image_height: int,
@@ -290,28 +425,16 @@ def load_image(
     
     # STEP 3: Extract pixel data as numpy array for fast processing
     # Shape will be (height, width, 4) where 4 = RGBA
-    pixel_array = np.array(img)
-    
-    # Build dictionary of non-transparent pixels
-    # We only care about pixels with non-zero alpha!
-    pixels: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}
-    
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixel_array[y, x]
-            
-            # Skip transparent pixels (alpha == 0)
-            # These will become holes in the model
-            if a > 0:
-                # CRITICAL FIX: Flip Y coordinate!
-                # Image coordinates: Y=0 is TOP, increases DOWNWARD
-                # 3D coordinates: Y=0 is BOTTOM, increases UPWARD
-                # So we need to flip: image_y=0 → 3d_y=(height-1)
-                flipped_y = height - 1 - y
-                pixels[(x, flipped_y)] = (int(r), int(g), int(b), int(a))
+    # Pixels with alpha == 0 are transparent - these will become holes in the model
+    #
+    # CRITICAL FIX: Flip Y coordinate!
+    # Image coordinates: Y=0 is TOP, increases DOWNWARD
+    # 3D coordinates: Y=0 is BOTTOM, increases UPWARD
+    # So we flip the rows: image_y=0 → 3d_y=(height-1)
+    colors = np.array(img)[::-1]
     
     # Check color count with backing color reservation
-    unique_colors = {(r, g, b) for r, g, b, a in pixels.values()}
+    unique_colors = _unique_rgb(colors)
     num_colors = len(unique_colors)
 
     # Check if we need to reserve a color slot for the backing plate
@@ -336,20 +459,11 @@ def load_image(
             # Perform quantization
             img = quantize_image(img, target_colors, config.quantize_algo)
             
-            # Re-extract pixel data from quantized image
-            pixel_array = np.array(img)
-            pixels = {}
-            
-            for y in range(height):
-                for x in range(width):
-                    r, g, b, a = pixel_array[y, x]
-                    
-                    if a > 0:
-                        flipped_y = height - 1 - y
-                        pixels[(x, flipped_y)] = (int(r), int(g), int(b), int(a))
+            # Re-extract pixel data from quantized image (Y flipped as above)
+            colors = np.array(img)[::-1]
             
             # Recalculate color count after quantization
-            unique_colors = {(r, g, b) for r, g, b, a in pixels.values()}
+            unique_colors = _unique_rgb(colors)
             num_colors = len(unique_colors)
             
             # Check again if we're within limits now
@@ -407,7 +521,7 @@ def load_image(
         width=width,
         height=height,
         pixel_size_mm=pixel_size_mm,
-        pixels=pixels
+        colors=colors
     )
 
 
@@ -10,9 +10,11 @@ indices each). This is the universal format for 3D meshes - STL, OBJ,
 3MF all use this approach! 🎲
 """
 
+import numpy as np
 from typing import List, Tuple, Set, Dict, TYPE_CHECKING
 from .region_merger import Region
 from .image_processor import PixelData
+from .threemf_core import MeshArrayCache
 
 # Import for type checking only (avoids circular imports)
 if TYPE_CHECKING:
@@ -38,7 +40,7 @@ except ImportError:
     OPTIMIZATION_AVAILABLE = False
 
 
-class Mesh:
+class Mesh(MeshArrayCache):
     """
     A 3D mesh defined by vertices and triangles.
     
@@ -65,6 +67,29 @@ class Mesh:
         self.vertices = vertices
         self.triangles = triangles
     
+    @classmethod
+    def from_arrays(cls, vertex_array: np.ndarray, triangle_array: np.ndarray) -> 'Mesh':
+        """
+        Build a mesh from vertex and triangle arrays.
+        
+        The arrays become the cached vertices_np / triangles_np, so generators
+        that already work in NumPy don't pay for a second conversion.
+        
+        Args:
+            vertex_array: (N, 3) float array of (x, y, z) coordinates in millimeters
+            triangle_array: (M, 3) integer array of vertex indices
+        
+        Returns:
+            A Mesh whose vertex and triangle lists hold the same values as tuples
+        """
+        # Column-wise zip builds the tuples faster than tuple() per row
+        mesh = cls(
+            vertices=list(zip(*vertex_array.T.tolist())),
+            triangles=list(zip(*triangle_array.T.tolist()))
+        )
+        mesh._seed_array_cache(vertex_array, triangle_array)
+        return mesh
+    
     def __repr__(self) -> str:
         return f"Mesh(vertices={len(self.vertices)}, triangles={len(self.triangles)})"
 
@@ -305,7 +330,9 @@ def _generate_backing_plate_original(
     Original per-pixel backing plate generation implementation.
     
     This is the fallback implementation that always works reliably.
-    It generates the backing plate by creating geometry for each pixel individually.
+    It generates the backing plate by creating geometry for each pixel
+    individually: a top and bottom quad per pixel sharing deduplicated
+    corner vertices, plus wall quads on every exposed edge.
 
     Args:
         pixel_data: Pixel data (includes which pixels are non-transparent)
@@ -314,125 +341,105 @@ def _generate_backing_plate_original(
     Returns:
         A Mesh object for the backing plate
     """
-    # Original per-pixel mesh generation
-    vertices: List[Tuple[float, float, float]] = []
-    triangles: List[Tuple[int, int, int]] = []
-
-    ps = pixel_data.pixel_size_mm
-
-    # Similar to region generation, but simpler - we create a slab for each pixel
-    # Top face (z = 0) and bottom face (z = -config.base_height_mm)
-    
-    top_vertex_map: Dict[Tuple[int, int], int] = {}
-    bottom_vertex_map: Dict[Tuple[int, int], int] = {}
-    
-    # Get all non-transparent pixel positions
-    pixel_positions = set(pixel_data.pixels.keys())
-    
-    # Generate top and bottom faces
-    for x, y in pixel_positions:
-        # Top face vertices (z = 0)
-        top_corners = [
-            (x, y, "bl"),
-            (x+1, y, "br"),
-            (x, y+1, "tl"),
-            (x+1, y+1, "tr"),
-        ]
-        
-        top_indices = []
-        for cx, cy, label in top_corners:
-            # KEY FIX: Remove label from key!
-            key = (cx, cy)
-            if key not in top_vertex_map:
-                top_vertex_map[key] = len(vertices)
-                vertices.append((cx * ps, cy * ps, 0.0))
-            top_indices.append(top_vertex_map[key])
-        
-        # Top face triangles (facing up)
-        bl, br, tl, tr = top_indices
-        triangles.append((bl, br, tl))
-        triangles.append((br, tr, tl))
-        
-        # Bottom face vertices (z = -config.base_height_mm)
-        bottom_corners = [
-            (x, y, "bl"),
-            (x+1, y, "br"),
-            (x, y+1, "tl"),
-            (x+1, y+1, "tr"),
-        ]
-
-        bottom_indices = []
-        for cx, cy, label in bottom_corners:
-            # KEY FIX: Remove label from key!
-            key = (cx, cy)
-            if key not in bottom_vertex_map:
-                bottom_vertex_map[key] = len(vertices)
-                vertices.append((cx * ps, cy * ps, -config.base_height_mm))
-            bottom_indices.append(bottom_vertex_map[key])
-        
-        # Bottom face triangles (facing down - reversed winding)
-        bl, br, tl, tr = bottom_indices
-        triangles.append((bl, tl, br))
-        triangles.append((br, tl, tr))
-    
-    # Generate perimeter walls (only where edges are exposed)
-    for x, y in pixel_positions:
-        # Check each of the 4 edges
-        edges = [
-            ((x, y), (x+1, y), (x, y-1), "bottom"),      # Bottom edge, neighbor below
-            ((x+1, y), (x+1, y+1), (x+1, y), "right"),   # Right edge, neighbor right
-            ((x+1, y+1), (x, y+1), (x, y+1), "top"),     # Top edge, neighbor above
-            ((x, y+1), (x, y), (x-1, y), "left"),        # Left edge, neighbor left
-        ]
-        
-        for (x1, y1), (x2, y2), neighbor, edge_name in edges:
-            # If neighbor pixel exists, skip this edge (it's internal)
-            if neighbor in pixel_positions:
-                continue
-            
-            # Create wall quad
-            # CRITICAL FIX: Reuse vertices from top/bottom maps to avoid duplicates!
-            
-            # Now that keys are just (x, y), lookup is simple!
-            bl_key = (x1, y1)
-            br_key = (x2, y2)
-            tl_key = (x1, y1)
-            tr_key = (x2, y2)
-            
-            # Get the vertex indices from our maps
-            assert bl_key in bottom_vertex_map, f"Could not find bottom vertex for backing plate wall at {bl_key}"
-            assert br_key in bottom_vertex_map, f"Could not find bottom vertex for backing plate wall at {br_key}"
-            assert tl_key in top_vertex_map, f"Could not find top vertex for backing plate wall at {tl_key}"
-            assert tr_key in top_vertex_map, f"Could not find top vertex for backing plate wall at {tr_key}"
-            
-            idx_bl = bottom_vertex_map[bl_key]
-            idx_br = bottom_vertex_map[br_key]
-            idx_tl = top_vertex_map[tl_key]
-            idx_tr = top_vertex_map[tr_key]
-            
-            # Wall triangles (REVERSED winding for outward-facing normals)
-            triangles.append((idx_bl, idx_br, idx_tl))
-            triangles.append((idx_br, idx_tr, idx_tl))
-    
-    return Mesh(vertices=vertices, triangles=triangles)
+    return _backing_plate_from_coords(pixel_data._coords(), pixel_data.pixel_size_mm, config)
 
 
-def _is_simple_rectangle(pixel_data: PixelData) -> bool:
+def _backing_plate_from_coords(
+    coords: np.ndarray,
+    pixel_size_mm: float,
+    config: 'ConversionConfig'
+) -> Mesh:
     """
-    Check if all pixels form a complete rectangle (no transparency).
+    Per-pixel backing plate for a footprint given as pixel coordinates.
     
-    This is perfect for full-frame images like screenshots or large pixel art.
-    A simple rectangle allows us to use a much more efficient backing plate.
+    This is the body of _generate_backing_plate_original(); callers that
+    already know the footprint can mesh it without wrapping it in a PixelData.
     
     Args:
-        pixel_data: The pixel data to check
+        coords: (N, 2) integer array of (x, y) pixels
+        pixel_size_mm: Size of each pixel in millimeters
+        config: ConversionConfig object with base height and other parameters
     
     Returns:
-        True if the image is a complete rectangle with no transparent pixels
+        A Mesh object for the backing plate
     """
-    total_expected = pixel_data.width * pixel_data.height
-    total_actual = len(pixel_data.pixels)
-    return total_expected == total_actual
+    if not len(coords):
+        return Mesh(vertices=[], triangles=[])
+    
+    ps = pixel_size_mm
+    
+    # Rasterize the footprint (padded by one pixel so every neighbor lookup
+    # stays in bounds) - mask[y, x] is True where a pixel exists
+    # WHY: Same slab-per-pixel geometry as before, but corner dedup and the
+    # exposed-edge tests are whole-array operations instead of a Python dict
+    # lookup per corner and a set lookup per edge.
+    low = coords.min(axis=0) - 1
+    xs = coords[:, 0] - low[0]
+    ys = coords[:, 1] - low[1]
+    mask = np.zeros((ys.max() + 2, xs.max() + 2), dtype=bool)
+    mask[ys, xs] = True
+    
+    # A corner (cx, cy) is used if any of the 4 pixels touching it exists
+    # (pixels cx-1..cx, cy-1..cy); number the used corners row by row
+    corners = np.zeros((mask.shape[0] + 1, mask.shape[1] + 1), dtype=bool)
+    corners[1:, 1:] |= mask
+    corners[1:, :-1] |= mask
+    corners[:-1, 1:] |= mask
+    corners[:-1, :-1] |= mask
+    corner_ys, corner_xs = np.nonzero(corners)
+    num_corners = len(corner_xs)
+    top_index = np.zeros(corners.shape, dtype=np.intp)
+    top_index[corner_ys, corner_xs] = np.arange(num_corners)
+    
+    # Top vertices (z = 0) first, then the same corners at the bottom
+    corner_mm = np.column_stack((corner_xs + low[0], corner_ys + low[1])) * ps
+    vertex_array = np.empty((2 * num_corners, 3), dtype=np.float64)
+    vertex_array[:num_corners, :2] = corner_mm
+    vertex_array[:num_corners, 2] = 0.0
+    vertex_array[num_corners:, :2] = corner_mm
+    vertex_array[num_corners:, 2] = -config.base_height_mm
+    
+    # Top face (facing up) and bottom face (reversed winding), per pixel
+    py, px = np.nonzero(mask)
+    bl = top_index[py, px]
+    br = top_index[py, px + 1]
+    tl = top_index[py + 1, px]
+    tr = top_index[py + 1, px + 1]
+    b = num_corners
+    faces = np.stack([
+        np.column_stack((bl, br, tl)),
+        np.column_stack((br, tr, tl)),
+        np.column_stack((bl + b, tl + b, br + b)),
+        np.column_stack((br + b, tl + b, tr + b)),
+    ], axis=1).reshape(-1, 3)
+    
+    # Perimeter walls - only where the neighbor across an edge is missing.
+    # Each edge runs corner offset (x1, y1) -> (x2, y2) with outward winding.
+    # Exposed edges come from comparing the mask with a shifted copy of
+    # itself (the border padding keeps the shifted slice in bounds), which
+    # streams through the raster instead of gathering one neighbor per pixel.
+    height, width = mask.shape
+    inner = mask[1:-1, 1:-1]
+    walls = []
+    for (dx, dy), (x1, y1), (x2, y2) in (
+        ((0, -1), (0, 0), (1, 0)),   # Bottom edge, neighbor below
+        ((1, 0), (1, 0), (1, 1)),    # Right edge, neighbor right
+        ((0, 1), (1, 1), (0, 1)),    # Top edge, neighbor above
+        ((-1, 0), (0, 1), (0, 0)),   # Left edge, neighbor left
+    ):
+        neighbor = mask[1 + dy:height - 1 + dy, 1 + dx:width - 1 + dx]
+        ey, ex = np.nonzero(inner & ~neighbor)
+        ex += 1
+        ey += 1
+        idx_1 = top_index[ey + y1, ex + x1]
+        idx_2 = top_index[ey + y2, ex + x2]
+        walls.append(np.stack([
+            np.column_stack((idx_1 + b, idx_2 + b, idx_1)),
+            np.column_stack((idx_2 + b, idx_2, idx_1)),
+        ], axis=1).reshape(-1, 3))
+    triangle_array = np.concatenate([faces] + walls)
+    
+    return Mesh.from_arrays(vertex_array, triangle_array)
 
 
 def _create_simple_rectangle_backing_plate(pixel_data: PixelData, base_height_mm: float) -> Mesh:
@@ -564,14 +571,51 @@ def generate_backing_plate(
     Returns:
         A Mesh object for the backing plate
     """
-    # Fast path: check if it's just a simple rectangle
-    if _is_simple_rectangle(pixel_data):
-        return _create_simple_rectangle_backing_plate(pixel_data, config.base_height_mm)
+    return generate_backing_plate_from_mask(pixel_data.mask, pixel_data.pixel_size_mm, config)
+
+
+def generate_backing_plate_from_mask(
+    mask: np.ndarray,
+    pixel_size_mm: float,
+    config: 'ConversionConfig'
+) -> Mesh:
+    """
+    Generate the backing plate for a footprint given as a boolean raster.
+    
+    This is the dispatch behind generate_backing_plate(). Callers that
+    already know which pixels the plate must cover (for example, the pixels
+    the final regions hold) can pass that footprint directly instead of
+    building a filtered PixelData first.
+    
+    Args:
+        mask: (height, width) bool array indexed [y, x] in model coordinates,
+              True where the backing plate goes
+        pixel_size_mm: Size of each pixel in millimeters
+        config: ConversionConfig object with base height and other parameters
+    
+    Returns:
+        A Mesh object for the backing plate
+    """
+    # Fast path: a full frame (no transparency) is one box
+    if mask.all():
+        return _create_simple_rectangle_backing_plate(
+            _footprint_pixel_data(mask, pixel_size_mm), config.base_height_mm
+        )
     
     # Complex path: use the current union approach for sprites with holes
     # Dispatch to optimized version if enabled and available
     if USE_OPTIMIZED_MESH_GENERATION and OPTIMIZATION_AVAILABLE:
-        return generate_backing_plate_optimized(pixel_data, config)
+        return generate_backing_plate_optimized(_footprint_pixel_data(mask, pixel_size_mm), config)
     
     # Use original implementation
-    return _generate_backing_plate_original(pixel_data, config)
+    ys, xs = np.nonzero(mask)
+    return _backing_plate_from_coords(np.column_stack((xs, ys)), pixel_size_mm, config)
+
+
+def _footprint_pixel_data(mask: np.ndarray, pixel_size_mm: float) -> PixelData:
+    """PixelData with an opaque pixel wherever mask is True (the optimizers want one)."""
+    height, width = mask.shape
+    colors = np.zeros((height, width, 4), dtype=np.uint8)
+    colors[:, :, 3] = mask
+    colors[:, :, 3] *= 255
+    return PixelData(width=width, height=height, pixel_size_mm=pixel_size_mm, colors=colors)
@@ -12,18 +12,62 @@ import math
 import os
 import logging
 
-from typing import Optional, Callable, Dict, Any, List, Set, Tuple
+from itertools import chain, compress
+from typing import Iterable, Optional, Callable, Dict, Any, List, Set, Tuple
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 from .image_processor import load_image, PixelData
-from .region_merger import merge_regions, trim_disconnected_pixels, Region
-from .mesh_generator import generate_region_mesh, generate_backing_plate
+from .region_merger import merge_regions, trim_disconnected_pixels, Region, RegionList
+from .mesh_generator import (
+    Mesh,
+    generate_region_mesh,
+    generate_backing_plate_from_mask
+)
 from .threemf_writer import write_3mf
 from .config import ConversionConfig
 from .constants import COORDINATE_PRECISION
 
+def _pixel_coords_array(coords: Iterable[Tuple[int, int]]) -> np.ndarray:
+    """
+    Pack (x, y) pixel coordinates into an (N, 2) integer array.
+    
+    Args:
+        coords: Sized iterable of (x, y) tuples (set, dict keys, list)
+    
+    Returns:
+        Array with one (x, y) row per coordinate, in iteration order
+    """
+    count = len(coords)  # type: ignore[arg-type]
+    flat = np.fromiter(chain.from_iterable(coords), dtype=np.intp, count=2 * count)
+    return flat.reshape(count, 2)
+
+
+def _region_raster(included: np.ndarray, height: int, width: int) -> np.ndarray:
+    """
+    Mark region pixels in a (height, width) bool raster.
+    
+    Args:
+        included: (N, 2) array of (x, y) region pixels; out-of-bounds ones are dropped
+        height: Raster height in pixels
+        width: Raster width in pixels
+    
+    Returns:
+        Raster that is True at every in-bounds region pixel
+    """
+    in_bounds = (
+        (included[:, 0] >= 0) & (included[:, 0] < width) &
+        (included[:, 1] >= 0) & (included[:, 1] < height)
+    )
+    included = included[in_bounds]
+    raster = np.zeros((height, width), dtype=bool)
+    raster[included[:, 1], included[:, 0]] = True
+    return raster
+
+
 def _create_filtered_pixel_data(regions: List[Region], original_pixel_data: PixelData) -> PixelData:
     """
     Create a PixelData object filtered to only include pixels from the given regions.
@@ -43,17 +87,67 @@ def _create_filtered_pixel_data(regions: List[Region], original_pixel_data: Pixe
     Returns:
         New PixelData with only pixels that exist in the provided regions
     """
-    # Collect all pixel coordinates from all regions
-    included_pixels: Set[Tuple[int, int]] = set()
-    for region in regions:
-        included_pixels.update(region.pixels)
-    
-    # Filter original pixels to only those in regions
-    filtered_pixels = {
-        coord: rgba
-        for coord, rgba in original_pixel_data.pixels.items()
-        if coord in included_pixels
-    }
+    if isinstance(regions, RegionList) and regions.covers_all_of(original_pixel_data):
+        # Untouched merge_regions() output covers every pixel - nothing to filter
+        return PixelData(
+            width=original_pixel_data.width,
+            height=original_pixel_data.height,
+            pixel_size_mm=original_pixel_data.pixel_size_mm,
+            pixels=None if original_pixel_data.is_array_backed else dict(original_pixel_data.pixels),
+            colors=original_pixel_data.colors if original_pixel_data.is_array_backed else None
+        )
+    
+    included = np.concatenate(
+        [region.coords for region in regions] or [np.empty((0, 2), dtype=np.int32)]
+    )
+    
+    if original_pixel_data.is_array_backed:
+        # Array-backed input (from load_image): clear every pixel that no
+        # region covers and hand the array on. The backing plate reads the
+        # array directly, so the filtered dict is never built.
+        # WHY: With the footprint test and the mesh build both vectorized,
+        # building and re-reading a dict of every pixel was the remaining
+        # per-pixel Python work between them.
+        colors = original_pixel_data.colors
+        keep = _region_raster(included, *colors.shape[:2])
+        
+        # Copy whole RGBA pixels as uint32 words - one select per pixel
+        # instead of one per channel plus a dtype round trip
+        if colors.strides[-2:] != (4, 1):
+            colors = np.ascontiguousarray(colors)
+        words = colors.view(np.uint32)[:, :, 0]
+        filtered = np.where(keep, words, np.uint32(0)).view(np.uint8).reshape(colors.shape)
+        return PixelData(
+            width=original_pixel_data.width,
+            height=original_pixel_data.height,
+            pixel_size_mm=original_pixel_data.pixel_size_mm,
+            colors=filtered
+        )
+    
+    original_pixels = original_pixel_data.pixels
+    if not original_pixels or not len(included):
+        filtered_pixels: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}
+    else:
+        # Mark every region pixel in a boolean raster, then test all original
+        # pixels against it in one vectorized lookup
+        # WHY: Avoids building a set of every region coordinate and hashing
+        # each original (x, y) tuple against it - for large images those
+        # tuple hashes dominate.
+        original = _pixel_coords_array(original_pixels)
+        
+        # Size the raster to cover both coordinate sets
+        low = np.minimum(included.min(axis=0), original.min(axis=0))
+        high = np.maximum(included.max(axis=0), original.max(axis=0))
+        mask = np.zeros((high[1] - low[1] + 1, high[0] - low[0] + 1), dtype=bool)
+        mask[included[:, 1] - low[1], included[:, 0] - low[0]] = True
+        keep = mask[original[:, 1] - low[1], original[:, 0] - low[0]]
+        
+        # Filter original pixels to only those in regions (order preserved)
+        if keep.all():
+            # Nothing was filtered out (the usual case) - plain copy
+            filtered_pixels = dict(original_pixels)
+        else:
+            filtered_pixels = dict(compress(original_pixels.items(), keep.tolist()))
     
     # Create new PixelData with filtered pixels
     # Width, height, and pixel_size_mm remain the same
@@ -65,6 +159,40 @@ def _create_filtered_pixel_data(regions: List[Region], original_pixel_data: Pixe
     )
 
 
+def _generate_backing_plate_from_regions(
+    regions: List[Region],
+    original_pixel_data: PixelData,
+    config: ConversionConfig
+) -> Mesh:
+    """
+    Generate the backing plate under exactly the pixels the regions cover.
+    
+    Gives the same mesh as
+    generate_backing_plate(_create_filtered_pixel_data(regions, original_pixel_data), config).
+    
+    WHY: The backing plate only needs the footprint. The region pixels are
+    marked in a boolean raster and handed to generate_backing_plate_from_mask(),
+    so no filtered copy of the image is built just to read its alpha
+    channel back.
+    
+    Args:
+        regions: List of Region objects that will be included in the final model
+        original_pixel_data: Original PixelData with all pixels
+        config: ConversionConfig object with base height and other parameters
+    
+    Returns:
+        A Mesh object for the backing plate
+    """
+    footprint = original_pixel_data.mask
+    if not (isinstance(regions, RegionList) and regions.covers_all_of(original_pixel_data)):
+        included = np.concatenate(
+            [region.coords for region in regions] or [np.empty((0, 2), dtype=np.int32)]
+        )
+        footprint &= _region_raster(included, original_pixel_data.height, original_pixel_data.width)
+    
+    return generate_backing_plate_from_mask(footprint, original_pixel_data.pixel_size_mm, config)
+
+
 def format_filesize(size_bytes: int) -> str:
     """
     Convert a file size in bytes to a human-readable format.
@@ -258,11 +386,10 @@ def convert_image_to_3mf(
     # Generate backing plate (if base_height > 0)
     if config.base_height_mm > 0:
         _progress("mesh", "Generating backing plate...")
-        # CRITICAL FIX: Filter pixel_data to only include pixels from regions
+        # CRITICAL FIX: Only put backing plate under pixels from regions
         # This ensures backing plate matches the colored regions exactly,
         # even if some pixels were filtered out during region merging/optimization
-        filtered_pixel_data = _create_filtered_pixel_data(regions, pixel_data)
-        backing_mesh = generate_backing_plate(filtered_pixel_data, config)
+        backing_mesh = _generate_backing_plate_from_regions(regions, pixel_data, config)
         meshes.append((backing_mesh, "backing_plate"))
     else:
         _progress("mesh", "Skipping backing plate (base height is 0)")
@@ -398,7 +525,7 @@ def convert_image_to_3mf(
         'pixel_size_mm': pixel_data.pixel_size_mm,
         'model_width_mm': pixel_data.model_width_mm,
         'model_height_mm': pixel_data.model_height_mm,
-        'num_pixels': len(pixel_data.pixels),
+        'num_pixels': pixel_data.pixel_count,
         'num_colors': len(color_mapping),  # Count unique color names after mapping (not RGB values)
         'num_regions': len(regions),
         'num_vertices': total_vertices,
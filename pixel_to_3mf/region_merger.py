@@ -11,9 +11,19 @@ the connected areas of the same color! 🎨
 """
 
 from collections import deque
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING
+from itertools import chain
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+import numpy as np
 from .image_processor import PixelData
 
+# Optional: C connected-component labeling for merge_regions
+try:
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 # Import for type checking only (avoids circular imports)
 if TYPE_CHECKING:
     from .config import ConversionConfig
@@ -26,21 +36,112 @@ class Region:
     This represents one "blob" of color that will become a single mesh object.
     For example, if you have a red heart shape, all those connected red pixels
     form one Region, even if it's a complex shape!
+    
+    The pixels are available two ways: `pixels`, a set of (x, y) tuples for
+    membership tests and neighbor walks, and `coords`, an (N, 2) int32 array
+    for vectorized work. Whichever one the region wasn't built from is
+    computed on first access and cached.
+    
+    WHY: A set of tuples costs ~200 bytes per pixel and hashing per access.
+    Array-based code (backing plate filtering, bounds) shouldn't have to
+    build it, and code that needs the set shouldn't pay for the array.
     """
     
-    def __init__(self, color: Tuple[int, int, int], pixels: Set[Tuple[int, int]]):
+    def __init__(
+        self,
+        color: Tuple[int, int, int],
+        pixels: Optional[Set[Tuple[int, int]]] = None,
+        coords: Optional[np.ndarray] = None
+    ):
         """
         Initialize a region.
         
         Args:
             color: RGB color tuple (r, g, b)
             pixels: Set of (x, y) coordinates that make up this region
+            coords: Alternatively, an (N, 2) array of x, y columns
         """
+        if pixels is None and coords is None:
+            raise ValueError("Region needs pixels or coords")
         self.color = color
-        self.pixels = pixels
+        self._pixels = pixels
+        self._coords = None if coords is None else np.asarray(coords, dtype=np.int32).reshape(-1, 2)
+    
+    @property
+    def pixels(self) -> Set[Tuple[int, int]]:
+        """Set of (x, y) coordinates that make up this region."""
+        if self._pixels is None:
+            coords = self._coords
+            assert coords is not None
+            self._pixels = set(zip(coords[:, 0].tolist(), coords[:, 1].tolist()))
+        return self._pixels
+    
+    @pixels.setter
+    def pixels(self, pixels: Set[Tuple[int, int]]) -> None:
+        self._pixels = pixels
+        self._coords = None
+    
+    @property
+    def coords(self) -> np.ndarray:
+        """(N, 2) int32 array of the region's x, y coordinates (unordered)."""
+        if self._coords is None:
+            pixels = self._pixels
+            assert pixels is not None
+            self._coords = np.fromiter(
+                chain.from_iterable(pixels), dtype=np.int32, count=2 * len(pixels)
+            ).reshape(-1, 2)
+        return self._coords
     
     def __repr__(self) -> str:
-        return f"Region(color=RGB{self.color}, pixels={len(self.pixels)})"
+        count = len(self._pixels) if self._pixels is not None else len(self.coords)
+        return f"Region(color=RGB{self.color}, pixels={count})"
+
+
+class RegionList(list):
+    """
+    The list of regions merge_regions() returned for one PixelData.
+    
+    merge_regions() assigns every pixel to exactly one region, so while
+    the list still holds exactly those regions, its union is simply all of
+    the source pixels. covers_all_of() answers that in O(regions) without
+    touching a single pixel.
+    
+    WHY: _create_filtered_pixel_data() needs the union of all regions to
+    build the backing plate footprint. Recomputing it means walking every
+    region's pixels, which just repeats the partition merge_regions made.
+    
+    Filtering or trimming produces a plain list (or changes this one), and
+    then the union has to be computed the normal way. Regions are treated
+    as read-only, like PixelData.
+    """
+    
+    def __init__(self, regions: List[Region], source: PixelData):
+        """
+        Initialize the list.
+        
+        Args:
+            regions: All regions merged from source
+            source: The PixelData the regions partition
+        """
+        super().__init__(regions)
+        self._source = source
+        self._snapshot = tuple(regions)
+    
+    def covers_all_of(self, pixel_data: PixelData) -> bool:
+        """
+        Check whether these regions are still exactly the partition of pixel_data.
+        
+        Args:
+            pixel_data: The PixelData to check against
+        
+        Returns:
+            True if the union of the regions is every pixel of pixel_data
+        """
+        return (
+            pixel_data is self._source
+            and len(self) == len(self._snapshot)
+            and all(region is original for region, original in zip(self, self._snapshot))
+        )
 
 
 def flood_fill(
@@ -197,7 +298,7 @@ def split_diagonal_only_connections(region: Region) -> List[Region]:
     return sub_regions
 
 
-def merge_regions(pixel_data: PixelData, config: 'ConversionConfig') -> List[Region]:
+def merge_regions(pixel_data: PixelData, config: 'ConversionConfig') -> RegionList:
     """
     Group all pixels into connected regions by color.
     
@@ -221,10 +322,34 @@ def merge_regions(pixel_data: PixelData, config: 'ConversionConfig') -> List[Reg
     manifold geometry. At the region level, we keep same-color pixels together
     even if only diagonally connected.
     
+    When SciPy is installed, the same regions (same pixels, same order) are
+    found with SciPy's connected-components search instead of the Python
+    flood fill.
+    
     Args:
         pixel_data: Processed pixel data from image_processor
         config: ConversionConfig object with connectivity setting
     
+    Returns:
+        RegionList (a list) of Region objects, one per connected same-color area
+    """
+    # Fast path: label connected components in C when SciPy is installed
+    if SCIPY_AVAILABLE and config.connectivity in (4, 8) and pixel_data.pixel_count:
+        regions = _merge_regions_labeled(pixel_data, config.connectivity)
+    else:
+        regions = _merge_regions_flood_fill(pixel_data, config.connectivity)
+    
+    return RegionList(regions, pixel_data)
+
+
+def _merge_regions_flood_fill(pixel_data: PixelData, connectivity: int) -> List[Region]:
+    """
+    merge_regions() implemented with the Python flood fill.
+    
+    Args:
+        pixel_data: Processed pixel data
+        connectivity: 0 (no merge), 4 (edge-connected) or 8 (includes diagonals)
+    
     Returns:
         List of Region objects, one per connected same-color area
     """
@@ -241,7 +366,7 @@ def merge_regions(pixel_data: PixelData, config: 'ConversionConfig') -> List[Reg
         color = (rgba[0], rgba[1], rgba[2])
         
         # Flood fill to get all connected pixels of this color
-        region_pixels = flood_fill(x, y, color, pixel_data.pixels, visited, connectivity=config.connectivity)
+        region_pixels = flood_fill(x, y, color, pixel_data.pixels, visited, connectivity=connectivity)
         
         # Create a region for this blob
         regions.append(Region(color=color, pixels=region_pixels))
@@ -249,6 +374,93 @@ def merge_regions(pixel_data: PixelData, config: 'ConversionConfig') -> List[Reg
     return regions
 
 
+def _merge_regions_labeled(pixel_data: PixelData, connectivity: int) -> List[Region]:
+    """
+    merge_regions() implemented with SciPy's connected-components search.
+    
+    WHY: The flood fill does several set/dict operations per pixel in
+    Python. Here every same-color neighbor pair is found with whole-raster
+    comparisons, and one scipy.sparse.csgraph.connected_components call
+    labels all regions of all colors in C - no per-color pass over the image.
+    
+    (Labeling the combined opaque mask once and splitting each component by
+    color would be wrong: two same-color areas touching only through another
+    color would come out as one region.)
+    
+    Regions come out exactly as the flood fill produces them: ordered by the
+    first pixel of each region in pixel_data.pixels iteration order.
+    
+    Args:
+        pixel_data: Processed pixel data (must have at least one pixel)
+        connectivity: 4 (edge-connected) or 8 (includes diagonals)
+    
+    Returns:
+        List of Region objects, one per connected same-color area
+    """
+    # Per-pixel arrays in dict order: coordinates and packed 0xRRGGBB color
+    # (array-backed pixel data never builds its pixels dict here)
+    coords, rgba = pixel_data._pixel_arrays()
+    count = len(coords)
+    rgba = rgba.astype(np.int64)
+    packed = (rgba[:, 0] << 16) | (rgba[:, 1] << 8) | rgba[:, 2]
+    
+    # Rasters of packed colors and dict indices (-1 = no pixel), offset so
+    # coordinates start at 1 - the empty border keeps shifted slices simple
+    xs = coords[:, 0] - coords[:, 0].min() + 1
+    ys = coords[:, 1] - coords[:, 1].min() + 1
+    shape = (ys.max() + 2, xs.max() + 2)
+    color_raster = np.full(shape, -1, dtype=np.int64)
+    color_raster[ys, xs] = packed
+    index_raster = np.full(shape, -1, dtype=np.intp)
+    index_raster[ys, xs] = np.arange(count)
+    
+    # Edges between same-color neighbors (each pair once: right, up and,
+    # for 8-connectivity, the two upward diagonals)
+    offsets = [(1, 0), (0, 1)]
+    if connectivity == 8:
+        offsets += [(1, 1), (-1, 1)]
+    height, width = shape
+    sources = []
+    targets = []
+    for dx, dy in offsets:
+        here = (slice(1, height - 1), slice(1, width - 1))
+        there = (slice(1 + dy, height - 1 + dy), slice(1 + dx, width - 1 + dx))
+        same = (color_raster[here] == color_raster[there]) & (color_raster[here] >= 0)
+        sources.append(index_raster[here][same])
+        targets.append(index_raster[there][same])
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+    graph = coo_matrix((np.ones(len(sources), dtype=np.int8), (sources, targets)), shape=(count, count))
+    num_labels, pixel_labels = connected_components(graph, directed=False)
+    
+    # Order regions by their first pixel in dict order (as the flood fill does)
+    first_index = np.full(num_labels, count, dtype=np.intp)
+    np.minimum.at(first_index, pixel_labels, np.arange(count))
+    label_order = np.argsort(first_index, kind='stable')
+    
+    # Group pixels by label with one gather - each region's coordinates are
+    # then a slice of grouped_coords (dict order is kept within a label)
+    # WHY: Regions are independent once labeled, but what is left per region
+    # is tiny; one take over all pixels beats a fancy-index copy (and a
+    # split-off index array) per region, which dominates on images with
+    # thousands of small regions.
+    grouped_coords = coords[np.argsort(pixel_labels, kind='stable')]
+    sizes = np.bincount(pixel_labels, minlength=num_labels)
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    colors = packed[first_index]
+    
+    regions: List[Region] = []
+    for label in label_order.tolist():
+        color = int(colors[label])
+        regions.append(Region(
+            color=(color >> 16, (color >> 8) & 0xFF, color & 0xFF),
+            coords=grouped_coords[starts[label]:ends[label]]
+        ))
+    
+    return regions
+
+
 def get_region_bounds(region: Region) -> Tuple[int, int, int, int]:
     """
     Get the bounding box of a region in pixel coordinates.
@@ -262,13 +474,16 @@ def get_region_bounds(region: Region) -> Tuple[int, int, int, int]:
     Returns:
         Tuple of (min_x, max_x, min_y, max_y)
     """
-    if not region.pixels:
+    # WHY: min/max over the coordinate array - merge output never has to
+    # build a pixel set just to measure it
+    coords = region.coords
+    if not len(coords):
         return (0, 0, 0, 0)
     
-    xs = [x for x, y in region.pixels]
-    ys = [y for x, y in region.pixels]
+    min_x, min_y = coords.min(axis=0).tolist()
+    max_x, max_y = coords.max(axis=0).tolist()
     
-    return (min(xs), max(xs), min(ys), max(ys))
+    return (min_x, max_x, min_y, max_y)
 
 
 def is_pixel_disconnected(
@@ -354,6 +569,8 @@ def trim_disconnected_pixels(
         Empty regions (if all pixels were disconnected) are filtered out.
     """
     trimmed_regions: List[Region] = []
+    # all_pixels is the caller's dict - copy it once, before the first removal
+    owns_all_pixels = False
     
     for region in regions:
         # Keep removing disconnected pixels until none remain
@@ -376,9 +593,14 @@ def trim_disconnected_pixels(
             
             # Also remove them from all_pixels so they don't provide
             # edge connections for other pixels in subsequent iterations
+            # WHY: Deleting from a private copy costs O(1) per pixel; rebuilding
+            # the whole image dict per removed pixel made trimming
+            # O(removed x image size).
+            if not owns_all_pixels:
+                all_pixels = dict(all_pixels)
+                owns_all_pixels = True
             for pixel in disconnected:
-                if pixel in all_pixels:
-                    all_pixels = {k: v for k, v in all_pixels.items() if k != pixel}
+                all_pixels.pop(pixel, None)
         
         # Only keep regions that still have pixels
         if region_pixels:
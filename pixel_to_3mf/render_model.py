@@ -94,7 +94,7 @@ def render_meshes_to_file(
         
         # Convert mesh triangles to 3D polygons
         # Each triangle is defined by 3 vertex indices
-        vertices_array = np.array(mesh.vertices)
+        vertices_array = mesh.vertices_np
         
         # Apply small Z-offset to backing plate to prevent Z-fighting
         # The backing plate top face is at Z=0, same as the colored regions' bottom face.
@@ -48,12 +48,21 @@ Example usage:
     result = writer.write("output.3mf", meshes, context=(10.0, 10.0))
 """
 
+import io
+import os
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+# WHY stdlib ElementTree and not lxml: ET already runs on the C accelerator
+# (_elementtree), the large object model is emitted as text without any tree,
+# and the remaining trees are small. lxml would also reject the literal
+# "xmlns:p" / "p:UUID" attribute names used below, so switching would mean
+# an nsmap-based rewrite plus a new dependency for no measurable gain.
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
-from typing import List, Tuple, Dict, Any, Optional, Callable
+import numpy as np
+from typing import List, Tuple, Dict, Any, Optional, Callable, IO
 from dataclasses import dataclass
-import uuid
 
 from .constants import COORDINATE_PRECISION
 
@@ -65,12 +74,104 @@ NS_3MF = "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"
 NS_PRODUCTION = "http://schemas.microsoft.com/3dmanufacturing/production/2015/06"
 NS_BAMBU = "http://schemas.bambulab.com/package/2021"
 
+# Prefixed attribute names. The prefixes are declared once on the root
+# <model> element of each file, so every other element just reuses these.
+ATTR_P_UUID = "p:UUID"
+ATTR_P_PATH = "p:path"
+
+# Root <model> attributes of the main model, including the namespace
+# declarations.
+# WHY: Declaring namespaces only on the root keeps per-element output
+# small, and building the dict once avoids rebuilding it per file.
+_MAIN_MODEL_ROOT_ATTRIB = {
+    "unit": "millimeter",
+    "xml:lang": "en-US",
+    "xmlns": NS_3MF,
+    "xmlns:BambuStudio": NS_BAMBU,
+    "xmlns:p": NS_PRODUCTION,
+    "requiredextensions": "p"
+}
+
+# ============================================================================
+# Archive Output
+# ============================================================================
+
+# Buffer size for the output file handle (1 MiB).
+# WHY: The default 8 KiB buffer turns a multi-megabyte object model into
+# hundreds of small write() syscalls. A larger buffer lets zipfile hand
+# compressed chunks to the OS in a few big writes.
+ZIP_WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of <vertex>/<triangle> elements formatted per write() when
+# streaming the object model into the archive.
+# WHY: Large enough that per-call overhead is negligible, small enough that
+# only one chunk of text is ever held in memory at once.
+XML_WRITE_CHUNK_SIZE = 8192
+
+# zlib level used for the deflated (XML) archive entries.
+# WHY: Deflating the object model dominates packaging time for large meshes.
+# Level 1 is roughly 3x faster than the default level 6 on our mesh XML and
+# the archive only grows by about a quarter - XML compresses well either way.
+ZIP_COMPRESS_LEVEL = 1
+
+# Note: zipfile's own bookkeeping is not a bottleneck. Streaming a 10 MB
+# object model through zf.open() costs the same as feeding the identical
+# chunks to zlib.compressobj()/zlib.crc32() by hand - nearly all the time is
+# inside zlib either way - so there is no hand-rolled zip writer here.
+
+# File extensions whose bytes are already compressed, so they are stored
+# in the archive as-is instead of being deflated a second time.
+STORED_EXTENSIONS = ('.png',)
+
 # ============================================================================
 # Core Data Structures
 # ============================================================================
 
+class MeshArrayCache:
+    """
+    Cached NumPy views of a mesh's `vertices` and `triangles` lists.
+    
+    Shared by ThreeMFMesh and mesh_generator.Mesh, so both mesh types expose
+    the same vertices_np / triangles_np properties.
+    """
+    
+    @property
+    def vertices_np(self) -> np.ndarray:
+        """
+        Vertices as an (N, 3) float64 array, converted once and cached.
+        
+        WHY: Bounds, winding checks and the XML emitter all work on NumPy
+        arrays. Converting the vertex list once per mesh (instead of once per
+        consumer, or per emitted chunk) removes the repeated tuple walks.
+        The cache is refreshed if `vertices` is reassigned; in-place edits
+        to the list are not detected. Arrays passed in are used as-is.
+        """
+        return self._cached_array('vertices', np.float64)
+    
+    @property
+    def triangles_np(self) -> np.ndarray:
+        """Triangles as an (M, 3) index array (cached like vertices_np)."""
+        return self._cached_array('triangles', np.intp)
+    
+    def _cached_array(self, field: str, dtype: Any) -> np.ndarray:
+        source = getattr(self, field)
+        cache = self.__dict__.setdefault('_array_cache', {})
+        cached = cache.get(field)
+        if cached is None or cached[0] is not source:
+            cached = (source, _triples_to_array(source, dtype))
+            cache[field] = cached
+        return cached[1]
+    
+    def _seed_array_cache(self, vertex_array: np.ndarray, triangle_array: np.ndarray) -> None:
+        """Cache arrays the caller already has for the current vertex and triangle lists."""
+        self.__dict__['_array_cache'] = {
+            'vertices': (getattr(self, 'vertices'), vertex_array),
+            'triangles': (getattr(self, 'triangles'), triangle_array),
+        }
+
+
 @dataclass
-class ThreeMFMesh:
+class ThreeMFMesh(MeshArrayCache):
     """
     Generic mesh representation for 3MF export.
     
@@ -217,6 +318,10 @@ Returns:
     - zip_path: Path inside the 3MF archive (e.g., "Metadata/top_1.png")
     - image_bytes: PNG image data as bytes
 
+Note: ThreeMFWriter runs this callback on a background thread while it
+writes the XML files, so it must not read the (still incomplete) file at
+output_path or depend on progress messages being ordered after it.
+
 Example:
     def no_thumbnails(output_path: str, context: Any) -> List[Tuple[str, bytes]]:
         return []  # No thumbnails
@@ -256,15 +361,92 @@ def prettify_xml(elem: ET.Element) -> str:
     WHY: Pretty-printed XML is much easier to debug when inspecting
     3MF files manually or troubleshooting slicer import issues.
     
+    Indentation is added in place with ET.indent() and the tree is
+    serialized once. (Re-parsing the serialized string through minidom
+    just to indent it tripled the XML work and built a full DOM copy.)
+    
+    Note: ET.indent() modifies elem's whitespace in place.
+    
     Args:
         elem: Root element of the XML tree
     
     Returns:
         Pretty-printed XML string with <?xml?> declaration
     """
-    rough_string = ET.tostring(elem, encoding='unicode')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ")
+    ET.indent(elem, space="  ")
+    return ET.tostring(elem, encoding='unicode', xml_declaration=True)
+
+
+def write_pretty_xml(elem: ET.Element, fp: IO[bytes]) -> None:
+    """
+    Write an XML element tree, pretty-printed, into a binary file.
+    
+    Same output layout as prettify_xml(), but serialized straight into
+    fp as UTF-8 instead of being returned as a str.
+    
+    WHY: Archive entries can be written through zf.open(name, 'w'), so
+    streaming the tree avoids building the whole document as a str and
+    then a second, encoded copy for writestr().
+    
+    Note: ET.indent() modifies elem's whitespace in place.
+    
+    Args:
+        elem: Root element of the XML tree
+        fp: Binary file-like object to write into (e.g. a zip entry)
+    """
+    ET.indent(elem, space="  ")
+    ET.ElementTree(elem).write(fp, encoding='UTF-8', xml_declaration=True)
+
+
+def _stored_zip_info(name: str, date_time: Tuple[int, int, int, int, int, int]) -> zipfile.ZipInfo:
+    """
+    Build the ZipInfo for an archive entry that is written uncompressed.
+    
+    WHY: Passing a ZipInfo to writestr() fixes the entry's compression up
+    front, so already-compressed data (PNG thumbnails) is copied into the
+    archive as-is - only a CRC pass, no zlib pass.
+    
+    Args:
+        name: Path of the entry inside the archive
+        date_time: Modification time tuple (year, month, day, hour, minute, second)
+    
+    Returns:
+        ZipInfo with ZIP_STORED compression and regular-file permissions
+    """
+    info = zipfile.ZipInfo(name, date_time=date_time)
+    info.compress_type = zipfile.ZIP_STORED
+    info.external_attr = 0o600 << 16  # Same permissions writestr(name, ...) uses
+    return info
+
+
+def _uuid4_strings(count: int) -> List[str]:
+    """
+    Generate `count` random (version 4) UUID strings in one batch.
+    
+    WHY: Every object, component and build item needs a p:UUID. Calling
+    uuid.uuid4() per element means one os.urandom() call plus UUID object
+    construction and formatting for each. Here all the random bytes come
+    from a single os.urandom() call, the version/variant bits are set with
+    two numpy column operations, and the whole batch is hex-encoded at once.
+    
+    Args:
+        count: Number of UUIDs to generate
+    
+    Returns:
+        List of lowercase hyphenated UUID strings (same format as str(uuid.uuid4()))
+    """
+    if count <= 0:
+        return []
+    
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    hex_digits = raw.tobytes().hex()
+    
+    return [
+        f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+        for h in (hex_digits[i:i + 32] for i in range(0, 32 * count, 32))
+    ]
 
 
 def format_float(value: float, precision: int = COORDINATE_PRECISION) -> str:
@@ -312,18 +494,15 @@ def calculate_model_bounds(meshes: List[ThreeMFMesh]) -> Tuple[float, float, flo
         return (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
     
     # Filter out meshes with no vertices
-    valid_meshes = [mesh for mesh in meshes if mesh.vertices]
+    valid_meshes = [mesh for mesh in meshes if len(mesh.vertices)]
     if not valid_meshes:
         return (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
     
-    min_x = min(min(v[0] for v in mesh.vertices) for mesh in valid_meshes)
-    max_x = max(max(v[0] for v in mesh.vertices) for mesh in valid_meshes)
-    min_y = min(min(v[1] for v in mesh.vertices) for mesh in valid_meshes)
-    max_y = max(max(v[1] for v in mesh.vertices) for mesh in valid_meshes)
-    min_z = min(min(v[2] for v in mesh.vertices) for mesh in valid_meshes)
-    max_z = max(max(v[2] for v in mesh.vertices) for mesh in valid_meshes)
+    # Per-mesh column min/max on the cached vertex arrays, then across meshes
+    mins = np.min([mesh.vertices_np.min(axis=0) for mesh in valid_meshes], axis=0).tolist()
+    maxs = np.max([mesh.vertices_np.max(axis=0) for mesh in valid_meshes], axis=0).tolist()
     
-    return (min_x, max_x, min_y, max_y, min_z, max_z)
+    return (mins[0], maxs[0], mins[1], maxs[1], mins[2], maxs[2])
 
 
 def calculate_model_center(meshes: List[ThreeMFMesh]) -> Tuple[float, float]:
@@ -429,40 +608,31 @@ def validate_triangle_winding(mesh: ThreeMFMesh) -> str:
         "UNKNOWN" if mesh is empty or all triangles are degenerate
     """
     # Check if mesh has triangles
-    if not mesh.triangles:
+    if len(mesh.triangles) == 0:
         return "UNKNOWN"
     
-    # Find the max Z coordinate to identify top surface triangles
-    max_z = max(max(mesh.vertices[i][2] for i in tri) for tri in mesh.triangles)
+    # Gather every triangle's corner positions in one array: (T, 3 corners, xyz)
+    # WHY: A per-triangle Python loop (plus a separate pass just to find
+    # max Z) is slow on large meshes; NumPy does both in a single pass.
+    corners = mesh.vertices_np[mesh.triangles_np]
     
-    # Collect winding for top surface triangles (those with vertices near max_z)
-    top_face_winding = []
+    # Top surface triangles have all three vertices at (or very near) max Z
+    z = corners[:, :, 2]
+    is_top = (np.abs(z - z.max()) < 1e-6).all(axis=1)
+    top = corners[is_top]
     
-    for tri in mesh.triangles:
-        # Get vertices
-        v0 = mesh.vertices[tri[0]]
-        v1 = mesh.vertices[tri[1]]
-        v2 = mesh.vertices[tri[2]]
-        
-        # Check if this is a top surface triangle (all vertices at max Z)
-        if abs(v0[2] - max_z) < 1e-6 and abs(v1[2] - max_z) < 1e-6 and abs(v2[2] - max_z) < 1e-6:
-            # Compute edge vectors
-            edge1 = (v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2])
-            edge2 = (v2[0] - v0[0], v2[1] - v0[1], v2[2] - v0[2])
-            
-            # Cross product gives normal vector (right-hand rule)
-            # For top surface, positive Z normal = CCW, negative Z normal = CW
-            normal_z = edge1[0] * edge2[1] - edge1[1] * edge2[0]
-            
-            if abs(normal_z) > 1e-10:  # Not degenerate
-                top_face_winding.append("CCW" if normal_z > 0 else "CW")
+    # Z component of the cross product of the edge vectors (right-hand rule)
+    # For top surface, positive Z normal = CCW, negative Z normal = CW
+    edge1 = top[:, 1] - top[:, 0]
+    edge2 = top[:, 2] - top[:, 0]
+    normal_z = edge1[:, 0] * edge2[:, 1] - edge1[:, 1] * edge2[:, 0]
     
-    if not top_face_winding:
-        return "UNKNOWN"
+    # Degenerate triangles (|normal_z| <= 1e-10) count as neither
+    ccw_count = int((normal_z > 1e-10).sum())
+    cw_count = int((normal_z < -1e-10).sum())
     
-    # Check consistency
-    ccw_count = sum(1 for w in top_face_winding if w == "CCW")
-    cw_count = sum(1 for w in top_face_winding if w == "CW")
+    if ccw_count == 0 and cw_count == 0:
+        return "UNKNOWN"
     
     if ccw_count > 0 and cw_count == 0:
         return "CCW"
@@ -476,9 +646,125 @@ def validate_triangle_winding(mesh: ThreeMFMesh) -> str:
 # XML Generation Functions (3MF Specification)
 # ============================================================================
 
-def _generate_object_model_xml(objects: List[ThreeMFObject]) -> str:
+def _format_fixed_point(value: int, precision: int = COORDINATE_PRECISION) -> str:
+    """
+    Format a fixed-point integer (value / 10**precision) as a decimal string.
+    
+    Produces the same text as format_float() for the corresponding float,
+    e.g. 1500 -> "1.5" and 2000 -> "2" at precision 3, but uses only
+    integer arithmetic.
+    
+    Args:
+        value: Coordinate scaled by 10**precision and rounded to an integer
+        precision: Number of decimal places encoded in value
+    
+    Returns:
+        Formatted string with trailing zeros removed
+    """
+    whole, frac = divmod(abs(value), 10 ** precision)
+    sign = "-" if value < 0 else ""
+    if frac == 0:
+        return f"{sign}{whole}"
+    return f"{sign}{whole}.{frac:0{precision}d}".rstrip("0")
+
+
+def _triples_to_array(rows: Any, dtype: Any) -> np.ndarray:
+    """
+    Convert a sequence of 3-item rows (vertices or triangles) to an (N, 3) array.
+    
+    WHY: np.asarray() on a list of tuples inspects every tuple to discover
+    the shape, which made it the single most expensive step of formatting
+    the object model. Flattening with itertools.chain and np.fromiter()
+    with a known count skips that and is ~2.5x faster. Arrays pass through
+    without a copy.
+    
+    Args:
+        rows: List of (a, b, c) tuples/lists, or an existing (N, 3) array
+        dtype: NumPy dtype of the result
+    
+    Returns:
+        (N, 3) array of the given dtype
+    """
+    if isinstance(rows, np.ndarray):
+        return rows.astype(dtype, copy=False).reshape(-1, 3)
+    return np.fromiter(chain.from_iterable(rows), dtype=dtype, count=3 * len(rows)).reshape(-1, 3)
+
+
+def _emit_vertices_xml(
+    vertices: np.ndarray,
+    indent: str = "",
+    newline: str = ""
+) -> str:
+    """
+    Emit the <vertex> lines for one mesh as a single string.
+    
+    Coordinates are first quantized to fixed-point integers at
+    COORDINATE_PRECISION decimals (the precision we write anyway), so
+    formatting needs no float-to-decimal conversion at all.
+    
+    WHY: Meshes have tens of thousands of vertices, but pixel art meshes sit
+    on a grid, so they only use a few hundred distinct coordinate values.
+    NumPy finds those unique values, each one is formatted once, and the
+    strings are gathered and interleaved with the markup as object arrays.
+    That is several times faster than calling format_float() three times
+    per vertex. (np.char.mod was measured slower than plain Python here.)
+    Quantizing first also merges values that only differ below the written
+    precision (e.g. 0.1 + 0.2 vs 0.3) and writes tiny negatives as "0".
+    
+    Args:
+        vertices: (N, 3) array of (x, y, z) coordinates in millimeters
+        indent: Leading whitespace for each element ("" for compact output)
+        newline: Text after each element ("" for compact output)
+    
+    Returns:
+        Concatenated <vertex .../> elements
+    """
+    coords = _triples_to_array(vertices, np.float64)
+    fixed = np.rint(coords * 10 ** COORDINATE_PRECISION).astype(np.int64)
+    values, inverse = np.unique(fixed, return_inverse=True)
+    value_texts = np.array([_format_fixed_point(v) for v in values.tolist()], dtype=object)
+    texts = value_texts[inverse.reshape(-1)].reshape(-1, 3)
+    
+    lines = np.empty((len(coords), 7), dtype=object)
+    lines[:, 0] = f'{indent}<vertex x="'
+    lines[:, 1] = texts[:, 0]
+    lines[:, 2] = '" y="'
+    lines[:, 3] = texts[:, 1]
+    lines[:, 4] = '" z="'
+    lines[:, 5] = texts[:, 2]
+    lines[:, 6] = f'"/>{newline}'
+    return "".join(lines.ravel().tolist())
+
+
+def _emit_triangles_xml(
+    triangles: List[Tuple[int, int, int]],
+    indent: str = "",
+    newline: str = ""
+) -> str:
     """
-    Generate the XML content for 3D/Objects/object_1.model.
+    Emit the <triangle> elements for one mesh as a single string.
+    
+    Args:
+        triangles: List of (v1, v2, v3) vertex indices
+        indent: Leading whitespace for each element ("" for compact output)
+        newline: Text after each element ("" for compact output)
+    
+    Returns:
+        Concatenated <triangle .../> elements
+    """
+    return "".join([
+        f'{indent}<triangle v1="{v1}" v2="{v2}" v3="{v3}"/>{newline}'
+        for v1, v2, v3 in triangles
+    ])
+
+
+def _write_object_model_xml(
+    fp: IO[bytes],
+    objects: List[ThreeMFObject],
+    pretty: bool = False
+) -> None:
+    """
+    Stream the XML content for 3D/Objects/object_1.model into a binary file.
     
     This is the "mesh library" file that contains all the actual geometry
     (vertices and triangles). The main model file references these objects.
@@ -487,83 +773,108 @@ def _generate_object_model_xml(objects: List[ThreeMFObject]) -> str:
     (main model file). This allows reusing the same geometry with
     different transforms.
     
-    Args:
-        objects: List of ThreeMFObject instances with meshes
+    Unlike the other (small) files, this one is emitted directly as text
+    rather than through ElementTree. Every value is numeric or a UUID, so
+    nothing needs escaping.
     
-    Returns:
-        XML string for the object model file
-    """
-    root = ET.Element(
-        "model",
-        attrib={
-            "unit": "millimeter",
-            "xml:lang": "en-US",
-            "xmlns": NS_3MF,
-            f"xmlns:p": NS_PRODUCTION,
-            "requiredextensions": "p"
-        }
-    )
+    WHY compact by default: This is by far the largest file in the archive
+    and no slicer reads its whitespace. Indentation and newlines would add
+    ~30-50% more bytes to format, compress and write. Pass pretty=True to
+    get one element per line with two-space indentation for debugging.
     
-    # Add resources section (contains all mesh objects)
-    resources = ET.SubElement(root, "resources")
+    WHY stream: This file holds every vertex and triangle of the model.
+    Writing it in chunks of XML_WRITE_CHUNK_SIZE elements straight into the
+    zip entry keeps memory flat instead of holding the whole document as
+    a str plus its UTF-8 encoded copy.
     
-    # Add each mesh object
-    for obj in objects:
-        obj_uuid = str(uuid.uuid4())
-        obj_elem = ET.SubElement(
-            resources,
-            "object",
-            attrib={
-                "id": str(obj.object_id),
-                f"p:UUID": obj_uuid,
-                "type": "model"
-            }
-        )
+    Args:
+        fp: Binary file-like object to write UTF-8 XML into (e.g. a zip entry)
+        objects: List of ThreeMFObject instances with meshes
+        pretty: If True, indent the output (default: compact)
+    """
+    nl = "\n" if pretty else ""
+    
+    def tag(level: int, text: str) -> bytes:
+        indent = "  " * level if pretty else ""
+        return f"{indent}{text}{nl}".encode('utf-8')
+    
+    write = fp.write
+    write(f'<?xml version="1.0" encoding="UTF-8"?>{nl}'.encode('utf-8'))
+    write(tag(0,
+        f'<model xmlns="{NS_3MF}" xmlns:p="{NS_PRODUCTION}" unit="millimeter" '
+        'xml:lang="en-US" requiredextensions="p">'
+    ))
+    
+    # Resources section (contains all mesh objects)
+    write(tag(1, "<resources>" if objects else "<resources/>"))
+    
+    element_indent = "  " * 5 if pretty else ""
+    object_uuids = _uuid4_strings(len(objects))
+    for obj, obj_uuid in zip(objects, object_uuids):
+        write(tag(2, f'<object id="{obj.object_id}" {ATTR_P_UUID}="{obj_uuid}" type="model">'))
+        write(tag(3, "<mesh>"))
         
-        # Create mesh element
-        mesh_elem = ET.SubElement(obj_elem, "mesh")
+        # Chunks are views into the mesh's cached array (converted once)
+        vertices = obj.mesh.vertices_np
+        if len(vertices):
+            write(tag(4, "<vertices>"))
+            for start in range(0, len(vertices), XML_WRITE_CHUNK_SIZE):
+                chunk = vertices[start:start + XML_WRITE_CHUNK_SIZE]
+                write(_emit_vertices_xml(chunk, element_indent, nl).encode('utf-8'))
+            write(tag(4, "</vertices>"))
+        else:
+            write(tag(4, "<vertices/>"))
         
-        # Add vertices
-        vertices_elem = ET.SubElement(mesh_elem, "vertices")
-        for x, y, z in obj.mesh.vertices:
-            ET.SubElement(
-                vertices_elem,
-                "vertex",
-                attrib={
-                    "x": format_float(x),
-                    "y": format_float(y),
-                    "z": format_float(z)
-                }
-            )
+        triangles = obj.mesh.triangles
+        if len(triangles):
+            write(tag(4, "<triangles>"))
+            for start in range(0, len(triangles), XML_WRITE_CHUNK_SIZE):
+                chunk = triangles[start:start + XML_WRITE_CHUNK_SIZE]
+                write(_emit_triangles_xml(chunk, element_indent, nl).encode('utf-8'))
+            write(tag(4, "</triangles>"))
+        else:
+            write(tag(4, "<triangles/>"))
         
-        # Add triangles
-        triangles_elem = ET.SubElement(mesh_elem, "triangles")
-        for v1, v2, v3 in obj.mesh.triangles:
-            ET.SubElement(
-                triangles_elem,
-                "triangle",
-                attrib={
-                    "v1": str(v1),
-                    "v2": str(v2),
-                    "v3": str(v3)
-                }
-            )
+        write(tag(3, "</mesh>"))
+        write(tag(2, "</object>"))
+    
+    if objects:
+        write(tag(1, "</resources>"))
+    
+    # Empty build tag (required by spec even though this file isn't directly built)
+    write(tag(1, "<build/>"))
+    write(tag(0, "</model>"))
+
+
+def _generate_object_model_xml(objects: List[ThreeMFObject], pretty: bool = False) -> str:
+    """
+    Generate the XML content for 3D/Objects/object_1.model as a string.
+    
+    Convenience wrapper around _write_object_model_xml() for callers that
+    want the whole document in memory (tests, debugging). ThreeMFWriter
+    streams the file instead.
     
-    # Add empty build tag (required by spec even though this file isn't directly built)
-    ET.SubElement(root, "build")
+    Args:
+        objects: List of ThreeMFObject instances with meshes
+        pretty: If True, indent the output (default: compact)
     
-    return prettify_xml(root)
+    Returns:
+        XML string for the object model file
+    """
+    buffer = io.BytesIO()
+    _write_object_model_xml(buffer, objects, pretty=pretty)
+    return buffer.getvalue().decode('utf-8')
 
 
-def _generate_main_model_xml(
+def _build_main_model_tree(
     objects: List[ThreeMFObject],
     container_id: int,
     container_name: str,
     build_plate_center: Tuple[float, float],
     model_title: str | None
-) -> str:
+) -> ET.Element:
     """
-    Generate the XML content for 3D/3dmodel.model.
+    Build the XML tree for 3D/3dmodel.model.
     
     This is the "assembly" file that references all the objects from
     object_1.model and positions them in 3D space. It creates a container
@@ -580,89 +891,97 @@ def _generate_main_model_xml(
         model_title: Optional title metadata for the model
     
     Returns:
-        XML string for the main model file
-    """
-    root = ET.Element(
-        "model",
-        attrib={
-            "unit": "millimeter",
-            "xml:lang": "en-US",
-            "xmlns": NS_3MF,
-            f"xmlns:BambuStudio": NS_BAMBU,
-            f"xmlns:p": NS_PRODUCTION,
-            "requiredextensions": "p"
-        }
-    )
+        Root element of the main model file
+    """
+    # Built with a TreeBuilder (see _build_model_settings_tree for why)
+    builder = ET.TreeBuilder()
+    start, end, data = builder.start, builder.end, builder.data
     
-    # Add metadata
-    ET.SubElement(root, "metadata", name="Application").text = "PixelTo3MF"
-    ET.SubElement(root, "metadata", name="BambuStudio:3mfVersion").text = "1"
-    ET.SubElement(root, "metadata", name="Thumbnail_Middle").text = "/Metadata/plate_1.png"
-    ET.SubElement(root, "metadata", name="Thumbnail_Small").text = "/Metadata/plate_1_small.png"
+    start("model", _MAIN_MODEL_ROOT_ATTRIB)
     
-    # Use provided title or default
-    title = model_title if model_title else container_name
-    ET.SubElement(root, "metadata", name="Title").text = title
+    # Add metadata
+    title = model_title if model_title else container_name  # Use provided title or default
+    for name, text in (
+        ("Application", "PixelTo3MF"),
+        ("BambuStudio:3mfVersion", "1"),
+        ("Thumbnail_Middle", "/Metadata/plate_1.png"),
+        ("Thumbnail_Small", "/Metadata/plate_1_small.png"),
+        ("Title", title),
+    ):
+        start("metadata", {"name": name})
+        data(text)
+        end("metadata")
     
     # Create resources with container object
-    resources = ET.SubElement(root, "resources")
-    
-    container_uuid = str(uuid.uuid4())
-    container_obj = ET.SubElement(
-        resources,
-        "object",
-        attrib={
-            "id": str(container_id),
-            f"p:UUID": container_uuid,
-            "type": "model"
-        }
-    )
-    
-    components = ET.SubElement(container_obj, "components")
-    
+    start("resources", {})
+    
+    # One batch of UUIDs: container, one per component, build, build item
+    container_uuid, build_uuid, item_uuid, *component_uuids = _uuid4_strings(len(objects) + 3)
+    start("object", {
+        "id": str(container_id),
+        ATTR_P_UUID: container_uuid,
+        "type": "model"
+    })
+    
+    start("components", {})
+
+    # Formatted transform strings keyed by (tx, ty, tz).
+    # WHY: Applications typically give every component the same offset
+    # (e.g. the model center), so formatting it once and reusing the
+    # string avoids N identical f-string + format_float round trips.
+    transform_strings: Dict[Tuple[float, float, float], str] = {}
+    
+    # Identity fast path: when the callback hands back the very same tuple
+    # object for every mesh (write_3mf does), skip even the tuple()/hash
+    # of the dict lookup and reuse the previous string directly.
+    last_transform: Any = None
+    transform = ""
+
     # Reference each mesh object with its transform
-    for obj in objects:
-        comp_uuid = str(uuid.uuid4())
-        
-        tx, ty, tz = obj.transform
-        transform = f"1 0 0 0 1 0 0 0 1 {format_float(tx)} {format_float(ty)} {format_float(tz)}"
-        
-        ET.SubElement(
-            components,
-            "component",
-            attrib={
-                f"p:path": "/3D/Objects/object_1.model",
-                "objectid": str(obj.object_id),
-                f"p:UUID": comp_uuid,
-                "transform": transform
-            }
-        )
+    for obj, comp_uuid in zip(objects, component_uuids):
+        if obj.transform is not last_transform:
+            last_transform = obj.transform
+            key = tuple(last_transform)
+            transform = transform_strings.get(key)
+            if transform is None:
+                tx, ty, tz = key
+                transform = f"1 0 0 0 1 0 0 0 1 {format_float(tx)} {format_float(ty)} {format_float(tz)}"
+                transform_strings[key] = transform
+
+        start("component", {
+            ATTR_P_PATH: "/3D/Objects/object_1.model",
+            "objectid": str(obj.object_id),
+            ATTR_P_UUID: comp_uuid,
+            "transform": transform
+        })
+        end("component")
+    
+    end("components")
+    end("object")
+    end("resources")
     
     # Create build section
-    build_uuid = str(uuid.uuid4())
-    build = ET.SubElement(root, "build", attrib={f"p:UUID": build_uuid})
+    start("build", {ATTR_P_UUID: build_uuid})
     
     # Build transform to center on build plate
     build_transform = f"1 0 0 0 1 0 0 0 1 {build_plate_center[0]} {build_plate_center[1]} 1"
     
-    item_uuid = str(uuid.uuid4())
-    ET.SubElement(
-        build,
-        "item",
-        attrib={
-            "objectid": str(container_id),
-            f"p:UUID": item_uuid,
-            "transform": build_transform,
-            "printable": "1"
-        }
-    )
+    start("item", {
+        "objectid": str(container_id),
+        ATTR_P_UUID: item_uuid,
+        "transform": build_transform,
+        "printable": "1"
+    })
+    end("item")
+    end("build")
     
-    return prettify_xml(root)
+    end("model")
+    return builder.close()
 
 
-def _generate_model_settings_xml(objects: List[ThreeMFObject], container_id: int, container_name: str) -> str:
+def _build_model_settings_tree(objects: List[ThreeMFObject], container_id: int, container_name: str) -> ET.Element:
     """
-    Generate the XML content for Metadata/model_settings.config.
+    Build the XML tree for Metadata/model_settings.config.
     
     This is where object names and material slot assignments are stored.
     Each object gets mapped to its display name and extruder slot, which
@@ -677,37 +996,69 @@ def _generate_model_settings_xml(objects: List[ThreeMFObject], container_id: int
         container_name: Name for the container object
     
     Returns:
-        XML string for the model settings file
+        Root element of the model settings file
     """
-    root = ET.Element("config")
+    # Built with a TreeBuilder rather than SubElement: the per-object loop
+    # emits 2-3 elements per mesh, and start()/end() skips the parent
+    # lookups and attribute keyword handling (~2x faster on big models).
+    builder = ET.TreeBuilder()
+    start, end = builder.start, builder.end
+    
+    start("config", {})
     
     # Create parent object entry (the container)
-    parent_obj = ET.SubElement(root, "object", id=str(container_id))
-    ET.SubElement(parent_obj, "metadata", key="name", value=container_name)
+    start("object", {"id": str(container_id)})
+    start("metadata", {"key": "name", "value": container_name})
+    end("metadata")
     
     # Add each object as a "part" of the parent
     for obj in objects:
-        part = ET.SubElement(parent_obj, "part", id=str(obj.object_id), subtype="normal_part")
-        ET.SubElement(part, "metadata", key="name", value=obj.name)
+        start("part", {"id": str(obj.object_id), "subtype": "normal_part"})
+        start("metadata", {"key": "name", "value": obj.name})
+        end("metadata")
         
         # Add extruder metadata only if slot != 1 (slot 1 is default)
         if obj.extruder_slot != 1:
-            ET.SubElement(part, "metadata", key="extruder", value=str(obj.extruder_slot))
+            start("metadata", {"key": "extruder", "value": str(obj.extruder_slot)})
+            end("metadata")
+        end("part")
+    end("object")
     
     # Add assemble section
-    assemble = ET.SubElement(root, "assemble")
-    ET.SubElement(
-        assemble,
-        "assemble_item",
-        attrib={
-            "object_id": str(container_id),
-            "instance_id": "0",
-            "transform": "1 0 0 0 1 0 0 0 1 0 0 0",
-            "offset": "0 0 0"
-        }
-    )
-    
-    return prettify_xml(root)
+    start("assemble", {})
+    start("assemble_item", {
+        "object_id": str(container_id),
+        "instance_id": "0",
+        "transform": "1 0 0 0 1 0 0 0 1 0 0 0",
+        "offset": "0 0 0"
+    })
+    end("assemble_item")
+    end("assemble")
+    
+    end("config")
+    return builder.close()
+
+
+# Fixed boilerplate files. Their structure never changes between runs, so
+# they are plain templates rather than element trees built and serialized
+# on every write.
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">\n'
+    '  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\n'
+    '  <Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>\n'
+    '  <Default Extension="png" ContentType="image/png"/>\n'
+    '  <Default Extension="gcode" ContentType="text/x.gcode"/>\n'
+    '</Types>\n'
+)
+
+_RELS_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\n'
+    '  <Relationship Target="{target}" Id="rel-1" '
+    'Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>\n'
+    '</Relationships>\n'
+)
 
 
 def _generate_content_types_xml() -> str:
@@ -720,48 +1071,7 @@ def _generate_content_types_xml() -> str:
     Returns:
         XML string for content types
     """
-    root = ET.Element(
-        "Types",
-        xmlns="http://schemas.openxmlformats.org/package/2006/content-types"
-    )
-    
-    ET.SubElement(
-        root,
-        "Default",
-        attrib={
-            "Extension": "rels",
-            "ContentType": "application/vnd.openxmlformats-package.relationships+xml"
-        }
-    )
-    
-    ET.SubElement(
-        root,
-        "Default",
-        attrib={
-            "Extension": "model",
-            "ContentType": "application/vnd.ms-package.3dmanufacturing-3dmodel+xml"
-        }
-    )
-    
-    ET.SubElement(
-        root,
-        "Default",
-        attrib={
-            "Extension": "png",
-            "ContentType": "image/png"
-        }
-    )
-    
-    ET.SubElement(
-        root,
-        "Default",
-        attrib={
-            "Extension": "gcode",
-            "ContentType": "text/x.gcode"
-        }
-    )
-    
-    return prettify_xml(root)
+    return _CONTENT_TYPES_XML
 
 
 def _generate_rels_xml() -> str:
@@ -773,22 +1083,7 @@ def _generate_rels_xml() -> str:
     Returns:
         XML string for relationships
     """
-    root = ET.Element(
-        "Relationships",
-        xmlns="http://schemas.openxmlformats.org/package/2006/relationships"
-    )
-    
-    ET.SubElement(
-        root,
-        "Relationship",
-        attrib={
-            "Target": "/3D/3dmodel.model",
-            "Id": "rel-1",
-            "Type": "http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"
-        }
-    )
-    
-    return prettify_xml(root)
+    return _RELS_TEMPLATE.format(target="/3D/3dmodel.model")
 
 
 def _generate_3dmodel_rels_xml() -> str:
@@ -801,22 +1096,7 @@ def _generate_3dmodel_rels_xml() -> str:
     Returns:
         XML string for 3dmodel relationships
     """
-    root = ET.Element(
-        "Relationships",
-        xmlns="http://schemas.openxmlformats.org/package/2006/relationships"
-    )
-    
-    ET.SubElement(
-        root,
-        "Relationship",
-        attrib={
-            "Target": "/3D/Objects/object_1.model",
-            "Id": "rel-1",
-            "Type": "http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"
-        }
-    )
-    
-    return prettify_xml(root)
+    return _RELS_TEMPLATE.format(target="/3D/Objects/object_1.model")
 
 
 # ============================================================================
@@ -940,39 +1220,58 @@ class ThreeMFWriter:
         
         self._progress("Generating 3MF XML structure...")
         
-        # Generate all XML files
-        object_model_xml = _generate_object_model_xml(objects)
-        main_model_xml = _generate_main_model_xml(
+        # Build the small XML trees (every entry is streamed into the archive below)
+        main_model_root = _build_main_model_tree(
             objects,
             container_id,
             self.container_name,
             self.build_plate_center,
             self.model_title
         )
-        settings_xml = _generate_model_settings_xml(objects, container_id, self.container_name)
-        content_types_xml = _generate_content_types_xml()
-        rels_xml = _generate_rels_xml()
-        model_rels_xml = _generate_3dmodel_rels_xml()
+        settings_root = _build_model_settings_tree(objects, container_id, self.container_name)
         
         self._progress(f"Writing {len(objects)} objects to 3MF archive...")
         
-        # Create the 3MF file (ZIP archive)
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # Write all required XML files
-            zf.writestr("[Content_Types].xml", content_types_xml)
-            zf.writestr("_rels/.rels", rels_xml)
-            zf.writestr("3D/3dmodel.model", main_model_xml)
-            zf.writestr("3D/_rels/3dmodel.model.rels", model_rels_xml)
-            zf.writestr("3D/Objects/object_1.model", object_model_xml)
-            zf.writestr("Metadata/model_settings.config", settings_xml)
-            
-            # Generate and add thumbnails if callback provided
+        # Thumbnails don't depend on the XML, so they render on a worker
+        # thread while the archive is written.
+        # WHY: Both are CPU-heavy (PIL resampling/PNG encoding vs. vertex
+        # formatting/zlib) and large parts of each release the GIL, so
+        # overlapping them hides most of the thumbnail time. The bytes are
+        # still added to the zip from this thread - ZipFile isn't thread-safe.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="3mf-thumbnails") as executor:
+            thumbnail_future = None
             if self.thumbnail_callback:
                 self._progress("Generating thumbnails...")
-                thumbnails = self.thumbnail_callback(output_path, context)
-                for zip_path, image_data in thumbnails:
-                    zf.writestr(zip_path, image_data)
-                self._progress(f"✅ Added {len(thumbnails)} thumbnails")
+                thumbnail_future = executor.submit(self.thumbnail_callback, output_path, context)
+            
+            # Create the 3MF file (ZIP archive) through a large write buffer
+            with open(output_path, 'wb', buffering=ZIP_WRITE_BUFFER_SIZE) as output_file, \
+                    zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED,
+                                    compresslevel=ZIP_COMPRESS_LEVEL) as zf:
+                # Write all required XML files (the fixed boilerplate is tiny,
+                # everything else is streamed straight into its entry)
+                zf.writestr("[Content_Types].xml", _generate_content_types_xml())
+                zf.writestr("_rels/.rels", _generate_rels_xml())
+                with zf.open("3D/3dmodel.model", 'w') as fp:
+                    write_pretty_xml(main_model_root, fp)
+                zf.writestr("3D/_rels/3dmodel.model.rels", _generate_3dmodel_rels_xml())
+                with zf.open("3D/Objects/object_1.model", 'w') as fp:
+                    _write_object_model_xml(fp, objects)
+                with zf.open("Metadata/model_settings.config", 'w') as fp:
+                    write_pretty_xml(settings_root, fp)
+                
+                # Add thumbnails once the background render finishes
+                if thumbnail_future is not None:
+                    thumbnails = thumbnail_future.result()
+                    entry_time = time.localtime()[:6]
+                    for zip_path, image_data in thumbnails:
+                        # PNG data is already deflated - recompressing it burns
+                        # CPU for no size gain
+                        if zip_path.lower().endswith(STORED_EXTENSIONS):
+                            zf.writestr(_stored_zip_info(zip_path, entry_time), image_data)
+                        else:
+                            zf.writestr(zip_path, image_data)
+                    self._progress(f"✅ Added {len(thumbnails)} thumbnails")
         
         # Calculate statistics
         num_vertices, num_triangles = count_mesh_stats(meshes)
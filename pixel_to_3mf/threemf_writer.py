@@ -21,12 +21,17 @@ from typing import List, Tuple, Dict, TYPE_CHECKING, Optional, Callable, Any
 from pathlib import Path
 from PIL import Image
 from functools import lru_cache
+from operator import itemgetter
 import colorsys
 import math
+import numpy as np
 
 from .mesh_generator import Mesh
 from .threemf_core import ThreeMFWriter, ThreeMFMesh
-from color_tools import Palette, FilamentPalette, rgb_to_lab, rgb_to_hex
+from color_tools import (
+    Palette, FilamentPalette, rgb_to_lab, rgb_to_hex,
+    rgb_to_lab_array, delta_e_2000_array
+)
 
 # Import for type checking only (avoids circular imports)
 if TYPE_CHECKING:
@@ -125,78 +130,66 @@ def _rgb_to_blue_purple_category(rgb: Tuple[int, int, int]) -> str | None:
         return 'boundary'  # 50 <= R <= 80, could be either
 
 
-def _calculate_hue_weighted_distance(
-    target_rgb: Tuple[int, int, int],
-    candidate_rgb: Tuple[int, int, int],
-    candidate_name: str,
-    base_delta_e: float,
-    use_rgb_boundary_detection: bool = True,
-    category_mismatch_penalty: float = 50.0
-) -> float:
+# Delta E added when a clearly blue color would match a clearly purple
+# filament or vice versa (see _nearest_filaments_hue_aware)
+_CATEGORY_MISMATCH_PENALTY = 50.0
+
+
+def _to_filter_tuple(value: Any) -> Optional[Tuple[str, ...]]:
     """
-    Calculate distance with smart category mismatch penalty based on RGB composition.
-    
-    TODO: This entire function should be moved to color-tools library.
-          It's a workaround for filament palette gaps and should be part of
-          the palette matching logic, not the 3MF writer.
-    
-    IMPORTANT: This is a workaround for filament palettes with gaps!
-    ---------------------------------------------------------------------------
-    When a palette lacks intermediate colors (e.g., Bambu Lab has Purple #5E43B7
-    and Blue #0A2989, but no colors between), pure Delta E 2000 can match colors
-    across categorical boundaries. For example:
-    
-    - Pure blue #0000FF might match to purple (ΔE=14.37) instead of darker blue (ΔE=15.04)
-    - Bluish-purple #686CE8 might match to blue when it should match purple
+    Normalize a filament filter (str, list of str, or None) to a hashable tuple.
     
-    This function uses RGB component analysis to detect these boundary cases:
-    - **Blue**: Low red component (R < 50), high blue (B > 150)
-    - **Purple**: Significant red component (R > 80), high blue (B > 150)
-    - **Boundary zone**: 50 ≤ R ≤ 80 can match either (decided by Delta E)
+    WHY: The filament lookups are memoized with lru_cache, which needs
+    hashable arguments - lists from the config can't be cache keys.
+    """
+    if value is None:
+        return None
+    elif isinstance(value, str):
+        return (value,)  # Single string becomes 1-element tuple
+    else:
+        return tuple(value)  # List becomes tuple
+
+
+# Memoized LAB conversion for single colors.
+# WHY: rgb_to_lab is pure, and greedy filament matching converts the same
+# image colors and filament colors on every pass of its pair search. Pixel
+# art has few unique colors and the database ~1000 filaments, so nearly
+# every call after the first pass is a cache hit.
+_cached_rgb_to_lab = lru_cache(maxsize=4096)(rgb_to_lab)
+
+
+@lru_cache(maxsize=1)
+def _filament_palette() -> FilamentPalette:
+    """
+    Load the filament database once per process.
     
-    The penalty is applied when:
-    1. use_rgb_boundary_detection is enabled
-    2. BOTH target and candidate are in blue/purple range (B > 150)
-    3. Target clearly leans toward one category (R < 50 or R > 80)
-    4. Candidate clearly leans toward the opposite category
+    WHY: FilamentPalette.load_default() re-reads the JSON database on every
+    call, and each uncached filament lookup used to start with one. The
+    database doesn't change while we run.
+    """
+    return FilamentPalette.load_default()
+
+
+@lru_cache(maxsize=32)
+def _filtered_filaments(
+    maker_tuple: Optional[Tuple[str, ...]],
+    type_tuple: Optional[Tuple[str, ...]],
+    finish_tuple: Optional[Tuple[str, ...]]
+) -> Tuple[Any, ...]:
+    """
+    Filament records matching the maker/type/finish filters.
     
-    This means:
-    - Works for ANY filament naming scheme (no string matching!)
-    - Other palettes with better coverage are unaffected
-    - Non-blue/purple colors work normally
-    - Boundary zone colors still use pure Delta E
+    Cached per filter combination - every color in a conversion uses the
+    same filters, so the database is only filtered once.
     
-    Args:
-        target_rgb: Target color to match
-        candidate_rgb: Candidate color from palette
-        candidate_name: Name of the candidate filament (unused after refactor, kept for compatibility)
-        base_delta_e: Already-calculated Delta E 2000 distance
-        use_rgb_boundary_detection: Enable RGB component analysis (default True)
-        category_mismatch_penalty: Penalty for matching across categories (default 50.0)
-        
     Returns:
-        Weighted distance combining Delta E and category mismatch penalty
+        Tuple of FilamentRecord objects (empty if nothing matches)
     """
-    # TODO: Move to color-tools library as part of palette.find_nearest() logic
-    # Skip if RGB boundary detection is disabled
-    if not use_rgb_boundary_detection:
-        return base_delta_e
-    
-    # Analyze both target and candidate colors using RGB components
-    # TODO: These functions should move to color-tools
-    target_category = _rgb_to_blue_purple_category(target_rgb)
-    candidate_category = _rgb_to_blue_purple_category(candidate_rgb)
-    
-    # Only apply penalty if both colors are in blue/purple range
-    if target_category and candidate_category:
-        # Check for clear category mismatch
-        # 'boundary' can match either blue or purple, so only penalize clear mismatches
-        if target_category in ('blue', 'purple') and candidate_category in ('blue', 'purple'):
-            if target_category != candidate_category:
-                # Clear mismatch: blue target → purple candidate (or vice versa)
-                return base_delta_e + category_mismatch_penalty
-    
-    return base_delta_e
+    return tuple(_filament_palette().filter(
+        maker=list(maker_tuple) if maker_tuple else None,
+        type_name=list(type_tuple) if type_tuple else None,
+        finish=list(finish_tuple) if finish_tuple else None
+    ))
 
 
 @lru_cache(maxsize=256)
@@ -220,16 +213,11 @@ def _get_filament_name_cached(
         finish_tuple: Tuple of finish types (for caching)
         hue_aware: If True, penalize hue shifts to avoid blue→purple mismatches
     """
-    # Load palette once per cache entry
-    palette = FilamentPalette.load_default()
+    palette = _filament_palette()
     
     try:
-        # Get filtered palette (returns list of FilamentRecord objects)
-        filtered = palette.filter(
-            maker=list(maker_tuple) if maker_tuple else None,
-            type_name=list(type_tuple) if type_tuple else None,
-            finish=list(finish_tuple) if finish_tuple else None
-        )
+        # Get filtered palette (tuple of FilamentRecord objects)
+        filtered = _filtered_filaments(maker_tuple, type_tuple, finish_tuple)
         
         if not filtered:
             # No filaments match filters, fall back to hex
@@ -247,33 +235,9 @@ def _get_filament_name_cached(
             return f"{nearest_filament.maker} {nearest_filament.type} {nearest_filament.finish} {nearest_filament.color}"
         
         # TODO: This hue-aware search should be in color-tools library
-        # Manually search with hue weighting
-        from color_tools import delta_e_2000, rgb_to_lab
-        target_lab = rgb_to_lab(rgb)
-        
-        best_filament = None
-        best_distance = float('inf')
-        
-        for filament in filtered:
-            # Calculate base Delta E
-            de = delta_e_2000(target_lab, filament.lab)
-            
-            # Add category mismatch penalty
-            # TODO: Move this logic to color-tools library
-            filament_name = f"{filament.maker} {filament.type} {filament.finish} {filament.color}"
-            weighted_distance = _calculate_hue_weighted_distance(
-                rgb, filament.rgb, filament_name, de, 
-                use_rgb_boundary_detection=hue_aware
-            )
-            
-            if weighted_distance < best_distance:
-                best_distance = weighted_distance
-                best_filament = filament
-        
-        if best_filament:
-            return f"{best_filament.maker} {best_filament.type} {best_filament.finish} {best_filament.color}"
-        else:
-            return rgb_to_hex(rgb)
+        # Search with hue weighting (shared with the batched lookup)
+        best_filament = _nearest_filaments_hue_aware([rgb], maker_tuple, type_tuple, finish_tuple)[0]
+        return f"{best_filament.maker} {best_filament.type} {best_filament.finish} {best_filament.color}"
             
     except (ValueError, AttributeError):
         # If anything fails, fall back to hex
@@ -294,15 +258,11 @@ def _get_filament_with_rgb_cached(
     Returns:
         Tuple of (filament_name, matched_rgb)
     """
-    palette = FilamentPalette.load_default()
+    palette = _filament_palette()
     
     try:
-        # Get filtered palette (returns list of FilamentRecord objects)
-        filtered = palette.filter(
-            maker=list(maker_tuple) if maker_tuple else None,
-            type_name=list(type_tuple) if type_tuple else None,
-            finish=list(finish_tuple) if finish_tuple else None
-        )
+        # Get filtered palette (tuple of FilamentRecord objects)
+        filtered = _filtered_filaments(maker_tuple, type_tuple, finish_tuple)
         
         if not filtered:
             return (rgb_to_hex(rgb), rgb)
@@ -320,36 +280,116 @@ def _get_filament_with_rgb_cached(
             return (filament_name, nearest_filament.rgb)
         
         # TODO: This hue-aware search should be in color-tools library
-        # Manually search with hue weighting
-        from color_tools import delta_e_2000, rgb_to_lab
-        target_lab = rgb_to_lab(rgb)
-        
-        best_filament = None
-        best_distance = float('inf')
-        
-        for filament in filtered:
-            de = delta_e_2000(target_lab, filament.lab)
-            # TODO: Move RGB boundary detection logic to color-tools library
-            filament_name = f"{filament.maker} {filament.type} {filament.finish} {filament.color}"
-            weighted_distance = _calculate_hue_weighted_distance(
-                rgb, filament.rgb, filament_name, de,
-                use_rgb_boundary_detection=hue_aware
-            )
-            
-            if weighted_distance < best_distance:
-                best_distance = weighted_distance
-                best_filament = filament
-        
-        if best_filament:
-            filament_name = f"{best_filament.maker} {best_filament.type} {best_filament.finish} {best_filament.color}"
-            return (filament_name, best_filament.rgb)
-        else:
-            return (rgb_to_hex(rgb), rgb)
+        # Search with hue weighting (shared with the batched lookup)
+        best_filament = _nearest_filaments_hue_aware([rgb], maker_tuple, type_tuple, finish_tuple)[0]
+        filament_name = f"{best_filament.maker} {best_filament.type} {best_filament.finish} {best_filament.color}"
+        return (filament_name, best_filament.rgb)
             
     except (ValueError, AttributeError):
         return (rgb_to_hex(rgb), rgb)
 
 
+# Palette files shipped with color_tools. On exact distance ties, color_tools
+# prefers records loaded from user palette files over records from these.
+_CORE_PALETTE_SOURCES = frozenset({"colors.json", "filaments.json"})
+
+# dtype for all LAB arrays fed to delta_e_2000_array().
+# WHY float64 and not float32: delta_e_2000_array() converts its inputs to
+# float64 internally, so float32 inputs would only add a conversion copy per
+# call. It would also round palette values differently from the scalar
+# delta_e_2000() path, which can flip near-tie matches between batched and
+# single-color lookups. Keeping every LAB array float64 from the start means
+# no hidden promotions or copies inside the kernel.
+_LAB_DTYPE = np.float64
+
+
+def _nearest_records_de2000(
+    rgbs: List[Tuple[int, int, int]],
+    records: List[Any],
+    records_lab: np.ndarray
+) -> List[Any]:
+    """
+    Find the nearest palette record for every RGB color in one NumPy pass.
+    
+    Builds the full (N colors x P records) Delta E 2000 matrix with
+    broadcasting and takes the argmin of each row, instead of N separate
+    Python loops over the palette.
+    
+    WHY: Images often have dozens of region colors and the CSS palette has
+    ~150 entries. One vectorized evaluation replaces thousands of scalar
+    delta_e_2000() calls.
+    
+    Ties are broken the same way as Palette.nearest_color(): the first record
+    wins, unless a later record with the same distance comes from a user
+    palette file while the current winner comes from a core file.
+    
+    Args:
+        rgbs: Target RGB colors (0-255 per channel)
+        records: Palette records (must have .lab and .source attributes)
+        records_lab: (P, 3) array of the records' LAB values (_LAB_DTYPE)
+    
+    Returns:
+        List of the nearest record for each input color, in input order
+    """
+    target_lab = rgb_to_lab_array(np.asarray(rgbs, dtype=_LAB_DTYPE).reshape(-1, 3))
+    distances = delta_e_2000_array(target_lab[:, np.newaxis, :], records_lab[np.newaxis, :, :])
+    best_indices = distances.argmin(axis=1)
+    
+    nearest = []
+    for row, best_idx in zip(distances, best_indices):
+        best = records[best_idx]
+        # Resolve exact ties like color_tools does (rare, but keeps results identical)
+        for tied_idx in np.flatnonzero(row == row[best_idx])[1:]:
+            candidate = records[tied_idx]
+            if best.source in _CORE_PALETTE_SOURCES and candidate.source not in _CORE_PALETTE_SOURCES:
+                best = candidate
+        nearest.append(best)
+    return nearest
+
+
+@lru_cache(maxsize=1)
+def _css_palette() -> Tuple[List[Any], np.ndarray]:
+    """
+    Load the CSS color palette once and precompute its LAB matrix.
+    
+    WHY: Palette.load_default() re-reads the JSON database on every call.
+    The palette never changes while we run, so one load per process is
+    enough, and the (P, 3) LAB array can be reused by every lookup.
+    
+    Returns:
+        Tuple of (records, records_lab)
+    """
+    records = Palette.load_default().records
+    records_lab = np.array([record.lab for record in records], dtype=_LAB_DTYPE)
+    return records, records_lab
+
+
+def warm_color_caches() -> None:
+    """
+    Load the color palettes ahead of the first conversion.
+    
+    Optional. Call this once before converting many images (e.g. in batch
+    mode) so the one-time palette loads don't land inside the first
+    file's export step. Later calls are free.
+    """
+    _css_palette()
+    _filament_palette()
+
+
+def _nearest_css_colors(rgbs: List[Tuple[int, int, int]]) -> List[Any]:
+    """
+    Find the nearest CSS color record for each RGB color using Delta E 2000.
+    
+    Args:
+        rgbs: Target RGB colors (0-255 per channel)
+    
+    Returns:
+        List of ColorRecord objects, one per input color
+    """
+    records, records_lab = _css_palette()
+    return _nearest_records_de2000(rgbs, records, records_lab)
+
+
 @lru_cache(maxsize=256)
 def _get_css_color_name_cached(rgb: Tuple[int, int, int]) -> str:
     """
@@ -357,10 +397,7 @@ def _get_css_color_name_cached(rgb: Tuple[int, int, int]) -> str:
     
     Loads palette and finds nearest CSS color using Delta E 2000.
     """
-    palette = Palette.load_default()
-    lab = rgb_to_lab(rgb)
-    nearest_color, distance = palette.nearest_color(lab, space="lab", metric="de2000")
-    return nearest_color.name
+    return _nearest_css_colors([rgb])[0].name
 
 
 @lru_cache(maxsize=256)
@@ -371,12 +408,100 @@ def _get_css_color_with_rgb_cached(rgb: Tuple[int, int, int]) -> Tuple[str, Tupl
     Returns:
         Tuple of (color_name, matched_rgb)
     """
-    palette = Palette.load_default()
-    lab = rgb_to_lab(rgb)
-    nearest_color, distance = palette.nearest_color(lab, space="lab", metric="de2000")
+    nearest_color = _nearest_css_colors([rgb])[0]
     return (nearest_color.name, nearest_color.rgb)
 
 
+def _blue_purple_codes(rgbs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized _rgb_to_blue_purple_category() for an (N, 3) RGB array.
+    
+    Returns:
+        int8 array of codes: 1 = 'blue', 2 = 'purple', 0 = boundary or
+        not in the blue/purple range (neither is ever penalized)
+    """
+    r = rgbs[:, 0]
+    in_range = rgbs[:, 2] >= 150
+    codes = np.zeros(len(rgbs), dtype=np.int8)
+    codes[in_range & (r < 50)] = 1
+    codes[in_range & (r > 80)] = 2
+    return codes
+
+
+@lru_cache(maxsize=32)
+def _filament_matrix(
+    maker_tuple: Optional[Tuple[str, ...]],
+    type_tuple: Optional[Tuple[str, ...]],
+    finish_tuple: Optional[Tuple[str, ...]]
+) -> Tuple[Tuple[Any, ...], np.ndarray, np.ndarray]:
+    """
+    Filtered filament records with their LAB matrix and blue/purple codes.
+    
+    Cached per filter combination alongside _filtered_filaments().
+    
+    Returns:
+        Tuple of (records, records_lab, category_codes)
+    """
+    records = _filtered_filaments(maker_tuple, type_tuple, finish_tuple)
+    records_lab = np.array([record.lab for record in records], dtype=_LAB_DTYPE).reshape(-1, 3)
+    codes = _blue_purple_codes(np.array([record.rgb for record in records], dtype=np.int32).reshape(-1, 3))
+    return records, records_lab, codes
+
+
+def _nearest_filaments_hue_aware(
+    rgbs: List[Tuple[int, int, int]],
+    maker_tuple: Optional[Tuple[str, ...]],
+    type_tuple: Optional[Tuple[str, ...]],
+    finish_tuple: Optional[Tuple[str, ...]],
+    category_mismatch_penalty: float = _CATEGORY_MISMATCH_PENALTY
+) -> List[Any]:
+    """
+    Find the nearest filament for every RGB color with hue-weighted Delta E 2000.
+    
+    TODO: The blue/purple penalty should move to the color-tools library as
+          part of palette matching; it is a workaround for palette gaps.
+    
+    When a palette lacks intermediate colors (e.g., Bambu Lab has Purple
+    #5E43B7 and Blue #0A2989, but nothing between), pure Delta E 2000 can
+    match across categories - pure blue #0000FF is closer to that purple
+    (ΔE=14.37) than to the darker blue (ΔE=15.04). So when both the target
+    and a filament are in the blue/purple range (_rgb_to_blue_purple_category)
+    and clearly fall on opposite sides, category_mismatch_penalty is added to
+    the distance. Boundary-zone colors are never penalized.
+    
+    The (N colors x P filaments) Delta E matrix is built in one NumPy pass,
+    the penalty is added with a broadcast comparison of category codes, and
+    the first minimum in each row wins (same as a strict `<` scan in
+    palette order).
+    
+    Args:
+        rgbs: Target RGB colors (0-255 per channel)
+        maker_tuple: Tuple of maker names, or None
+        type_tuple: Tuple of filament types, or None
+        finish_tuple: Tuple of finish types, or None
+        category_mismatch_penalty: Penalty for a clear blue/purple mismatch
+    
+    Returns:
+        List of the nearest FilamentRecord for each input color
+    
+    Raises:
+        ValueError: If no filaments match the filters
+    """
+    records, records_lab, record_codes = _filament_matrix(maker_tuple, type_tuple, finish_tuple)
+    if not records:
+        raise ValueError("No filaments match the given filters")
+    
+    targets = np.asarray(rgbs, dtype=_LAB_DTYPE).reshape(-1, 3)
+    target_lab = rgb_to_lab_array(targets)
+    distances = delta_e_2000_array(target_lab[:, np.newaxis, :], records_lab[np.newaxis, :, :])
+    
+    target_codes = _blue_purple_codes(targets)[:, np.newaxis]
+    mismatch = (target_codes > 0) & (record_codes > 0) & (target_codes != record_codes)
+    distances = distances + np.where(mismatch, category_mismatch_penalty, 0.0)
+    
+    return [records[idx] for idx in distances.argmin(axis=1)]
+
+
 def get_color_name(rgb: Tuple[int, int, int], config: 'ConversionConfig') -> str:
     """
     Get the name for an RGB color based on the configured naming mode.
@@ -410,18 +535,9 @@ def get_color_name(rgb: Tuple[int, int, int], config: 'ConversionConfig') -> str
     
     elif config.color_naming_mode == "filament":
         # Convert lists/strings to tuples for hashability (lru_cache requires hashable args)
-        # Handle str, List[str], or None cases
-        def to_tuple(value):
-            if value is None:
-                return None
-            elif isinstance(value, str):
-                return (value,)  # Single string becomes 1-element tuple
-            else:
-                return tuple(value)  # List becomes tuple
-        
-        maker_tuple = to_tuple(config.filament_maker)
-        type_tuple = to_tuple(config.filament_type)
-        finish_tuple = to_tuple(config.filament_finish)
+        maker_tuple = _to_filter_tuple(config.filament_maker)
+        type_tuple = _to_filter_tuple(config.filament_type)
+        finish_tuple = _to_filter_tuple(config.filament_finish)
         
         return _get_filament_name_cached(rgb, maker_tuple, type_tuple, finish_tuple, config.hue_aware_matching)
     
@@ -429,6 +545,53 @@ def get_color_name(rgb: Tuple[int, int, int], config: 'ConversionConfig') -> str
         return _get_css_color_name_cached(rgb)
 
 
+def get_color_names(rgbs: List[Tuple[int, int, int]], config: 'ConversionConfig') -> List[str]:
+    """
+    Get names for many RGB colors at once.
+    
+    Equivalent to calling get_color_name() for each color, but in "color"
+    mode and hue-aware "filament" mode every unique color is matched with a
+    single vectorized Delta E 2000 evaluation against the palette.
+    
+    WHY: write_3mf() names every region. Doing that one color at a time
+    loads the palette and scans it once per unique color.
+    
+    Args:
+        rgbs: RGB tuples (0-255 for each channel), duplicates allowed
+        config: ConversionConfig with color_naming_mode and filament filters
+    
+    Returns:
+        List of color names in the same order as rgbs
+    """
+    mode = config.color_naming_mode
+    hue_aware_filament = mode == "filament" and config.hue_aware_matching
+    if (mode in ("hex", "generated", "filament") and not hue_aware_filament) or not rgbs:
+        return [get_color_name(rgb, config) for rgb in rgbs]
+    
+    # Match each unique color once (dict keeps first-seen order)
+    unique_rgbs = list(dict.fromkeys(rgbs))
+    
+    if hue_aware_filament:
+        filters = (
+            _to_filter_tuple(config.filament_maker),
+            _to_filter_tuple(config.filament_type),
+            _to_filter_tuple(config.filament_finish)
+        )
+        if not _filtered_filaments(*filters):
+            # No filaments match filters - same hex fallback as get_color_name()
+            return [rgb_to_hex(rgb) for rgb in rgbs]
+        names = {
+            rgb: f"{record.maker} {record.type} {record.finish} {record.color}"
+            for rgb, record in zip(unique_rgbs, _nearest_filaments_hue_aware(unique_rgbs, *filters))
+        }
+    else:  # "color" mode
+        names = {
+            rgb: record.name
+            for rgb, record in zip(unique_rgbs, _nearest_css_colors(unique_rgbs))
+        }
+    return [names[rgb] for rgb in rgbs]
+
+
 def greedy_filament_matching(
     unique_rgbs: List[Tuple[int, int, int]],
     config: 'ConversionConfig'
@@ -453,29 +616,13 @@ def greedy_filament_matching(
     Returns:
         Dict mapping RGB → (filament_name, filament_rgb)
     """
-    from color_tools import FilamentPalette, rgb_to_lab, delta_e_2000
-    
-    # Load filament palette
-    palette = FilamentPalette.load_default()
-    
-    # Convert filter values
-    def to_list(value):
-        if value is None:
-            return None
-        elif isinstance(value, str):
-            return [value]
-        else:
-            return list(value)
-    
-    maker_list = to_list(config.filament_maker)
-    type_list = to_list(config.filament_type)
-    finish_list = to_list(config.filament_finish)
+    from color_tools import delta_e_2000
     
     # Get all available filaments (filtered by user preferences)
-    filtered = palette.filter(
-        maker=maker_list,
-        type_name=type_list,
-        finish=finish_list
+    filtered = _filtered_filaments(
+        _to_filter_tuple(config.filament_maker),
+        _to_filter_tuple(config.filament_type),
+        _to_filter_tuple(config.filament_finish)
     )
     
     if not filtered:
@@ -499,9 +646,9 @@ def greedy_filament_matching(
         
         # Find the closest RGB-filament pair
         for rgb in remaining_rgbs:
-            rgb_lab = rgb_to_lab(rgb)
+            rgb_lab = _cached_rgb_to_lab(rgb)
             for filament in remaining_filaments:
-                fil_lab = rgb_to_lab(filament.rgb)
+                fil_lab = _cached_rgb_to_lab(filament.rgb)
                 distance = delta_e_2000(rgb_lab, fil_lab)
                 
                 if distance < best_distance:
@@ -556,17 +703,9 @@ def get_color_name_and_rgb(rgb: Tuple[int, int, int], config: 'ConversionConfig'
     
     elif config.color_naming_mode == "filament":
         # Convert lists/strings to tuples for hashability
-        def to_tuple(value):
-            if value is None:
-                return None
-            elif isinstance(value, str):
-                return (value,)
-            else:
-                return tuple(value)
-        
-        maker_tuple = to_tuple(config.filament_maker)
-        type_tuple = to_tuple(config.filament_type)
-        finish_tuple = to_tuple(config.filament_finish)
+        maker_tuple = _to_filter_tuple(config.filament_maker)
+        type_tuple = _to_filter_tuple(config.filament_type)
+        finish_tuple = _to_filter_tuple(config.filament_finish)
         
         return _get_filament_with_rgb_cached(rgb, maker_tuple, type_tuple, finish_tuple, config.hue_aware_matching)
     
@@ -601,30 +740,25 @@ def generate_color_preview(
     from PIL import Image, ImageDraw, ImageFont
     import numpy as np
     
-    # Create original image (left panel)
-    original = Image.new('RGBA', (pixel_data.width, pixel_data.height), (0, 0, 0, 0))
-    original_array = np.array(original)
-    
-    # Create matched colors image (right panel)
-    matched = Image.new('RGBA', (pixel_data.width, pixel_data.height), (0, 0, 0, 0))
-    matched_array = np.array(matched)
-    
-    # Fill both images with pixel data
-    for (x, y), (r, g, b, a) in pixel_data.pixels.items():
-        # Flip Y coordinate back (pixel_data has Y=0 at bottom, image has Y=0 at top)
-        image_y = pixel_data.height - 1 - y
-        
-        # Original colors (left)
-        original_array[image_y, x] = (r, g, b, a)
-        
-        # Matched colors (right)
-        detected_rgb = (r, g, b)
-        if detected_rgb in color_mapping:
-            filament_rgb = color_mapping[detected_rgb]
-            matched_array[image_y, x] = (*filament_rgb, a)
-        else:
-            # Shouldn't happen, but fallback to original color
-            matched_array[image_y, x] = (r, g, b, a)
+    # Original colors (left panel) - the RGBA array with Y flipped back
+    # (pixel_data has Y=0 at bottom, image has Y=0 at top)
+    original_array = np.ascontiguousarray(pixel_data.colors[::-1])
+    
+    # Matched colors (right panel) - each detected RGB swapped for its
+    # filament RGB, alpha kept
+    # WHY: One mapping lookup per distinct color and one gather, instead of
+    # a tuple unpack and dict lookup per pixel.
+    matched_array = original_array.copy()
+    opaque = original_array[:, :, 3] > 0
+    rgb = original_array[opaque][:, :3].astype(np.uint32)
+    packed_colors, inverse = np.unique((rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2], return_inverse=True)
+    palette = []
+    for packed in packed_colors.tolist():
+        detected_rgb = (packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF)
+        # Unmapped colors shouldn't happen, but fall back to the original color
+        palette.append(color_mapping.get(detected_rgb, detected_rgb))
+    if palette:
+        matched_array[opaque, :3] = np.array(palette, dtype=np.uint8)[inverse.reshape(-1)]
     
     # Convert arrays back to images
     original_img = Image.fromarray(original_array, 'RGBA')
@@ -694,13 +828,7 @@ def _pixel_art_thumbnail_callback(output_path: str, context: Any) -> List[Tuple[
     Returns:
         List of (zip_path, image_bytes) tuples for each thumbnail
     """
-    from .thumbnail_generator import (
-        generate_top_view,
-        generate_pick_view,
-        generate_plate_view,
-        generate_plate_small,
-        generate_plate_no_light
-    )
+    from .thumbnail_generator import generate_all_thumbnails
     
     config = context
     thumbnails = []
@@ -708,16 +836,10 @@ def _pixel_art_thumbnail_callback(output_path: str, context: Any) -> List[Tuple[
     # Load source image in RGBA mode for thumbnail generation
     source_path = Path(config.source_image_path) if config.source_image_path else None
     if source_path and source_path.exists():
+        # Generate all 5 thumbnail types (sharing their scaled/rotated rasters)
         source_img = Image.open(source_path).convert('RGBA')
-        
-        # Generate all 5 thumbnail types
-        thumbnails.append(("Metadata/top_1.png", generate_top_view(source_img)))
-        thumbnails.append(("Metadata/pick_1.png", generate_pick_view(source_img)))
-        
-        plate_view = generate_plate_view(source_img)
-        thumbnails.append(("Metadata/plate_1.png", plate_view))
-        thumbnails.append(("Metadata/plate_1_small.png", generate_plate_small(plate_view)))
-        thumbnails.append(("Metadata/plate_no_light_1.png", generate_plate_no_light(source_img)))
+        for file_name, png_bytes in generate_all_thumbnails(source_img).items():
+            thumbnails.append((f"Metadata/{file_name}", png_bytes))
     
     return thumbnails
 
@@ -778,13 +900,22 @@ def write_3mf(
     model_center_y = pixel_data.model_height_mm / 2.0
 
     # Create region data: (mesh_index, rgb, color_name) for each region
-    region_data = []
-    for i, rgb in enumerate(region_colors):
-        color_name = get_color_name(rgb, config)
-        region_data.append((i, rgb, color_name))
+    region_names = get_color_names(list(region_colors), config)
+    region_data = [
+        (i, rgb, color_name)
+        for i, (rgb, color_name) in enumerate(zip(region_colors, region_names))
+    ]
     
     # Sort alphabetically by color name for easier slicer workflow
-    region_data.sort(key=lambda x: x[2])
+    region_data.sort(key=itemgetter(2))
+
+    # Unzip once into parallel lists (sorted order) for the loops below
+    # WHY: Every later pass only needs one or two of the three fields, so
+    # indexing parallel lists avoids re-unpacking each triple per loop.
+    if region_data:
+        sorted_mesh_indices, sorted_rgbs, sorted_names = (list(col) for col in zip(*region_data))
+    else:
+        sorted_mesh_indices, sorted_rgbs, sorted_names = [], [], []
     
     # Build AMS slot mapping
     # Two modes:
@@ -799,14 +930,14 @@ def write_3mf(
         
         # Assign slots 2-N to other unique color names
         next_slot = 2
-        for _, rgb, color_name in region_data:
+        for color_name in sorted_names:
             if color_name not in name_to_slot:
                 name_to_slot[color_name] = next_slot
                 next_slot += 1
         
         # Maintain color_to_slot for backward compatibility
         color_to_slot: Dict[Tuple[int, int, int], int] = {config.backing_color: 1}
-        for _, rgb, color_name in region_data:
+        for rgb, color_name in zip(sorted_rgbs, sorted_names):
             color_to_slot[rgb] = name_to_slot[color_name]
     
     else:
@@ -817,7 +948,7 @@ def write_3mf(
         
         # Collect all unique RGB values (excluding backing color)
         unique_rgbs = []
-        for _, rgb, _ in region_data:
+        for rgb in sorted_rgbs:
             if rgb not in unique_rgbs and rgb != config.backing_color:
                 unique_rgbs.append(rgb)
         
@@ -847,17 +978,21 @@ def write_3mf(
         # For backward compatibility, create color_to_slot
         color_to_slot = rgb_to_slot
     
-    # Reorder meshes to match the sorted color order
-    sorted_meshes = [meshes[mesh_idx] for mesh_idx, _, _ in region_data]
+    # Output order as indices into meshes (sorted color order, backing plate last)
+    # WHY: Iterating an index permutation avoids building a second list that
+    # duplicates every (Mesh, name) reference just to reorder it.
+    mesh_order = list(sorted_mesh_indices)
     if has_backing_plate:
-        sorted_meshes.append(meshes[-1])
+        mesh_order.append(len(meshes) - 1)
     
     # Convert to ThreeMFMesh objects with metadata
     threemf_meshes = []
-    for idx, (mesh, _) in enumerate(sorted_meshes):
+    for idx, mesh_idx in enumerate(mesh_order):
+        mesh = meshes[mesh_idx][0]
         # Determine color name and slot based on position
-        if idx < len(region_data):
-            _, rgb, color_name = region_data[idx]
+        if idx < len(sorted_rgbs):
+            rgb = sorted_rgbs[idx]
+            color_name = sorted_names[idx]
             
             # In no-merge mode, find the actual unique name we assigned
             if not config.merge_similar_colors:
@@ -895,9 +1030,13 @@ def write_3mf(
     def slot_callback(obj_id: int, mesh: ThreeMFMesh) -> int:
         return mesh.metadata['ams_slot']
     
+    # All objects centered on model center, z=0. Built once: returning the
+    # same tuple for every mesh lets the writer format the component
+    # transform a single time.
+    shared_transform = (model_center_x, model_center_y, 0.0)
+    
     def transform_callback(obj_id: int, mesh: ThreeMFMesh, context: Any) -> Tuple[float, float, float]:
-        # All objects centered on model center, z=0
-        return (mesh.metadata['model_center_x'], mesh.metadata['model_center_y'], 0.0)
+        return shared_transform
     
     # Create ThreeMFWriter with pixel art callbacks
     writer = ThreeMFWriter(
@@ -928,9 +1067,9 @@ def write_3mf(
         
         _progress("Generating summary file...")
         
-        # Extract RGB colors and names from region_data
-        summary_colors = [rgb for _, rgb, _ in region_data]
-        summary_names = [color_name for _, _, color_name in region_data]
+        # Copy the sorted RGB colors and names (the backing plate is appended)
+        summary_colors = list(sorted_rgbs)
+        summary_names = list(sorted_names)
         
         # Add backing plate color as a separate region
         if has_backing_plate:
@@ -973,7 +1112,7 @@ def write_3mf(
                     break
         else:
             # In merge mode, find any RGB with this color name
-            for _, detected_rgb, color_name in region_data:
+            for detected_rgb, color_name in zip(sorted_rgbs, sorted_names):
                 if color_name == unique_name:
                     _, matched_rgb = get_color_name_and_rgb(detected_rgb, config)
                     slot_to_color[slot] = (unique_name, matched_rgb)
@@ -1004,7 +1143,7 @@ def write_3mf(
                     preview_mapping[rgb] = rgb
         else:
             # In merge mode, look up matched RGB for each detected RGB
-            for _, detected_rgb, color_name in region_data:
+            for detected_rgb, color_name in zip(sorted_rgbs, sorted_names):
                 if detected_rgb not in preview_mapping:
                     # Find the matched RGB from slot_to_color
                     for slot, (name, matched_rgb) in slot_to_color.items():
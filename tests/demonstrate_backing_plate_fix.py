@@ -4,6 +4,8 @@ Demonstration script showing the backing plate synchronization fix.
 This script demonstrates the issue that was fixed and how the solution works.
 """
 
+import numpy as np
+
 from pixel_to_3mf.pixel_to_3mf import _create_filtered_pixel_data
 from pixel_to_3mf.region_merger import Region
 from pixel_to_3mf.image_processor import PixelData
@@ -17,6 +19,20 @@ def print_section(title):
     print("=" * 70)
 
 
+def occupancy_mask(coords, width, height):
+    """
+    Pack (x, y) pixel coordinates into a 2D boolean mask (row = y).
+    
+    Set operations on masks are vectorized bitwise ops: union is |,
+    difference is & ~, instead of hashing every coordinate tuple.
+    """
+    mask = np.zeros((height, width), dtype=bool)
+    if coords:
+        xs, ys = np.array(list(coords)).T
+        mask[ys, xs] = True
+    return mask
+
+
 def demonstrate_issue():
     """Demonstrate the backing plate synchronization issue and fix."""
     
@@ -106,6 +122,19 @@ def demonstrate_issue():
     print(f"\n📌 Excluded pixels (not in backing plate): {sorted(excluded_pixels)}")
     print(f"   These were isolated/disconnected pixels that were filtered out")
     
+    # Same checks with boolean masks (one array per pixel set)
+    width, height = original_pixel_data.width, original_pixel_data.height
+    occupancy = occupancy_mask(original_pixel_data.pixels.keys(), width, height)
+    region_union = np.zeros_like(occupancy)
+    for region in filtered_regions:
+        region_union |= occupancy_mask(region.pixels, width, height)
+    filtered_mask = occupancy_mask(filtered_pixel_data.pixels.keys(), width, height)
+    
+    assert np.array_equal(filtered_mask, region_union), "Mismatch between regions and filtered data!"
+    excluded_ys, excluded_xs = np.nonzero(occupancy & ~region_union)
+    assert set(zip(excluded_xs.tolist(), excluded_ys.tolist())) == excluded_pixels
+    print("✓ Boolean-mask check agrees: excluded = occupancy & ~regions")
+    
     print_section("SUMMARY")
     print()
     print("✅ Fix successfully synchronizes backing plate with colored regions")
@@ -6,8 +6,11 @@ used across multiple test files.
 """
 
 from PIL import Image
-from typing import Tuple, Dict, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Tuple, Dict, Optional, Union
 import tempfile
+import io
 import os
 import numpy as np
 
@@ -16,7 +19,7 @@ def create_test_image(
     width: int,
     height: int,
     colors: Dict[Tuple[int, int, int, int], list],
-    filepath: Optional[str] = None
+    filepath: Optional[Union[str, os.PathLike]] = None
 ) -> str:
     """
     Create a test image with specified colors at specified positions.
@@ -32,60 +35,234 @@ def create_test_image(
     Returns:
         Path to the created image file
     """
+    return _write_png_bytes(_encode_test_image(width, height, colors), filepath)
+
+
+def _encode_test_image(
+    width: int,
+    height: int,
+    colors: Dict[Tuple[int, int, int, int], list]
+) -> bytes:
+    """
+    Build the image described by create_test_image() and encode it as PNG.
+    
+    Returns:
+        PNG image bytes
+    """
     # Check if this is a simple solid-color image (optimization)
     total_pixels = width * height
-    if len(colors) == 1:
-        color, positions = next(iter(colors.items()))
-        if len(positions) == total_pixels:
-            # Solid color image - use numpy for speed
-            arr = np.full((height, width, 4), color, dtype=np.uint8)
-            img = Image.fromarray(arr, mode='RGBA')
-        else:
-            # Sparse image - use standard approach
-            img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-            pixels = img.load()
-            if pixels is None:
-                raise RuntimeError("Failed to load image pixels")
-            for x, y in positions:
-                if 0 <= x < width and 0 <= y < height:
-                    pixels[x, y] = color
-    else:
-        # Multiple colors - use standard approach
-        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        pixels = img.load()
-        if pixels is None:
-            raise RuntimeError("Failed to load image pixels")
-        for color, positions in colors.items():
-            for x, y in positions:
-                if 0 <= x < width and 0 <= y < height:
-                    pixels[x, y] = color
-    
-    # Save to file
+    if len(colors) == 1 and len(next(iter(colors.values()))) == total_pixels:
+        return _encode_solid_image(width, height, next(iter(colors)))
+    
+    # Flatten the color -> positions mapping into parallel arrays once
+    palette = np.array(list(colors), dtype=np.uint8).reshape(-1, 4)
+    coords = [np.asarray(positions, dtype=np.intp).reshape(-1, 2) for positions in colors.values()]
+    color_idx = np.repeat(np.arange(len(coords)), [len(c) for c in coords])
+    coords = np.concatenate(coords) if coords else np.empty((0, 2), dtype=np.intp)
+    return _encode_indexed_image(width, height, coords[:, 0], coords[:, 1], color_idx, palette)
+
+
+def create_indexed_image(
+    width: int,
+    height: int,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    color_idx: np.ndarray,
+    palette: np.ndarray,
+    filepath: Optional[Union[str, os.PathLike]] = None
+) -> str:
+    """
+    Create a test image from parallel pixel arrays.
+    
+    Pixel i is at (xs[i], ys[i]) with color palette[color_idx[i]]; every
+    other pixel is fully transparent. Same image as create_test_image()
+    with the positions grouped by color, without building the dict.
+    
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        xs: X coordinate of each pixel
+        ys: Y coordinate of each pixel
+        color_idx: Palette index of each pixel
+        palette: (N, 4) array of RGBA colors
+        filepath: Optional path to save image (defaults to temp file)
+    
+    Returns:
+        Path to the created image file
+    """
+    png_bytes = _encode_indexed_image(width, height, xs, ys, color_idx, palette)
+    return _write_png_bytes(png_bytes, filepath)
+
+
+def _encode_indexed_image(
+    width: int,
+    height: int,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    color_idx: np.ndarray,
+    palette: np.ndarray
+) -> bytes:
+    """
+    Build the image described by create_indexed_image() and encode it as PNG.
+    
+    Returns:
+        PNG image bytes
+    """
+    xs = np.asarray(xs, dtype=np.intp)
+    ys = np.asarray(ys, dtype=np.intp)
+    color_idx = np.asarray(color_idx, dtype=np.intp)
+    palette = np.asarray(palette, dtype=np.uint8).reshape(-1, 4)
+    
+    valid = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    
+    if len(palette) < 256:
+        # Index 0 is the transparent background, the colors follow it
+        # One scatter for every pixel; out-of-bounds positions are ignored
+        indices = np.zeros((height, width), dtype=np.uint8)
+        indices[ys[valid], xs[valid]] = color_idx[valid] + 1
+        return _encode_palette_png(indices, np.vstack([np.zeros((1, 4), dtype=np.uint8), palette]))
+    
+    # Too many colors for a palette image - write RGBA directly
+    arr = np.zeros((height, width, 4), dtype=np.uint8)
+    arr[ys[valid], xs[valid]] = palette[color_idx[valid]]
+    img = Image.fromarray(arr, mode='RGBA')
+    
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _encode_palette_png(indices: np.ndarray, palette: np.ndarray) -> bytes:
+    """
+    Encode a palette ("P" mode) PNG with per-entry alpha.
+    
+    WHY: Test images only use a few colors. One byte per pixel instead of
+    four makes smaller files that are quicker to write and to decode, and
+    the loader converts them to the same RGBA pixels.
+    
+    Args:
+        indices: (height, width) uint8 array of palette indices
+        palette: (N, 4) uint8 array of RGBA colors, N <= 256
+    
+    Returns:
+        PNG image bytes
+    """
+    height, width = indices.shape
+    img = Image.frombytes('P', (width, height), np.ascontiguousarray(indices).tobytes())
+    img.putpalette(palette.tobytes(), rawmode='RGBA')
+    
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _write_png_bytes(png_bytes: bytes, filepath: Optional[Union[str, os.PathLike]] = None) -> str:
+    """
+    Write already-encoded PNG bytes to a file.
+    
+    Args:
+        png_bytes: Encoded PNG image
+        filepath: Optional path to write to (defaults to a new temp file)
+    
+    Returns:
+        Path to the written file
+    """
     if filepath is None:
-        fd, filepath = tempfile.mkstemp(suffix='.png')
-        os.close(fd)
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
+            f.write(png_bytes)
+            return f.name
     
-    img.save(filepath)
-    return filepath
+    with open(filepath, 'wb') as f:
+        f.write(png_bytes)
+    return os.fspath(filepath)
 
 
-def create_simple_square_image(size: int = 4, color: Tuple[int, int, int] = (255, 0, 0)) -> str:
+@lru_cache(maxsize=None)
+def _encode_cached_test_image(
+    width: int,
+    height: int,
+    colors_key: Tuple[Tuple[Tuple[int, int, int, int], Tuple[Tuple[int, int], ...]], ...]
+) -> bytes:
+    """Memoized _encode_test_image() keyed on a hashable copy of colors."""
+    return _encode_test_image(width, height, {color: list(positions) for color, positions in colors_key})
+
+
+def _create_cached_test_image(
+    width: int,
+    height: int,
+    colors: Dict[Tuple[int, int, int, int], list],
+    filepath: Optional[Union[str, os.PathLike]] = None
+) -> str:
+    """
+    Like create_test_image(), but reuses the PNG bytes for repeated arguments.
+    
+    WHY: The fixture helpers below are called from many tests with the same
+    arguments. Each call still gets its own temp file (tests delete them),
+    but each distinct image is only built and PNG-encoded once per process.
+    """
+    colors_key = tuple((color, tuple(positions)) for color, positions in colors.items())
+    return _write_png_bytes(_encode_cached_test_image(width, height, colors_key), filepath)
+
+
+def create_solid_image(
+    width: int,
+    height: int,
+    color: Tuple[int, int, int, int],
+    filepath: Optional[Union[str, os.PathLike]] = None
+) -> str:
+    """
+    Create a test image where every pixel has the same color.
+    
+    WHY: Same result as create_test_image() with one color listed at every
+    position, without building a width*height list of (x, y) tuples first.
+    
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        color: RGBA color tuple
+        filepath: Optional path to save image (defaults to temp file)
+    
+    Returns:
+        Path to the created image file
+    """
+    return _write_png_bytes(_encode_solid_image(width, height, color), filepath)
+
+
+@lru_cache(maxsize=None)
+def _encode_solid_image(width: int, height: int, color: Tuple[int, int, int, int]) -> bytes:
+    """
+    Build the image described by create_solid_image() and encode it as PNG.
+    
+    Memoized - batch tests ask for the same few solid images over and over,
+    and each call only needs its own copy of the bytes on disk.
+    
+    Returns:
+        PNG image bytes
+    """
+    indices = np.zeros((height, width), dtype=np.uint8)
+    return _encode_palette_png(indices, np.array([color], dtype=np.uint8))
+
+
+def create_simple_square_image(
+    size: int = 4,
+    color: Tuple[int, int, int] = (255, 0, 0),
+    filepath: Optional[Union[str, os.PathLike]] = None
+) -> str:
     """
     Create a simple square test image filled with one color.
     
     Args:
         size: Width and height in pixels
         color: RGB color tuple
+        filepath: Optional path to save image (defaults to temp file)
     
     Returns:
         Path to the created image file
     """
-    positions = [(x, y) for x in range(size) for y in range(size)]
-    colors = {color + (255,): positions}
-    return create_test_image(size, size, colors)
+    return create_solid_image(size, size, (*color, 255), filepath)
 
 
-def create_two_region_image() -> str:
+def create_two_region_image(filepath: Optional[Union[str, os.PathLike]] = None) -> str:
     """
     Create an image with two separate colored regions.
     
@@ -93,6 +270,9 @@ def create_two_region_image() -> str:
     - Top-left 2x2: Red
     - Bottom-right 2x2: Blue
     
+    Args:
+        filepath: Optional path to save image (defaults to temp file)
+    
     Returns:
         Path to the created image file
     """
@@ -104,7 +284,7 @@ def create_two_region_image() -> str:
         (0, 0, 255, 255): blue_positions
     }
     
-    return create_test_image(4, 4, colors)
+    return _create_cached_test_image(4, 4, colors, filepath)
 
 
 def create_transparent_image() -> str:
@@ -118,7 +298,7 @@ def create_transparent_image() -> str:
     """
     red_positions = [(1, 1), (2, 1), (1, 2), (2, 2)]
     colors = {(255, 0, 0, 255): red_positions}
-    return create_test_image(4, 4, colors)
+    return _create_cached_test_image(4, 4, colors)
 
 
 def create_diagonal_pattern_image() -> str:
@@ -132,7 +312,7 @@ def create_diagonal_pattern_image() -> str:
     """
     red_positions = [(0, 0), (1, 1), (2, 2), (3, 3)]
     colors = {(255, 0, 0, 255): red_positions}
-    return create_test_image(4, 4, colors)
+    return _create_cached_test_image(4, 4, colors)
 
 
 def cleanup_test_file(filepath: str) -> None:
@@ -177,6 +357,12 @@ def get_sample_image() -> str:
     return str(sample_image)
 
 
+# Content keys of archives that already passed validate_3mf_structure(),
+# most recently used last, bounded so long test runs don't grow it forever
+_VALIDATED_3MF_CACHE_SIZE = 128
+_validated_3mf_keys: 'OrderedDict[tuple, None]' = OrderedDict()
+
+
 def validate_3mf_structure(filepath: str) -> None:
     """
     Validate that a 3MF file has the correct structure.
@@ -191,6 +377,10 @@ def validate_3mf_structure(filepath: str) -> None:
     
     This is much more thorough than just checking zipfile.is_zipfile()!
     
+    Archives whose entries (names, CRC32s and sizes from the central
+    directory) match one that already passed are not parsed again - tests
+    often regenerate byte-identical 3MF files.
+    
     Args:
         filepath: Path to the 3MF file to validate
     
@@ -200,6 +390,7 @@ def validate_3mf_structure(filepath: str) -> None:
     """
     import zipfile
     import xml.etree.ElementTree as ET
+    from xml.parsers import expat
     
     # Basic existence check
     if not os.path.exists(filepath):
@@ -208,59 +399,169 @@ def validate_3mf_structure(filepath: str) -> None:
     # Must be a valid ZIP file
     assert zipfile.is_zipfile(filepath), f"File is not a valid ZIP: {filepath}"
     
+    # Required files for 3MF format
+    required_files = {
+        '[Content_Types].xml',
+        '_rels/.rels',
+        '3D/3dmodel.model',
+        '3D/_rels/3dmodel.model.rels',
+        '3D/Objects/object_1.model',
+        'Metadata/model_settings.config'
+    }
+    
+    # Key XML files that must be parseable
+    xml_files_to_check = {
+        '[Content_Types].xml',
+        '_rels/.rels',
+        '3D/3dmodel.model',
+        '3D/_rels/3dmodel.model.rels',
+        '3D/Objects/object_1.model'
+    }
+    
     with zipfile.ZipFile(filepath, 'r') as zf:
-        # Get list of files in the archive
-        file_list = zf.namelist()
-        
-        # Required files for 3MF format
-        required_files = [
-            '[Content_Types].xml',
-            '_rels/.rels',
-            '3D/3dmodel.model',
-            '3D/_rels/3dmodel.model.rels',
-            '3D/Objects/object_1.model',
-            'Metadata/model_settings.config'
-        ]
-        
-        for required_file in required_files:
-            assert required_file in file_list, \
-                f"Missing required 3MF file: {required_file}"
+        # Identify the contents without decompressing anything
+        content_key = tuple(sorted((info.filename, info.CRC, info.file_size) for info in zf.infolist()))
+        if content_key in _validated_3mf_keys:
+            _validated_3mf_keys.move_to_end(content_key)
+            return
         
-        # Validate that key XML files are parseable
-        xml_files_to_check = [
-            '[Content_Types].xml',
-            '_rels/.rels',
-            '3D/3dmodel.model',
-            '3D/_rels/3dmodel.model.rels',
-            '3D/Objects/object_1.model'
-        ]
+        # One pass over the archive: note which required files exist and
+        # stream-parse each XML file straight from its entry (no separate
+        # read() into bytes, and 3dmodel.model is parsed once, not twice)
+        found = set()
+        for info in zf.infolist():
+            if info.filename not in required_files:
+                continue
+            found.add(info.filename)
+            
+            if info.filename == '3D/3dmodel.model':
+                try:
+                    with zf.open(info) as xml_stream:
+                        model_has_build, model_has_item = _scan_xml_build(xml_stream)
+                except ET.ParseError as e:
+                    raise AssertionError(
+                        f"Invalid XML in {info.filename}: {e}"
+                    )
+            elif info.filename in xml_files_to_check:
+                # Only well-formedness matters here - a bare expat parse
+                # checks it without building any elements
+                try:
+                    with zf.open(info) as xml_stream:
+                        expat.ParserCreate().ParseFile(xml_stream)
+                except expat.ExpatError as e:
+                    raise AssertionError(
+                        f"Invalid XML in {info.filename}: {e}"
+                    )
         
-        for xml_file in xml_files_to_check:
-            try:
-                xml_content = zf.read(xml_file)
-                ET.fromstring(xml_content)
-            except ET.ParseError as e:
-                raise AssertionError(
-                    f"Invalid XML in {xml_file}: {e}"
-                )
+        missing = sorted(required_files - found)
+        assert not missing, f"Missing required 3MF file: {', '.join(missing)}"
         
         # Validate 3dmodel.model has at least one build item
-        model_content = zf.read('3D/3dmodel.model')
-        model_root = ET.fromstring(model_content)
-        
-        # Find build element (may have namespace)
-        build = model_root.find('.//{http://schemas.microsoft.com/3dmanufacturing/core/2015/02}build')
-        if build is None:
-            build = model_root.find('.//build')
-        
-        assert build is not None, "3dmodel.model missing <build> element"
-        
-        # Check for at least one item in the build
-        items = build.findall('.//{http://schemas.microsoft.com/3dmanufacturing/core/2015/02}item')
-        if not items:
-            items = build.findall('.//item')
-        
-        assert len(items) > 0, "3dmodel.model has no build items"
+        assert model_has_build, "3dmodel.model missing <build> element"
+        assert model_has_item, "3dmodel.model has no build items"
+    
+    # Only archives that passed every check are remembered
+    _validated_3mf_keys[content_key] = None
+    if len(_validated_3mf_keys) > _VALIDATED_3MF_CACHE_SIZE:
+        _validated_3mf_keys.popitem(last=False)
+
+
+def _scan_xml_build(xml_stream) -> Tuple[bool, bool]:
+    """
+    Parse an XML stream completely and report whether it has <build>/<item>.
+    
+    WHY: A full ElementTree keeps every element of the document alive just
+    to look for one <build> with an <item> inside. iterparse still checks
+    the whole document is well-formed, but each element is cleared as soon
+    as it closes, so memory stays flat even for multi-megabyte meshes.
+    (lxml's iterparse would do the same; the standard library is enough.)
+    
+    Tags are matched by local name, so <build>/<item> count with or without
+    the 3MF core namespace.
+    
+    Args:
+        xml_stream: Binary file-like object with the XML document
+    
+    Returns:
+        Tuple of (has_build, has_item_inside_build)
+    
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is malformed
+    """
+    import xml.etree.ElementTree as ET
+    
+    has_build = has_build_item = False
+    build_depth = 0
+    for event, elem in ET.iterparse(xml_stream, events=('start', 'end')):
+        local_name = elem.tag.rpartition('}')[2]
+        if event == 'start':
+            if local_name == 'build':
+                has_build = True
+                build_depth += 1
+            elif local_name == 'item' and build_depth:
+                has_build_item = True
+        else:
+            if local_name == 'build':
+                build_depth -= 1
+            elem.clear()
+    return has_build, has_build_item
+
+
+def assert_same_pixels(actual, expected) -> None:
+    """
+    Assert that two collections of (x, y) pixels hold the same set of pixels.
+    
+    Order and duplicates don't matter. Both sides are packed to int64 keys
+    and compared as unique sorted arrays instead of as sets of tuples.
+    
+    WHY: Set comparisons over large images hash every (x, y) tuple; np.unique
+    plus an array comparison does the same check in C.
+    
+    Args:
+        actual: (N, 2) array or iterable of (x, y) tuples
+        expected: (M, 2) array or iterable of (x, y) tuples
+    
+    Raises:
+        AssertionError: If the pixel sets differ (message shows a few examples)
+    """
+    actual_keys = np.unique(_pack_coords(_as_coord_array(actual)))
+    expected_keys = np.unique(_pack_coords(_as_coord_array(expected)))
+    if np.array_equal(actual_keys, expected_keys):
+        return
+    
+    def _unpack(keys: np.ndarray) -> list:
+        return [(int(k) & 0xFFFFFFFF, int(k) >> 32) for k in keys[:5]]
+    
+    missing = np.setdiff1d(expected_keys, actual_keys, assume_unique=True)
+    extra = np.setdiff1d(actual_keys, expected_keys, assume_unique=True)
+    raise AssertionError(
+        f"Pixel sets differ: {len(missing)} missing (e.g. {_unpack(missing)}), "
+        f"{len(extra)} unexpected (e.g. {_unpack(extra)})"
+    )
+
+
+def _as_coord_array(coords) -> np.ndarray:
+    """Convert an (N, 2) array or iterable of (x, y) tuples to an (N, 2) int64 array."""
+    if isinstance(coords, np.ndarray):
+        return coords.reshape(-1, 2)
+    return np.array(list(coords), dtype=np.int64).reshape(-1, 2)
+
+
+def _pack_coords(coords: np.ndarray) -> np.ndarray:
+    """
+    Pack (x, y) coordinates into one int64 key per pixel: y * 2**32 + x.
+    
+    Unlike y * width + x, the key doesn't depend on the image width, so keys
+    from different objects are directly comparable.
+    
+    Args:
+        coords: (N, 2) integer array of x, y columns (each within int32 range)
+    
+    Returns:
+        (N,) int64 array of keys, in the same order as coords
+    """
+    coords = np.asarray(coords, dtype=np.int64)
+    return (coords[:, 1] << 32) + coords[:, 0]
 
 
 def calculate_expected_triangle_count(num_pixels: int, has_backing: bool = True) -> int:
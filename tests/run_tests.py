@@ -19,6 +19,7 @@ from tests import (
     test_mesh_generator,
     test_threemf_core,
     test_threemf_writer,
+    test_thumbnail_generator,
     test_pixel_to_3mf,
     test_cli,
     test_quantization,
@@ -41,6 +42,7 @@ def run_tests():
     suite.addTests(loader.loadTestsFromModule(test_mesh_generator))
     suite.addTests(loader.loadTestsFromModule(test_threemf_core))
     suite.addTests(loader.loadTestsFromModule(test_threemf_writer))
+    suite.addTests(loader.loadTestsFromModule(test_thumbnail_generator))
     suite.addTests(loader.loadTestsFromModule(test_pixel_to_3mf))
     suite.addTests(loader.loadTestsFromModule(test_cli))
     suite.addTests(loader.loadTestsFromModule(test_quantization))
@@ -7,18 +7,21 @@ or optimization.
 """
 
 import unittest
+import numpy as np
 import sys
 from pathlib import Path
-from typing import Set, Tuple
+from unittest.mock import patch, PropertyMock
 
 # Add parent directory to path to import the package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from pixel_to_3mf.pixel_to_3mf import _create_filtered_pixel_data
+from pixel_to_3mf import pixel_to_3mf
+from pixel_to_3mf.pixel_to_3mf import _create_filtered_pixel_data, _generate_backing_plate_from_regions
 from pixel_to_3mf.region_merger import Region, merge_regions
 from pixel_to_3mf.image_processor import PixelData
 from pixel_to_3mf.mesh_generator import generate_backing_plate
 from pixel_to_3mf.config import ConversionConfig
+from tests.helpers import assert_same_pixels
 
 
 class TestFilteredPixelData(unittest.TestCase):
@@ -101,6 +104,80 @@ class TestFilteredPixelData(unittest.TestCase):
         self.assertEqual(filtered.width, pixel_data.width)
         self.assertEqual(filtered.height, pixel_data.height)
 
+    
+    def test_filter_preserves_order_and_ignores_unknown_coords(self):
+        """Test that kept pixels stay in original order and stray region coords are ignored."""
+        pixels = {
+            (2, 1): (0, 255, 0, 255),
+            (0, 0): (255, 0, 0, 255),
+            (1, 1): (0, 255, 0, 255),
+            (1, 0): (255, 0, 0, 255),
+        }
+        pixel_data = PixelData(width=3, height=2, pixel_size_mm=1.0, pixels=pixels)
+        
+        # (5, 5) isn't in the image, (1, 1) is left out
+        regions = [
+            Region(color=(255, 0, 0), pixels={(0, 0), (1, 0), (5, 5)}),
+            Region(color=(0, 255, 0), pixels={(2, 1)}),
+            Region(color=(0, 0, 255), pixels=set()),
+        ]
+        filtered = _create_filtered_pixel_data(regions, pixel_data)
+        
+        self.assertEqual(list(filtered.pixels.items()), [
+            ((2, 1), (0, 255, 0, 255)),
+            ((0, 0), (255, 0, 0, 255)),
+            ((1, 0), (255, 0, 0, 255)),
+        ])
+    
+    def test_array_backed_input_stays_array_backed(self):
+        """Test that filtering PixelData from an image array skips the pixels dict."""
+        # Row-flipped view, like load_image() produces
+        colors = np.zeros((2, 3, 4), dtype=np.uint8)[::-1]
+        colors[0, :] = (255, 0, 0, 255)
+        colors[1, 2] = (0, 255, 0, 255)
+        pixel_data = PixelData(width=3, height=2, pixel_size_mm=1.0, colors=colors)
+        
+        regions = [
+            Region(color=(255, 0, 0), pixels={(0, 0), (1, 0), (5, 5)}),
+        ]
+        filtered = _create_filtered_pixel_data(regions, pixel_data)
+        
+        self.assertTrue(filtered.is_array_backed)
+        self.assertEqual(filtered.pixel_count, 2)
+        self.assertEqual(list(filtered.pixels.items()), [
+            ((0, 0), (255, 0, 0, 255)),
+            ((1, 0), (255, 0, 0, 255)),
+        ])
+        
+        # Same plate as filtering the equivalent dict-backed data
+        dict_backed = PixelData(width=3, height=2, pixel_size_mm=1.0, pixels=dict(pixel_data.pixels))
+        config = ConversionConfig(base_height_mm=1.0)
+        expected = generate_backing_plate(_create_filtered_pixel_data(regions, dict_backed), config)
+        actual = generate_backing_plate(filtered, config)
+        self.assertEqual(actual.vertices, expected.vertices)
+        self.assertEqual(actual.triangles, expected.triangles)
+
+    
+    def test_untouched_merge_output_skips_region_union(self):
+        """Test that merge_regions() output is known to cover every pixel."""
+        pixels = {(0, 0): (255, 0, 0, 255), (1, 0): (0, 255, 0, 255), (1, 1): (255, 0, 0, 255)}
+        pixel_data = PixelData(width=2, height=2, pixel_size_mm=1.0, pixels=pixels)
+        regions = merge_regions(pixel_data, ConversionConfig(connectivity=4))
+        self.assertTrue(regions.covers_all_of(pixel_data))
+        
+        with patch.object(Region, 'coords', new_callable=PropertyMock) as mock_coords:
+            filtered = _create_filtered_pixel_data(regions, pixel_data)
+        mock_coords.assert_not_called()
+        self.assertEqual(list(filtered.pixels.items()), list(pixels.items()))
+        
+        # Once the list changes, the union is computed from the regions again
+        regions.pop()
+        self.assertFalse(regions.covers_all_of(pixel_data))
+        self.assertEqual(len(_create_filtered_pixel_data(regions, pixel_data).pixels), 2)
+        self.assertFalse(merge_regions(pixel_data, ConversionConfig(connectivity=4)).covers_all_of(
+            PixelData(width=2, height=2, pixel_size_mm=1.0, pixels=dict(pixels))
+        ))
+
 
 class TestBackingPlateSynchronization(unittest.TestCase):
     """Test that backing plate matches colored regions exactly."""
@@ -132,11 +209,10 @@ class TestBackingPlateSynchronization(unittest.TestCase):
         self.assertGreater(len(backing_mesh.triangles), 0)
         
         # Verify filtered pixel data matches regions
-        region_pixels: Set[Tuple[int, int]] = set()
-        for region in regions:
-            region_pixels.update(region.pixels)
-        
-        self.assertEqual(set(filtered_pixel_data.pixels.keys()), region_pixels)
+        assert_same_pixels(
+            filtered_pixel_data.pixels.keys(),
+            np.concatenate([region.coords for region in regions])
+        )
     
     def test_backing_plate_excludes_filtered_pixels(self):
         """Test that backing plate excludes pixels not in regions."""
@@ -204,6 +280,35 @@ class TestBackingPlateSynchronization(unittest.TestCase):
             # Backing plate for no pixels should be empty
             self.assertEqual(len(backing_mesh.vertices), 0)
             self.assertEqual(len(backing_mesh.triangles), 0)
+    
+    def test_backing_plate_from_regions_matches_filtered_plate(self):
+        """Test that the fused backing plate equals filtering then meshing."""
+        # Row-flipped view, like load_image() produces; (3, 2) is transparent
+        colors = np.zeros((3, 4, 4), dtype=np.uint8)[::-1]
+        colors[:, :] = (255, 0, 0, 255)
+        colors[2, 3] = (0, 0, 0, 0)
+        pixel_data = PixelData(width=4, height=3, pixel_size_mm=0.5, colors=colors)
+        config = ConversionConfig(base_height_mm=2.0)
+        
+        all_pixels = {(x, y) for x in range(4) for y in range(3)}
+        cases = {
+            "trimmed": [Region(color=(255, 0, 0), pixels=all_pixels - {(0, 0), (2, 1)})],
+            "transparent and out of bounds": [Region(color=(255, 0, 0), pixels={(3, 2), (9, 9), (1, 1)})],
+            "empty": [],
+        }
+        for name, regions in cases.items():
+            with self.subTest(case=name):
+                expected = generate_backing_plate(_create_filtered_pixel_data(regions, pixel_data), config)
+                with patch.object(pixel_to_3mf, '_create_filtered_pixel_data') as mock_filter:
+                    actual = _generate_backing_plate_from_regions(regions, pixel_data, config)
+                mock_filter.assert_not_called()
+                self.assertEqual(actual.vertices, expected.vertices)
+                self.assertEqual(actual.triangles, expected.triangles)
+        
+        # A footprint covering the whole frame still gets the single-box plate
+        full = PixelData(width=4, height=3, pixel_size_mm=0.5, colors=np.full((3, 4, 4), 255, dtype=np.uint8))
+        regions = [Region(color=(255, 255, 255), pixels=all_pixels)]
+        self.assertEqual(len(_generate_backing_plate_from_regions(regions, full, config).vertices), 8)
 
 
 if __name__ == '__main__':
@@ -16,20 +16,52 @@ import tempfile
 import shutil
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
+import numpy as np
+from PIL import Image
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from pixel_to_3mf.cli import is_image_file, process_batch, generate_batch_summary
+from pixel_to_3mf import cli
+from pixel_to_3mf.cli import is_image_file, process_batch, generate_batch_summary, _format_batch_summary, _iter_images
 from pixel_to_3mf.config import ConversionConfig
+from pixel_to_3mf.threemf_writer import warm_color_caches
 from tests.helpers import (
     create_simple_square_image,
     create_two_region_image,
     create_test_image,
-    cleanup_test_file
+    create_solid_image,
+    create_indexed_image
 )
 
 
+# A 2x2 image with one red, one green and one blue pixel, as
+# (xs, ys, color_idx, palette) for create_indexed_image()
+THREE_COLOR_PIXELS = (
+    np.array([0, 1, 0]),
+    np.array([0, 0, 1]),
+    np.array([0, 1, 2]),
+    np.array([[255, 0, 0, 255], [0, 255, 0, 255], [0, 0, 255, 255]], dtype=np.uint8)
+)
+
+# Relative paths as process_batch() reports them, with the platform's separator
+SUBFOLDER_SUB_PNG = os.path.join('subfolder', 'sub.png')
+SUBFOLDER_SUB_3MF = os.path.join('subfolder', 'sub_model.3mf')
+SUBFOLDER_HIGHRES_PNG = os.path.join('subfolder', 'highres.png')
+SUBFOLDER_TWO_PNG = os.path.join('subfolder', 'two.png')
+LEVEL1_PNG = os.path.join('level1', 'l1.png')
+LEVEL2_PNG = os.path.join('level1', 'level2', 'l2.png')
+LEVEL3_PNG = os.path.join('level1', 'level2', 'level3', 'l3.png')
+
+
+def setUpModule():
+    """Do the one-time loads up front so they aren't timed as part of the first test."""
+    # Every image format plugin, then the palettes every batch conversion uses
+    Image.init()
+    warm_color_caches()
+
+
 class TestIsImageFile(unittest.TestCase):
     """Test the is_image_file function."""
     
@@ -68,6 +100,14 @@ class TestIsImageFile(unittest.TestCase):
         path = Path("test.JpEg")
         self.assertTrue(is_image_file(path))
     
+    def test_every_supported_extension_any_case(self):
+        """Test each supported extension in lower, upper, title and odd mixed case."""
+        from pixel_to_3mf.constants import SUPPORTED_IMAGE_EXTENSIONS
+        for ext in SUPPORTED_IMAGE_EXTENSIONS:
+            for variant in (ext, ext.upper(), ext.title(), ext[:2] + ext[2:].upper()):
+                with self.subTest(extension=variant):
+                    self.assertTrue(is_image_file(Path("test" + variant)))
+    
     def test_non_image_file(self):
         """Test that non-image files are not recognized."""
         path = Path("test.txt")
@@ -82,33 +122,84 @@ class TestIsImageFile(unittest.TestCase):
         """Test that files without extensions are not recognized."""
         path = Path("test")
         self.assertFalse(is_image_file(path))
+    
+    def test_hidden_file_named_like_extension(self):
+        """Test that a dotfile such as '.png' has no extension, like Path.suffix."""
+        self.assertFalse(is_image_file(Path(".png")))
+        self.assertTrue(is_image_file(Path(".hidden.png")))
+    
+    def test_plain_file_name(self):
+        """Test that a bare file name string is accepted as well as a Path."""
+        self.assertTrue(is_image_file("sprite.GIF"))
+        self.assertFalse(is_image_file("sprite.png.bak"))
+
+
+class TestIterImages(unittest.TestCase):
+    """Test batch input discovery."""
+    
+    @classmethod
+    def setUpClass(cls):
+        # The tree is only read, so every test shares it
+        cls.root = Path(tempfile.mkdtemp())
+        for relative in ["a.png", "notes.txt", "sub/b.JPG", "sub/deeper/c.gif", "sub/deeper/d.3mf"]:
+            path = cls.root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"")
+        (cls.root / "folder.png").mkdir()  # A folder with an image-like name
+    
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root, ignore_errors=True)
+    
+    def test_matches_pathlib_listing(self):
+        """Test that scandir discovery finds the same files as iterdir/rglob filtering."""
+        for recurse, listing in [(False, self.root.iterdir()), (True, self.root.rglob('*'))]:
+            with self.subTest(recurse=recurse):
+                expected = sorted(f for f in listing if f.is_file() and is_image_file(f))
+                self.assertEqual(sorted(_iter_images(self.root, recurse)), expected)
+        self.assertEqual(len(list(_iter_images(self.root, True))), 3)
+    
+    @unittest.skipIf(sys.platform == 'win32', "symlinks need extra privileges on Windows")
+    def test_symlinked_folders_not_descended(self):
+        """Test that a symlink to a folder isn't followed (so loops can't recurse forever)."""
+        loop = self.root / "sub" / "loop"
+        loop.symlink_to(self.root, target_is_directory=True)
+        self.addCleanup(loop.unlink)
+        self.assertEqual(len(list(_iter_images(self.root, True))), 3)
 
 
 class TestProcessBatch(unittest.TestCase):
     """Test the process_batch function."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root that holds every test's folders."""
+        # WHY: Removing a single tree once per class is cheaper than two
+        # mkdtemp() calls and two rmtree() walks in every test
+        cls.temp_root = Path(tempfile.mkdtemp())
+        # One default config for the tests that don't customize it
+        # WHY: process_batch() itself hands a single config to every image
+        # in a batch (conversion only overwrites the source image fields),
+        # so sharing it between tests matches real use
+        cls.default_config = ConversionConfig()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary root and everything the tests left in it."""
+        shutil.rmtree(cls.temp_root, ignore_errors=True)
+    
     def setUp(self):
         """Set up temporary directories for testing."""
-        self.test_files = []
-        self.temp_dirs = []
-        
-        # Create temporary input and output directories
-        self.input_dir = Path(tempfile.mkdtemp())
-        self.output_dir = Path(tempfile.mkdtemp())
-        self.temp_dirs.extend([self.input_dir, self.output_dir])
-    
-    def tearDown(self):
-        """Clean up test files and directories."""
-        for filepath in self.test_files:
-            cleanup_test_file(filepath)
-        
-        for temp_dir in self.temp_dirs:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
+        # Fresh input and output directories under the shared root
+        test_dir = Path(tempfile.mkdtemp(dir=self.temp_root))
+        self.input_dir = test_dir / "input"
+        self.output_dir = test_dir / "output"
+        self.input_dir.mkdir()
+        self.output_dir.mkdir()
     
     def test_process_empty_folder(self):
         """Test batch processing with empty input folder."""
-        config = ConversionConfig()
+        config = self.default_config
         results = process_batch(self.input_dir, self.output_dir, config)
         
         self.assertEqual(len(results['success']), 0)
@@ -118,11 +209,10 @@ class TestProcessBatch(unittest.TestCase):
     def test_process_single_image(self):
         """Test batch processing with a single image."""
         # Create a test image in input folder
-        img_path = create_simple_square_image(size=4, color=(255, 0, 0))
         dest_path = self.input_dir / "test.png"
-        shutil.move(img_path, dest_path)
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=dest_path)
         
-        config = ConversionConfig()
+        config = self.default_config
         results = process_batch(self.input_dir, self.output_dir, config)
         
         # Should have 1 successful conversion
@@ -144,13 +234,10 @@ class TestProcessBatch(unittest.TestCase):
     def test_process_multiple_images(self):
         """Test batch processing with multiple images."""
         # Create multiple test images
-        img1_path = create_simple_square_image(size=4, color=(255, 0, 0))
-        img2_path = create_two_region_image()
-        
-        shutil.move(img1_path, self.input_dir / "image1.png")
-        shutil.move(img2_path, self.input_dir / "image2.png")
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / "image1.png")
+        create_two_region_image(filepath=self.input_dir / "image2.png")
         
-        config = ConversionConfig()
+        config = self.default_config
         results = process_batch(self.input_dir, self.output_dir, config)
         
         # Should have 2 successful conversions
@@ -168,13 +255,9 @@ class TestProcessBatch(unittest.TestCase):
         # We use a small image (50x50) but adjust max_size to make it exceed the threshold
         test_size = 50
         
-        # Create solid color image (fast with numpy optimization)
-        positions = [(x, y) for x in range(test_size) for y in range(test_size)]
-        colors = {(255, 0, 0, 255): positions}
-        img_path = create_test_image(test_size, test_size, colors)
-        
+        # Create solid color image
         dest_path = self.input_dir / "highres.png"
-        shutil.move(img_path, dest_path)
+        create_solid_image(test_size, test_size, (255, 0, 0, 255), filepath=dest_path)
         
         # With skip_checks=True, should process successfully
         # Set max_size small enough that our 50px image exceeds the recommended resolution
@@ -194,13 +277,9 @@ class TestProcessBatch(unittest.TestCase):
         # We use a small image (50x50) but adjust max_size to make it exceed the threshold
         test_size = 50
         
-        # Create solid color image (fast with numpy optimization)
-        positions = [(x, y) for x in range(test_size) for y in range(test_size)]
-        colors = {(255, 0, 0, 255): positions}
-        img_path = create_test_image(test_size, test_size, colors)
-        
+        # Create solid color image
         dest_path = self.input_dir / "highres.png"
-        shutil.move(img_path, dest_path)
+        create_solid_image(test_size, test_size, (255, 0, 0, 255), filepath=dest_path)
         
         # With batch_mode=True but skip_checks=False, should skip due to resolution warning
         # Set max_size small enough that our 50px image exceeds the recommended resolution
@@ -222,14 +301,8 @@ class TestProcessBatch(unittest.TestCase):
     def test_process_with_too_many_colors(self):
         """Test batch processing with image having too many colors."""
         # Create image with 3 colors but set max_colors=2
-        colors = {
-            (255, 0, 0, 255): [(0, 0)],
-            (0, 255, 0, 255): [(1, 0)],
-            (0, 0, 255, 255): [(0, 1)]
-        }
-        img_path = create_test_image(2, 2, colors)
         dest_path = self.input_dir / "multicolor.png"
-        shutil.move(img_path, dest_path)
+        create_indexed_image(2, 2, *THREE_COLOR_PIXELS, filepath=dest_path)
         
         config = ConversionConfig(max_colors=2)
         results = process_batch(self.input_dir, self.output_dir, config)
@@ -247,13 +320,12 @@ class TestProcessBatch(unittest.TestCase):
     def test_process_ignores_non_image_files(self):
         """Test that batch processing ignores non-image files."""
         # Create a test image and a non-image file
-        img_path = create_simple_square_image(size=4, color=(255, 0, 0))
-        shutil.move(img_path, self.input_dir / "test.png")
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / "test.png")
         
         # Create a non-image file
         (self.input_dir / "readme.txt").write_text("Not an image")
         
-        config = ConversionConfig()
+        config = self.default_config
         results = process_batch(self.input_dir, self.output_dir, config)
         
         # Should only process the image file
@@ -267,10 +339,9 @@ class TestProcessBatch(unittest.TestCase):
         self.assertFalse(self.output_dir.exists())
         
         # Create a test image
-        img_path = create_simple_square_image(size=4, color=(255, 0, 0))
-        shutil.move(img_path, self.input_dir / "test.png")
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / "test.png")
         
-        config = ConversionConfig()
+        config = self.default_config
         results = process_batch(self.input_dir, self.output_dir, config)
         
         # Output folder should now exist
@@ -280,25 +351,15 @@ class TestProcessBatch(unittest.TestCase):
     def test_process_mixed_results(self):
         """Test batch processing with mix of successful, skipped, and failed conversions."""
         # Create a successful image (low resolution)
-        img1_path = create_simple_square_image(size=4, color=(255, 0, 0))
-        shutil.move(img1_path, self.input_dir / "good.png")
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / "good.png")
         
         # Create a high-resolution image (will be skipped)
         # Use small 50x50 image but adjust max_size to trigger warning
         test_size = 50
-        positions = [(x, y) for x in range(test_size) for y in range(test_size)]
-        colors = {(255, 0, 0, 255): positions}
-        img2_path = create_test_image(test_size, test_size, colors)
-        shutil.move(img2_path, self.input_dir / "highres.png")
+        create_solid_image(test_size, test_size, (255, 0, 0, 255), filepath=self.input_dir / "highres.png")
         
         # Create an image with too many colors (will fail)
-        colors = {
-            (255, 0, 0, 255): [(0, 0)],
-            (0, 255, 0, 255): [(1, 0)],
-            (0, 0, 255, 255): [(0, 1)]
-        }
-        img3_path = create_test_image(2, 2, colors)
-        shutil.move(img3_path, self.input_dir / "multicolor.png")
+        create_indexed_image(2, 2, *THREE_COLOR_PIXELS, filepath=self.input_dir / "multicolor.png")
         
         # Configure: max_colors=2 (causes fail), max_size=20 (causes skip)
         config = ConversionConfig(max_colors=2, batch_mode=True, max_size_mm=20.0)
@@ -316,13 +377,10 @@ class TestProcessBatch(unittest.TestCase):
         subfolder.mkdir()
         
         # Create images at root and subfolder level
-        img1_path = create_simple_square_image(size=4, color=(255, 0, 0))
-        img2_path = create_simple_square_image(size=4, color=(0, 255, 0))
-        
-        shutil.move(img1_path, self.input_dir / "root.png")
-        shutil.move(img2_path, subfolder / "sub.png")
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / "root.png")
+        create_simple_square_image(size=4, color=(0, 255, 0), filepath=subfolder / "sub.png")
         
-        config = ConversionConfig()
+        config = self.default_config
         results = process_batch(self.input_dir, self.output_dir, config, recurse=True)
         
         # Should process both images
@@ -338,10 +396,10 @@ class TestProcessBatch(unittest.TestCase):
         input_files = [item['input_file'] for item in results['success']]
         output_files = [item['output_file'] for item in results['success']]
         self.assertIn('root.png', input_files)
-        # Use os.path.join or normalize path separators for cross-platform compatibility
-        self.assertIn(str(Path('subfolder/sub.png')), input_files)
+        # Expected relative paths use the platform separator (see module constants)
+        self.assertIn(SUBFOLDER_SUB_PNG, input_files)
         self.assertIn('root_model.3mf', output_files)
-        self.assertIn(str(Path('subfolder/sub_model.3mf')), output_files)
+        self.assertIn(SUBFOLDER_SUB_3MF, output_files)
     
     def test_process_recursive_multiple_levels(self):
         """Test batch processing with recurse=True on multiple nested levels."""
@@ -349,22 +407,15 @@ class TestProcessBatch(unittest.TestCase):
         level1 = self.input_dir / "level1"
         level2 = level1 / "level2"
         level3 = level2 / "level3"
-        level1.mkdir()
-        level2.mkdir()
-        level3.mkdir()
+        level3.mkdir(parents=True)
         
         # Create images at different nesting levels
-        img1_path = create_simple_square_image(size=4, color=(255, 0, 0))
-        img2_path = create_simple_square_image(size=4, color=(0, 255, 0))
-        img3_path = create_simple_square_image(size=4, color=(0, 0, 255))
-        img4_path = create_simple_square_image(size=4, color=(255, 255, 0))
-        
-        shutil.move(img1_path, self.input_dir / "root.png")
-        shutil.move(img2_path, level1 / "l1.png")
-        shutil.move(img3_path, level2 / "l2.png")
-        shutil.move(img4_path, level3 / "l3.png")
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / "root.png")
+        create_simple_square_image(size=4, color=(0, 255, 0), filepath=level1 / "l1.png")
+        create_simple_square_image(size=4, color=(0, 0, 255), filepath=level2 / "l2.png")
+        create_simple_square_image(size=4, color=(255, 255, 0), filepath=level3 / "l3.png")
         
-        config = ConversionConfig()
+        config = self.default_config
         results = process_batch(self.input_dir, self.output_dir, config, recurse=True)
         
         # Should process all 4 images
@@ -379,9 +430,9 @@ class TestProcessBatch(unittest.TestCase):
         # Check relative paths are correct
         input_files = [item['input_file'] for item in results['success']]
         self.assertIn('root.png', input_files)
-        self.assertIn(str(Path('level1/l1.png')), input_files)
-        self.assertIn(str(Path('level1/level2/l2.png')), input_files)
-        self.assertIn(str(Path('level1/level2/level3/l3.png')), input_files)
+        self.assertIn(LEVEL1_PNG, input_files)
+        self.assertIn(LEVEL2_PNG, input_files)
+        self.assertIn(LEVEL3_PNG, input_files)
     
     def test_process_non_recursive_ignores_subfolders(self):
         """Test that process_batch with recurse=False ignores images in subfolders."""
@@ -390,13 +441,10 @@ class TestProcessBatch(unittest.TestCase):
         subfolder.mkdir()
         
         # Create images at root and subfolder level
-        img1_path = create_simple_square_image(size=4, color=(255, 0, 0))
-        img2_path = create_simple_square_image(size=4, color=(0, 255, 0))
-        
-        shutil.move(img1_path, self.input_dir / "root.png")
-        shutil.move(img2_path, subfolder / "sub.png")
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / "root.png")
+        create_simple_square_image(size=4, color=(0, 255, 0), filepath=subfolder / "sub.png")
         
-        config = ConversionConfig()
+        config = self.default_config
         results = process_batch(self.input_dir, self.output_dir, config, recurse=False)
         
         # Should only process the root image
@@ -414,16 +462,12 @@ class TestProcessBatch(unittest.TestCase):
         subfolder.mkdir()
         
         # Create a successful image at root
-        img1_path = create_simple_square_image(size=4, color=(255, 0, 0))
-        shutil.move(img1_path, self.input_dir / "good.png")
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / "good.png")
         
         # Create a high-resolution image in subfolder (will be skipped)
         # Use small 50x50 image but adjust max_size to trigger warning
         test_size = 50
-        positions = [(x, y) for x in range(test_size) for y in range(test_size)]
-        colors = {(255, 0, 0, 255): positions}
-        img2_path = create_test_image(test_size, test_size, colors)
-        shutil.move(img2_path, subfolder / "highres.png")
+        create_solid_image(test_size, test_size, (255, 0, 0, 255), filepath=subfolder / "highres.png")
         
         # Configure with max_size=20 to trigger skip on 50px image
         config = ConversionConfig(batch_mode=True, max_size_mm=20.0)
@@ -435,23 +479,94 @@ class TestProcessBatch(unittest.TestCase):
         
         # Check relative paths include subfolder
         self.assertEqual(results['success'][0]['input_file'], 'good.png')
-        self.assertEqual(results['skipped'][0]['input_file'], str(Path('subfolder/highres.png')))
-
+        self.assertEqual(results['skipped'][0]['input_file'], SUBFOLDER_HIGHRES_PNG)
+    
+    def test_process_with_worker_processes_matches_serial(self):
+        """Test that converting in worker processes gives the same results in the same order."""
+        subfolder = self.input_dir / "subfolder"
+        subfolder.mkdir()
+        create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / "good.png")
+        create_two_region_image(filepath=subfolder / "two.png")
+        colors = {
+            (255, 0, 0, 255): [(0, 0)],
+            (0, 255, 0, 255): [(1, 0)],
+            (0, 0, 255, 255): [(0, 1)],
+            (255, 255, 0, 255): [(1, 1)]
+        }
+        create_test_image(2, 2, colors, filepath=self.input_dir / "multicolor.png")
+        
+        config = ConversionConfig(max_colors=3, batch_mode=True)
+        serial = process_batch(self.input_dir, self.output_dir, config, recurse=True, workers=1)
+        # Every test image is small - send them all to the workers anyway
+        with patch.object(cli, '_INLINE_BATCH_MAX_PIXELS', 0):
+            parallel = process_batch(self.input_dir, self.output_dir, config, recurse=True, workers=2)
+        
+        # Everything but the file size (3MF files embed fresh UUIDs)
+        def _without_size(results):
+            return {
+                key: [{k: v for k, v in item.items() if k != 'file_size'} for item in items]
+                for key, items in results.items()
+            }
+        self.assertEqual(_without_size(parallel), _without_size(serial))
+        self.assertEqual(
+            [item['input_file'] for item in parallel['success']],
+            ['good.png', SUBFOLDER_TWO_PNG]
+        )
+        self.assertEqual(len(parallel['failed']), 1)
+    
+    def test_small_images_skip_worker_processes(self):
+        """Test that a batch of only small images never starts worker processes."""
+        for name in ("a.png", "b.png"):
+            create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / name)
+        
+        with patch.object(cli, 'ProcessPoolExecutor') as mock_pool:
+            results = process_batch(self.input_dir, self.output_dir, self.default_config, workers=4)
+        
+        mock_pool.assert_not_called()
+        self.assertEqual(len(results['success']), 2)
+    
+    def test_error_while_reporting_cancels_queued_conversions(self):
+        """Test that an exception in the reporting loop doesn't wait for the rest of the batch."""
+        for name in ("a.png", "b.png"):
+            create_simple_square_image(size=4, color=(255, 0, 0), filepath=self.input_dir / name)
+        
+        with patch.object(cli, '_INLINE_BATCH_MAX_PIXELS', 0), \
+                patch.object(cli, 'ProcessPoolExecutor') as mock_pool:
+            mock_pool.return_value.submit.return_value.result.side_effect = KeyboardInterrupt
+            with self.assertRaises(KeyboardInterrupt):
+                process_batch(self.input_dir, self.output_dir, self.default_config, workers=2)
+        
+        mock_pool.return_value.shutdown.assert_called_once_with(cancel_futures=True)
+    
+    def test_worker_initializer_appends_to_log_file(self):
+        """Test that a worker process logs to the file main() opened."""
+        log_path = str(self.output_dir / "batch.log")
+    
+        with patch.object(cli.logging, 'basicConfig') as mock_config:
+            cli._init_batch_worker(False, log_path)
+    
+        _, kwargs = mock_config.call_args
+        self.assertEqual(kwargs['filename'], log_path)
+        self.assertEqual(kwargs['filemode'], 'a')
+        self.assertEqual(kwargs['level'], cli.logging.DEBUG)
+    
 
 class TestGenerateBatchSummary(unittest.TestCase):
     """Test the generate_batch_summary function."""
     
-    def setUp(self):
-        """Set up temporary directories for testing."""
-        self.temp_dirs = []
-        self.output_dir = Path(tempfile.mkdtemp())
-        self.temp_dirs.append(self.output_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root that holds every test's output folder."""
+        cls.temp_root = Path(tempfile.mkdtemp())
     
-    def tearDown(self):
-        """Clean up test directories."""
-        for temp_dir in self.temp_dirs:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary root and every summary written into it."""
+        shutil.rmtree(cls.temp_root, ignore_errors=True)
+    
+    def setUp(self):
+        """Set up a temporary output directory for testing."""
+        self.output_dir = Path(tempfile.mkdtemp(dir=self.temp_root))
     
     def test_generate_summary_empty_results(self):
         """Test generating summary with no results."""
@@ -617,6 +732,23 @@ class TestGenerateBatchSummary(unittest.TestCase):
         self.assertTrue(filename.startswith("batch_summary_"))
         self.assertTrue(filename.endswith(".md"))
         self.assertIn("20250115143045", filename)
+    
+    def test_file_matches_formatted_summary(self):
+        """Test that the written file is exactly the in-memory rendering."""
+        results = {
+            'success': [],
+            'skipped': [{'input_file': 'highres.png', 'reason': 'Resolution warning'}],
+            'failed': [{'input_file': 'bad.png', 'error': 'Some error'}]
+        }
+        start_time = datetime(2025, 1, 1, 12, 0, 0)
+        end_time = datetime(2025, 1, 1, 12, 0, 15)
+        
+        summary_path = generate_batch_summary(results, self.output_dir, start_time, end_time)
+        
+        self.assertEqual(
+            Path(summary_path).read_text(encoding='utf-8'),
+            _format_batch_summary(results, start_time, end_time)
+        )
 
 
 class TestConversionConfigBatchFlags(unittest.TestCase):
@@ -148,6 +148,16 @@ class TestFormatTitleFromFilename(unittest.TestCase):
                 result = format_title_from_filename(filename)
                 self.assertEqual(result, expected)
     
+    def test_results_are_cached(self):
+        """Test that formatting the same filename again is answered from the cache."""
+        format_title_from_filename.cache_clear()
+        first = format_title_from_filename("nes-samus.png")
+        second = format_title_from_filename("nes-samus.png")
+        
+        self.assertEqual(first, "Nes Samus")
+        self.assertIs(second, first)
+        self.assertEqual(format_title_from_filename.cache_info().hits, 1)
+    
     def test_real_world_game_filenames(self):
         """Test comprehensive list of 50 real-world game screenshot filenames."""
         # This test validates the function against actual filenames from the project
@@ -282,6 +292,13 @@ class TestConversionConfigTitleGeneration(unittest.TestCase):
         self.assertNotIn("source_image_name", repr_str)
         self.assertNotIn("source_image_path", repr_str)
         self.assertNotIn("model_title", repr_str)
+    
+    def test_unknown_attribute_rejected(self):
+        """Test that assigning a field that doesn't exist raises instead of being stored."""
+        config = ConversionConfig()
+        self.assertFalse(hasattr(config, '__dict__'))
+        with self.assertRaises(AttributeError):
+            config.model_tilte = "Typo"
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Tests image loading, scaling calculations, and PixelData functionality.
 """
 
 import unittest
+import numpy as np
 import os
 import sys
 from pathlib import Path
@@ -84,6 +85,55 @@ class TestPixelData(unittest.TestCase):
         repr_str = repr(data)
         self.assertIn("10x20px", repr_str)
         self.assertIn("20.0x40.0mm", repr_str)
+    
+    def test_colors_array_matches_pixels(self):
+        """Test that the dense arrays and the dict describe the same pixels."""
+        pixels = {(0, 0): (255, 0, 0, 255), (2, 1): (0, 255, 0, 128)}
+        data = PixelData(width=3, height=2, pixel_size_mm=1.0, pixels=pixels)
+        
+        self.assertEqual(data.colors.shape, (2, 3, 4))
+        self.assertEqual(data.colors.dtype, np.uint8)
+        self.assertEqual(data.colors[1, 2].tolist(), [0, 255, 0, 128])
+        self.assertEqual(int(data.mask.sum()), 2)
+        self.assertFalse(data.mask[0, 1])
+    
+    def test_pixels_from_colors_array(self):
+        """Test that a PixelData built from arrays yields the dict in image row order."""
+        colors = np.zeros((2, 2, 4), dtype=np.uint8)
+        colors[0, 0] = (255, 0, 0, 255)   # Bottom-left
+        colors[1, 1] = (0, 0, 255, 255)   # Top-right
+        data = PixelData(width=2, height=2, pixel_size_mm=1.0, colors=colors)
+        
+        # Top image row first, like the old per-pixel extraction
+        self.assertEqual(
+            list(data.pixels.items()),
+            [((1, 1), (0, 0, 255, 255)), ((0, 0), (255, 0, 0, 255))]
+        )
+        self.assertEqual(data.get_unique_colors(), {(255, 0, 0), (0, 0, 255)})
+        self.assertIn("2 non-transparent pixels", repr(data))
+    
+    def test_pixel_arrays_follow_dict_order(self):
+        """Test that both representations give coordinate/RGBA arrays in pixels dict order."""
+        pixels = {(2, 1): (0, 255, 0, 255), (0, 1): (9, 9, 9, 128), (1, 0): (255, 0, 0, 255)}
+        from_dict = PixelData(width=3, height=2, pixel_size_mm=1.0, pixels=pixels)
+        from_array = PixelData(width=3, height=2, pixel_size_mm=1.0, colors=from_dict.colors)
+        
+        for data in (from_dict, from_array):
+            coords, rgba = data._pixel_arrays()
+            self.assertEqual(rgba.dtype, np.uint8)
+            self.assertEqual(
+                list(zip(map(tuple, coords.tolist()), map(tuple, rgba.tolist()))),
+                list(data.pixels.items())
+            )
+        # Array-backed data answers without building the dict
+        fresh = PixelData(width=3, height=2, pixel_size_mm=1.0, colors=from_dict.colors)
+        fresh._pixel_arrays()
+        self.assertIsNone(fresh._pixels)
+    
+    def test_requires_pixels_or_colors(self):
+        """Test that PixelData can't be created without any pixel data."""
+        with self.assertRaises(ValueError):
+            PixelData(width=1, height=1, pixel_size_mm=1.0)
 
 
 class TestCalculatePixelSize(unittest.TestCase):
@@ -7,14 +7,18 @@ Tests mesh generation for regions and backing plates.
 import unittest
 import sys
 from pathlib import Path
+import numpy as np
 
 # Add parent directory to path to import the package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from unittest.mock import patch
+from pixel_to_3mf import mesh_generator
 from pixel_to_3mf.mesh_generator import (
     Mesh,
     generate_region_mesh,
-    generate_backing_plate
+    generate_backing_plate,
+    generate_backing_plate_from_mask
 )
 from pixel_to_3mf.region_merger import Region
 from pixel_to_3mf.image_processor import PixelData
@@ -43,6 +47,31 @@ class TestMesh(unittest.TestCase):
         repr_str = repr(mesh)
         self.assertIn("vertices=2", repr_str)
         self.assertIn("triangles=0", repr_str)
+    
+    def test_mesh_array_views(self):
+        """Test that the NumPy views match the lists and are cached."""
+        mesh = Mesh(vertices=[(0.0, 0.0, 0.0), (1.0, 0.0, 0.5), (0.0, 1.0, 0.0)], triangles=[(0, 1, 2)])
+        
+        self.assertEqual(mesh.vertices_np.shape, (3, 3))
+        self.assertEqual(mesh.vertices_np.tolist(), [list(v) for v in mesh.vertices])
+        self.assertEqual(mesh.triangles_np.tolist(), [[0, 1, 2]])
+        self.assertIs(mesh.vertices_np, mesh.vertices_np)
+        
+        empty = Mesh(vertices=[], triangles=[])
+        self.assertEqual(empty.vertices_np.shape, (0, 3))
+        self.assertEqual(empty.triangles_np.shape, (0, 3))
+    
+    def test_mesh_from_arrays(self):
+        """Test that a mesh built from arrays has matching lists and keeps the arrays."""
+        vertex_array = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.5], [0.0, 1.0, 0.0]])
+        triangle_array = np.array([[0, 1, 2]], dtype=np.intp)
+        mesh = Mesh.from_arrays(vertex_array, triangle_array)
+        
+        self.assertEqual(mesh.vertices, [(0.0, 0.0, 0.0), (1.0, 0.0, 0.5), (0.0, 1.0, 0.0)])
+        self.assertEqual(mesh.triangles, [(0, 1, 2)])
+        self.assertIs(type(mesh.triangles[0][0]), int)
+        self.assertIs(mesh.vertices_np, vertex_array)
+        self.assertIs(mesh.triangles_np, triangle_array)
 
 
 class TestGenerateRegionMesh(unittest.TestCase):
@@ -206,6 +235,42 @@ class TestGenerateBackingPlate(unittest.TestCase):
         # Should cover at least the pixels present
         self.assertGreaterEqual(max(x_coords), 8.0)  # (3+1) * 2.0
         self.assertGreaterEqual(max(y_coords), 10.0)  # (4+1) * 2.0
+    
+    def test_backing_plate_ring_is_closed_and_shares_corners(self):
+        """Test that a ring with a hole shares corner vertices and is watertight."""
+        # 3x3 ring around a transparent center (8 pixels, 16 distinct corners)
+        pixels = {(x, y): (255, 0, 0, 255) for x in range(3) for y in range(3) if (x, y) != (1, 1)}
+        pixel_data = PixelData(width=4, height=4, pixel_size_mm=1.0, pixels=pixels)
+        
+        mesh = generate_backing_plate(pixel_data, ConversionConfig(base_height_mm=1.0))
+        
+        # 16 corners on top and bottom; 4 face triangles per pixel plus
+        # 2 per exposed edge (12 outer + 4 inner)
+        self.assertEqual(len(mesh.vertices), 32)
+        self.assertEqual(len(set(mesh.vertices)), 32)
+        self.assertEqual(len(mesh.triangles), 8 * 4 + 16 * 2)
+        
+        # Every directed edge is matched by the reverse edge of a neighbor
+        edges = [(tri[i], tri[(i + 1) % 3]) for tri in mesh.triangles for i in range(3)]
+        self.assertEqual(sorted(edges), sorted((b, a) for a, b in edges))
+    
+    def test_backing_plate_from_mask_uses_same_dispatch(self):
+        """Test that a footprint mask gives the same plate as the matching PixelData."""
+        config = ConversionConfig(base_height_mm=1.0)
+        mask = np.zeros((3, 4), dtype=bool)
+        mask[0, :3] = mask[2, 1:] = True
+        pixels = {(int(x), int(y)): (255, 0, 0, 255) for y, x in zip(*np.nonzero(mask))}
+        
+        for optimized in (False, True):
+            with self.subTest(optimized=optimized), \
+                    patch.object(mesh_generator, 'USE_OPTIMIZED_MESH_GENERATION', optimized):
+                expected = generate_backing_plate(PixelData(width=4, height=3, pixel_size_mm=0.5, pixels=pixels), config)
+                actual = generate_backing_plate_from_mask(mask, 0.5, config)
+                self.assertEqual(actual.vertices, expected.vertices)
+                self.assertEqual(actual.triangles, expected.triangles)
+        
+        # A full frame is the single box
+        self.assertEqual(len(generate_backing_plate_from_mask(np.ones((3, 4), dtype=bool), 0.5, config).triangles), 12)
 
 
 class TestMeshValidity(unittest.TestCase):
@@ -41,14 +41,11 @@ class TestOperationOrder(unittest.TestCase):
         - 5px transparent border on all sides
         - 10x10 red center
         """
-        img = Image.new('RGBA', (20, 20), (0, 0, 0, 0))
-        pixels = img.load()
-        assert pixels is not None  # Type narrowing for Pyright
+        arr = np.zeros((20, 20, 4), dtype=np.uint8)
         
         # Fill center 10x10 with red
-        for y in range(5, 15):
-            for x in range(5, 15):
-                pixels[x, y] = (255, 0, 0, 255)
+        arr[5:15, 5:15] = (255, 0, 0, 255)
+        img = Image.fromarray(arr, mode='RGBA')
         
         # Save to temp file
         fd, test_path = tempfile.mkstemp(suffix='.png')
@@ -100,16 +97,13 @@ class TestOperationOrder(unittest.TestCase):
         be in the reduced palette.
         """
         # Create image with multiple colors
-        img = Image.new('RGBA', (10, 10))
-        pixels = img.load()
-        assert pixels is not None  # Type narrowing for Pyright
+        arr = np.zeros((10, 10, 4), dtype=np.uint8)
+        arr[..., 3] = 255
         
         # Create a gradient of 20 different colors
-        for i in range(10):
-            for j in range(10):
-                # Each pixel gets a slightly different red value
-                r = 100 + (i * 10) + j
-                pixels[j, i] = (r, 0, 0, 255)
+        # Each pixel gets a slightly different red value: 100 + row * 10 + column
+        arr[..., 0] = 100 + np.arange(100).reshape(10, 10)
+        img = Image.fromarray(arr, mode='RGBA')
         
         fd, test_path = tempfile.mkstemp(suffix='.png')
         os.close(fd)
@@ -188,19 +182,16 @@ class TestOperationOrder(unittest.TestCase):
         This is the most complex case and tests the full pipeline.
         """
         # Create image with MANY distinct colors and transparent padding
-        img = Image.new('RGBA', (20, 20), (0, 0, 0, 0))
-        pixels = img.load()
-        assert pixels is not None  # Type narrowing for Pyright
+        arr = np.zeros((20, 20, 4), dtype=np.uint8)
         
         # Fill center with many distinct colors (100 different colors)
         # This ensures we definitely exceed the quantization target
-        color_idx = 0
-        for y in range(5, 15):
-            for x in range(5, 15):
-                r = color_idx % 256
-                g = (color_idx // 10) % 256
-                pixels[x, y] = (r, g, 0, 255)
-                color_idx += 1
+        # (row-major color index: red = index, green = index // 10)
+        color_idx = np.arange(100).reshape(10, 10)
+        arr[5:15, 5:15, 0] = color_idx % 256
+        arr[5:15, 5:15, 1] = (color_idx // 10) % 256
+        arr[5:15, 5:15, 3] = 255
+        img = Image.fromarray(arr, mode='RGBA')
         
         fd, test_path = tempfile.mkstemp(suffix='.png')
         os.close(fd)
@@ -208,14 +199,7 @@ class TestOperationOrder(unittest.TestCase):
         self.test_files.append(test_path)
         
         # Count original colors before processing
-        # Note: pixels[x, y] returns RGBA tuple for RGBA images
-        pixel_colors = set()
-        for y in range(5, 15):
-            for x in range(5, 15):
-                pixel = pixels[x, y]
-                assert isinstance(pixel, tuple) and len(pixel) >= 3
-                pixel_colors.add(pixel[:3])
-        original_colors = len(pixel_colors)
+        original_colors = len(np.unique(arr[5:15, 5:15, :3].reshape(-1, 3), axis=0))
         
         config = ConversionConfig(
             auto_crop=True,        # Remove transparent border
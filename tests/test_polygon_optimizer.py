@@ -9,6 +9,7 @@ Both paths produce manifold meshes with identical visual results.
 import unittest
 from typing import Set, Tuple
 from shapely.geometry import box, Polygon
+from shapely.ops import unary_union
 
 from pixel_to_3mf.polygon_optimizer import (
     pixels_to_polygon,
@@ -89,6 +90,16 @@ class TestPixelsToPolygon(unittest.TestCase):
         # With 2mm pixels (area should be 4x larger)
         poly2 = pixels_to_polygon(pixels, pixel_size_mm=2.0)
         self.assertAlmostEqual(poly2.area, 16.0)
+    
+    def test_matches_union_of_pixel_squares(self):
+        """Row-run boxes should give the same outline as one square per pixel."""
+        # Comb with gaps in some rows and a hole, so rows have several runs
+        pixels = {(x, y) for x in range(7) for y in range(5)} - {(2, 2), (3, 2), (5, 0), (5, 1), (1, 4)}
+        
+        poly = pixels_to_polygon(pixels, pixel_size_mm=0.5)
+        expected = unary_union([box(x * 0.5, y * 0.5, (x + 1) * 0.5, (y + 1) * 0.5) for x, y in pixels])
+        self.assertTrue(poly.equals(expected))
+        self.assertEqual(len(list(poly.interiors)), 1)
 
 
 class TestTriangulatePolygon(unittest.TestCase):
@@ -211,6 +222,26 @@ class TestExtrudePolygonToMesh(unittest.TestCase):
         self.assertIn(-2.0, z_values)
         self.assertIn(3.0, z_values)
 
+    def test_layers_mirror_triangulation(self):
+        """Top vertex i and bottom vertex n+i should share the 2D vertex i."""
+        poly = box(0, 0, 3, 2).difference(box(1, 0.5, 2, 1.5))
+        vertices_2d, triangles_2d, segments_2d = triangulate_polygon_2d(poly)
+        n = len(vertices_2d)
+
+        mesh = extrude_polygon_to_mesh(
+            poly, triangles_2d, vertices_2d, segments_2d,
+            z_bottom=-1.0, z_top=0.5
+        )
+
+        for i, (x, y) in enumerate(vertices_2d):
+            self.assertEqual(mesh.vertices[i], (x, y, 0.5))
+            self.assertEqual(mesh.vertices[n + i], (x, y, -1.0))
+        # Bottom face is the top face shifted by n with reversed winding
+        num_faces = len(triangles_2d)
+        for (t0, t1, t2), bottom in zip(mesh.triangles[:num_faces], mesh.triangles[num_faces:2 * num_faces]):
+            self.assertEqual(bottom, (t0 + n, t2 + n, t1 + n))
+        self.assertTrue(all(type(i) is int for tri in mesh.triangles for i in tri))
+
 
 class TestOptimizedMeshGeneration(unittest.TestCase):
     """Test optimized mesh generation maintains manifold properties."""
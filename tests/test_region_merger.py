@@ -5,6 +5,7 @@ Tests flood fill algorithm and region merging functionality.
 """
 
 import unittest
+import numpy as np
 import os
 import sys
 from pathlib import Path
@@ -12,6 +13,8 @@ from pathlib import Path
 # Add parent directory to path to import the package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from unittest.mock import patch
+from pixel_to_3mf import region_merger
 from pixel_to_3mf.region_merger import (
     Region,
     flood_fill,
@@ -20,6 +23,7 @@ from pixel_to_3mf.region_merger import (
 )
 from pixel_to_3mf.image_processor import load_image, PixelData
 from pixel_to_3mf.config import ConversionConfig
+from pixel_to_3mf.pixel_to_3mf import _create_filtered_pixel_data
 from tests.helpers import (
     create_simple_square_image,
     create_two_region_image,
@@ -51,6 +55,31 @@ class TestRegion(unittest.TestCase):
         repr_str = repr(region)
         self.assertIn("RGB(255, 0, 0)", repr_str)
         self.assertIn("pixels=2", repr_str)
+    
+    def test_coords_match_pixels(self):
+        """Test that coords and pixels describe the same pixels either way round."""
+        pixels = {(0, 0), (3, 1), (2, 5)}
+        from_set = Region(color=(255, 0, 0), pixels=pixels)
+        self.assertEqual(from_set.coords.dtype, np.int32)
+        self.assertEqual(from_set.coords.shape, (3, 2))
+        self.assertEqual({tuple(row) for row in from_set.coords.tolist()}, pixels)
+        
+        from_array = Region(color=(255, 0, 0), coords=from_set.coords)
+        self.assertEqual(from_array.pixels, pixels)
+        self.assertIn("pixels=3", repr(from_array))
+    
+    def test_reassigning_pixels_resets_coords(self):
+        """Test that coords follow a replaced pixel set."""
+        region = Region(color=(255, 0, 0), pixels={(0, 0), (1, 0)})
+        self.assertEqual(len(region.coords), 2)
+        
+        region.pixels = {(5, 5)}
+        self.assertEqual(region.coords.tolist(), [[5, 5]])
+    
+    def test_requires_pixels_or_coords(self):
+        """Test that a region can't be created without any pixel data."""
+        with self.assertRaises(ValueError):
+            Region(color=(255, 0, 0))
 
 
 class TestFloodFill(unittest.TestCase):
@@ -171,6 +200,33 @@ class TestMergeRegions(unittest.TestCase):
         self.assertEqual(regions[0].color, (255, 0, 0))
         self.assertEqual(len(regions[0].pixels), 16)  # 4x4
     
+    def test_pixels_edited_in_place_are_merged_afresh(self):
+        """Test that merging again after editing pixel_data.pixels sees the edit."""
+        red = (255, 0, 0, 255)
+        pixel_data = PixelData(width=3, height=1, pixel_size_mm=1.0, pixels={(0, 0): red, (2, 0): red})
+        config = ConversionConfig(connectivity=4)
+        self.assertEqual(len(merge_regions(pixel_data, config)), 2)
+        
+        # Filling the gap joins the two pixels into one region
+        pixel_data.pixels[(1, 0)] = red
+        self.assertEqual(len(merge_regions(pixel_data, config)), 1)
+    
+    def test_pixels_deleted_in_place_from_loaded_image(self):
+        """Test that deleting from an array-backed image's pixels dict reaches every view."""
+        filepath = create_two_region_image()
+        self.test_files.append(filepath)
+        config = ConversionConfig(max_size_mm=200.0)
+        pixel_data = load_image(filepath, config)
+        
+        del pixel_data.pixels[(0, 3)]
+        regions = merge_regions(pixel_data, config)
+        
+        self.assertEqual(sum(len(region.pixels) for region in regions), 7)
+        self.assertEqual(int(pixel_data.mask.sum()), 7)
+        self.assertFalse(pixel_data.colors[3, 0, 3])
+        filtered = _create_filtered_pixel_data(regions, pixel_data)
+        self.assertEqual(set(filtered.pixels), set(pixel_data.pixels))
+    
     def test_merge_two_separate_regions(self):
         """Test merging on image with two separate colored regions."""
         filepath = create_two_region_image()
@@ -229,6 +285,43 @@ class TestMergeRegions(unittest.TestCase):
         self.assertEqual(len(regions), 0)
 
 
+@unittest.skipUnless(region_merger.SCIPY_AVAILABLE, "scipy not installed")
+class TestMergeRegionsLabeled(unittest.TestCase):
+    """Test that the SciPy connected-components path matches the flood fill."""
+    
+    def test_matches_flood_fill(self):
+        """Test same regions, same pixels and same order for 4- and 8-connectivity."""
+        # Two colors in a checkerboard-ish layout with a gap, in scrambled dict order
+        pixels = {}
+        for (x, y) in [(3, 0), (0, 0), (1, 1), (2, 2), (5, 3), (0, 3), (1, 0), (4, 4), (2, 0), (5, 4)]:
+            color = (255, 0, 0, 255) if (x + y) % 2 == 0 else (0, 0, 255, 255)
+            pixels[(x, y)] = color
+        pixel_data = PixelData(width=6, height=5, pixel_size_mm=1.0, pixels=pixels)
+        
+        for connectivity in (4, 8):
+            with self.subTest(connectivity=connectivity):
+                config = ConversionConfig(connectivity=connectivity)
+                labeled = merge_regions(pixel_data, config)
+                with patch.object(region_merger, 'SCIPY_AVAILABLE', False):
+                    flooded = merge_regions(pixel_data, config)
+                self.assertEqual(
+                    [(r.color, r.pixels) for r in labeled],
+                    [(r.color, r.pixels) for r in flooded]
+                )
+    
+    def test_same_color_separated_by_other_color(self):
+        """Test that same-color areas joined only through another color stay apart."""
+        red, blue = (255, 0, 0, 255), (0, 0, 255, 255)
+        pixels = {(0, 0): red, (1, 0): blue, (2, 0): red}
+        pixel_data = PixelData(width=3, height=1, pixel_size_mm=1.0, pixels=pixels)
+        
+        regions = merge_regions(pixel_data, ConversionConfig(connectivity=4))
+        self.assertEqual(
+            [(r.color, r.pixels) for r in regions],
+            [((255, 0, 0), {(0, 0)}), ((0, 0, 255), {(1, 0)}), ((255, 0, 0), {(2, 0)})]
+        )
+
+
 class TestGetRegionBounds(unittest.TestCase):
     """Test getting bounding boxes for regions."""
     
@@ -268,6 +361,13 @@ class TestGetRegionBounds(unittest.TestCase):
         self.assertEqual(min_y, 0)
         self.assertEqual(max_y, 2)
     
+    def test_bounds_from_coords(self):
+        """Test bounds for a region built from a coordinate array."""
+        region = Region(color=(255, 0, 0), coords=np.array([[7, 2], [3, 9], [5, 4]], dtype=np.int32))
+        
+        self.assertEqual(get_region_bounds(region), (3, 7, 2, 9))
+        self.assertTrue(all(type(v) is int for v in get_region_bounds(region)))
+    
     def test_bounds_empty_region(self):
         """Test bounds for empty region."""
         region = Region(color=(255, 0, 0), pixels=set())
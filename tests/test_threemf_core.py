@@ -7,21 +7,28 @@ independent of the pixel-art-specific layer.
 """
 
 import unittest
+import io
 import sys
 import os
 import zipfile
 import tempfile
+import threading
+import uuid
 import xml.etree.ElementTree as ET
+import numpy as np
 from pathlib import Path
+from unittest.mock import patch
 
 # Add parent directory to path to import the package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from pixel_to_3mf import threemf_core
 from pixel_to_3mf.threemf_core import (
     ThreeMFWriter, ThreeMFMesh, ThreeMFObject,
     format_float, count_mesh_stats, validate_triangle_winding,
     calculate_model_bounds, calculate_model_center, create_centering_transform,
-    prettify_xml
+    prettify_xml,
+    write_pretty_xml
 )
 from tests.helpers import validate_3mf_structure
 
@@ -140,6 +147,24 @@ class TestFormatFloat(unittest.TestCase):
         self.assertEqual(result, "12345.68")
 
 
+class TestFormatFixedPoint(unittest.TestCase):
+    """Test fixed-point coordinate formatting used by the vertex emitter."""
+    
+    def test_matches_format_float(self):
+        """Test that fixed-point output matches format_float for typical values."""
+        for value in (0.0, 2.0, 2.5, 0.001, -1.5, 12345.678, 0.125, -0.25, 99.999):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    threemf_core._format_fixed_point(round(value * 1000)),
+                    format_float(value)
+                )
+    
+    def test_custom_precision(self):
+        """Test formatting with a different number of encoded decimals."""
+        self.assertEqual(threemf_core._format_fixed_point(314, precision=2), "3.14")
+        self.assertEqual(threemf_core._format_fixed_point(-5, precision=2), "-0.05")
+
+
 class TestThreeMFMesh(unittest.TestCase):
     """Test ThreeMFMesh dataclass."""
     
@@ -292,6 +317,27 @@ class TestValidateTriangleWinding(unittest.TestCase):
         result = validate_triangle_winding(mesh)
         # The cube is constructed with CCW winding on top face
         self.assertEqual(result, "CCW")
+    
+    def test_mixed_and_degenerate_top_triangles(self):
+        """Test that only non-degenerate top triangles decide the winding."""
+        vertices = [
+            (0.0, 0.0, 1.0), (1.0, 0.0, 1.0), (1.0, 1.0, 1.0), (2.0, 0.0, 1.0),
+            (0.0, 0.0, 0.0), (1.0, 1.0, 0.0), (1.0, 0.0, 0.0)
+        ]
+        ccw_top = (0, 1, 2)
+        cw_top = (0, 2, 1)
+        degenerate_top = (0, 1, 3)  # Collinear points
+        cw_bottom = (4, 5, 6)  # Not at max Z, ignored
+        
+        cases = [
+            ([ccw_top, degenerate_top, cw_bottom], "CCW"),
+            ([ccw_top, cw_top], "MIXED"),
+            ([degenerate_top, cw_bottom], "UNKNOWN"),
+        ]
+        for triangles, expected in cases:
+            with self.subTest(expected=expected):
+                mesh = ThreeMFMesh(vertices=vertices, triangles=triangles, metadata={})
+                self.assertEqual(validate_triangle_winding(mesh), expected)
 
 
 class TestCalculateModelBounds(unittest.TestCase):
@@ -475,6 +521,205 @@ class TestPrettifyXml(unittest.TestCase):
         
         self.assertIn("<?xml", result)
         self.assertIn("empty", result)
+    
+    def test_write_pretty_xml_matches_prettify_xml(self):
+        """Test that streaming a tree produces the same document as prettify_xml."""
+        elem = ET.Element("root")
+        child = ET.SubElement(elem, "child", name="caf\u00e9")
+        ET.SubElement(child, "grandchild")
+        
+        buffer = io.BytesIO()
+        write_pretty_xml(elem, buffer)
+        streamed = buffer.getvalue().decode('utf-8')
+        
+        self.assertTrue(streamed.startswith("<?xml"))
+        self.assertIn("encoding='UTF-8'", streamed)
+        self.assertEqual(streamed.split("?>", 1)[1], prettify_xml(elem).split("?>", 1)[1])
+
+
+class TestMeshArrays(unittest.TestCase):
+    """Test the cached NumPy views of mesh data."""
+    
+    def test_arrays_cached_until_reassigned(self):
+        """Test that array views are reused and refreshed on reassignment."""
+        mesh = ThreeMFMesh(vertices=[(0.0, 0.0, 0.0), (1.0, 2.0, 3.0)], triangles=[(0, 1, 1)], metadata={})
+        
+        first = mesh.vertices_np
+        self.assertIs(mesh.vertices_np, first)
+        np.testing.assert_array_equal(first, [[0, 0, 0], [1, 2, 3]])
+        self.assertEqual(mesh.triangles_np.dtype, np.intp)
+        
+        mesh.vertices = [(5.0, 5.0, 5.0)]
+        np.testing.assert_array_equal(mesh.vertices_np, [[5, 5, 5]])
+    
+    def test_mesh_equality_ignores_cache(self):
+        """Test that computing the arrays doesn't affect dataclass equality."""
+        a = ThreeMFMesh(vertices=[(1.0, 2.0, 3.0)], triangles=[], metadata={})
+        b = ThreeMFMesh(vertices=[(1.0, 2.0, 3.0)], triangles=[], metadata={})
+        a.vertices_np
+        
+        self.assertEqual(a, b)
+
+
+class TestTriplesToArray(unittest.TestCase):
+    """Test conversion of vertex/triangle lists to arrays."""
+    
+    def test_matches_np_asarray(self):
+        """Test that tuples, lists and arrays convert like np.asarray."""
+        rows = [(0.5, 1.0, -2.25), (3.0, 4.0, 5.0)]
+        
+        for value in (rows, [list(r) for r in rows], np.array(rows)):
+            with self.subTest(kind=type(value[0]).__name__):
+                result = threemf_core._triples_to_array(value, np.float64)
+                np.testing.assert_array_equal(result, np.asarray(rows, dtype=np.float64))
+                self.assertEqual(result.dtype, np.float64)
+    
+    def test_empty_input(self):
+        """Test that an empty list becomes a (0, 3) array."""
+        self.assertEqual(threemf_core._triples_to_array([], np.intp).shape, (0, 3))
+
+
+class TestUuid4Strings(unittest.TestCase):
+    """Test batched UUID generation."""
+    
+    def test_strings_are_unique_version_4_uuids(self):
+        """Test that each string parses as a distinct RFC 4122 version 4 UUID."""
+        strings = threemf_core._uuid4_strings(200)
+        
+        self.assertEqual(len(strings), 200)
+        self.assertEqual(len(set(strings)), 200)
+        for s in strings:
+            parsed = uuid.UUID(s)
+            self.assertEqual(str(parsed), s)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+    
+    def test_zero_count(self):
+        """Test that requesting no UUIDs returns an empty list."""
+        self.assertEqual(threemf_core._uuid4_strings(0), [])
+
+
+class TestObjectModelXml(unittest.TestCase):
+    """Test the text emitter for 3D/Objects/object_1.model."""
+    
+    NS = {'m': 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02'}
+    
+    def _objects(self, *meshes):
+        return [
+            ThreeMFObject(object_id=i, name=f"Part {i}", extruder_slot=1,
+                          transform=(0.0, 0.0, 0.0), mesh=mesh)
+            for i, mesh in enumerate(meshes, start=1)
+        ]
+    
+    def test_output_is_well_formed_with_formatted_values(self):
+        """Test that vertices and triangles round-trip through an XML parser."""
+        mesh = ThreeMFMesh(
+            vertices=[(0.0, 1.5, 2.25), (10.0, 0.125, 0.0), (3.0, 3.0, 3.0)],
+            triangles=[(0, 1, 2)],
+            metadata={}
+        )
+        
+        xml = threemf_core._generate_object_model_xml(self._objects(mesh))
+        root = ET.fromstring(xml.encode('utf-8'))
+        
+        vertices = root.findall('.//m:vertex', self.NS)
+        self.assertEqual(
+            [(v.get('x'), v.get('y'), v.get('z')) for v in vertices],
+            [("0", "1.5", "2.25"), ("10", "0.125", "0"), ("3", "3", "3")]
+        )
+        triangle = root.find('.//m:triangle', self.NS)
+        self.assertEqual((triangle.get('v1'), triangle.get('v2'), triangle.get('v3')), ("0", "1", "2"))
+        self.assertIsNotNone(root.find('m:build', self.NS))
+    
+    def test_indented_layout_and_empty_meshes(self):
+        """Test the indented one-element-per-line layout, including empty meshes."""
+        mesh = create_square_mesh()
+        empty = create_empty_mesh()
+        
+        xml = threemf_core._generate_object_model_xml(self._objects(mesh, empty), pretty=True)
+        root = ET.fromstring(xml.encode('utf-8'))
+        
+        self.assertTrue(xml.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<model '))
+        self.assertIn('        <vertices/>\n', xml)
+        self.assertIn('          <vertex x="1" y="1" z="0"/>\n', xml)
+        self.assertEqual(len(root.findall('.//m:object', self.NS)), 2)
+
+
+    def test_compact_output_has_no_whitespace_between_elements(self):
+        """Test that the default (compact) output has no indentation or newlines."""
+        mesh = create_square_mesh()
+        objects = self._objects(mesh)
+        
+        with patch.object(threemf_core, '_uuid4_strings', side_effect=lambda n: ['00000000-0000-0000-0000-000000000000'] * n):
+            compact = threemf_core._generate_object_model_xml(objects)
+            pretty = threemf_core._generate_object_model_xml(objects, pretty=True)
+        
+        self.assertNotIn('\n', compact)
+        self.assertNotIn('> <', compact)
+        self.assertLess(len(compact), len(pretty))
+        self.assertEqual(
+            ET.tostring(ET.fromstring(compact.encode('utf-8'))),
+            ET.tostring(ET.fromstring(''.join(line.strip() for line in pretty.splitlines()).encode('utf-8')))
+        )
+    
+    def test_vertex_formatting_matches_format_float(self):
+        """Test that vectorized vertex formatting agrees with format_float."""
+        vertices = [(0.1 * i, -2.5 + i, 0.3333333) for i in range(50)] + [(-0.0, 0.0, 1e-5)]
+        mesh = ThreeMFMesh(vertices=vertices, triangles=[], metadata={})
+        
+        xml = threemf_core._generate_object_model_xml(self._objects(mesh))
+        root = ET.fromstring(xml.encode('utf-8'))
+        
+        written = [(v.get('x'), v.get('y'), v.get('z')) for v in root.findall('.//m:vertex', self.NS)]
+        expected = [(format_float(x), format_float(y), format_float(z)) for x, y, z in vertices[:-1]]
+        self.assertEqual(written[:-1], expected)
+        # Negative zero and tiny positive values are written as plain "0"
+        self.assertEqual(written[-1], ("0", "0", "0"))
+    
+    def test_chunked_streaming_matches_single_chunk(self):
+        """Test that streaming in small chunks produces the same document."""
+        mesh = create_cube_mesh()
+        objects = self._objects(mesh)
+        
+        with patch.object(threemf_core, '_uuid4_strings', side_effect=lambda n: ['00000000-0000-0000-0000-000000000000'] * n):
+            single = threemf_core._generate_object_model_xml(objects)
+            with patch.object(threemf_core, 'XML_WRITE_CHUNK_SIZE', 3):
+                chunked = threemf_core._generate_object_model_xml(objects)
+        
+        self.assertEqual(chunked, single)
+        root = ET.fromstring(chunked.encode('utf-8'))
+        self.assertEqual(len(root.findall('.//m:vertex', self.NS)), 8)
+        self.assertEqual(len(root.findall('.//m:triangle', self.NS)), 12)
+
+
+class TestBoilerplateXml(unittest.TestCase):
+    """Test the fixed content types and relationships files."""
+    
+    RELS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+    
+    def test_relationship_targets(self):
+        """Test that each relationships file points at the right model."""
+        cases = [
+            (threemf_core._generate_rels_xml(), "/3D/3dmodel.model"),
+            (threemf_core._generate_3dmodel_rels_xml(), "/3D/Objects/object_1.model"),
+        ]
+        for xml, target in cases:
+            with self.subTest(target=target):
+                root = ET.fromstring(xml.encode('utf-8'))
+                self.assertEqual(root.tag, f"{self.RELS_NS}Relationships")
+                rel = root.find(f"{self.RELS_NS}Relationship")
+                self.assertEqual(rel.get("Target"), target)
+                self.assertEqual(rel.get("Id"), "rel-1")
+    
+    def test_content_types(self):
+        """Test that every file extension in the archive has a content type."""
+        root = ET.fromstring(threemf_core._generate_content_types_xml().encode('utf-8'))
+        ns = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+        
+        extensions = {d.get("Extension"): d.get("ContentType") for d in root.findall(f"{ns}Default")}
+        
+        self.assertEqual(set(extensions), {"rels", "model", "png", "gcode"})
+        self.assertEqual(extensions["png"], "image/png")
 
 
 class TestThreeMFWriter(unittest.TestCase):
@@ -633,7 +878,41 @@ class TestThreeMFWriter(unittest.TestCase):
         
         # Check that the transform was applied
         self.assertEqual(result['objects'][0].transform, custom_transform)
-    
+
+    def test_component_transforms_written_per_object(self):
+        """Test that shared and distinct transforms are both written correctly."""
+        shared = (10.0, 20.5, 0.0)
+        transforms = {1: shared, 2: shared, 3: (-1.25, 0.0, 2.0), 4: shared, 5: (10.0, 20.5, 0.0)}
+        transform_cb = lambda obj_id, mesh, ctx: transforms[obj_id]
+
+        writer = ThreeMFWriter(
+            naming_callback=self.naming_callback,
+            slot_callback=self.slot_callback,
+            transform_callback=transform_cb
+        )
+
+        meshes = [create_simple_mesh(), create_square_mesh(), create_simple_mesh(),
+                  create_square_mesh(), create_simple_mesh()]
+        output_path = self._create_temp_file()
+
+        writer.write(output_path, meshes)
+
+        with zipfile.ZipFile(output_path, 'r') as zf:
+            root = ET.fromstring(zf.read('3D/3dmodel.model'))
+
+        ns = {'m': 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02'}
+        components = root.findall('.//m:component', ns)
+        self.assertEqual(
+            [c.get('transform') for c in components],
+            [
+                "1 0 0 0 1 0 0 0 1 10 20.5 0",
+                "1 0 0 0 1 0 0 0 1 10 20.5 0",
+                "1 0 0 0 1 0 0 0 1 -1.25 0 2",
+                "1 0 0 0 1 0 0 0 1 10 20.5 0",
+                "1 0 0 0 1 0 0 0 1 10 20.5 0",
+            ]
+        )
+
     def test_context_passed_to_transform_callback(self):
         """Test that context is passed to transform callback."""
         context_received = []
@@ -805,6 +1084,56 @@ class TestThreeMFWriter(unittest.TestCase):
         with zipfile.ZipFile(output_path, 'r') as zf:
             self.assertIn("Metadata/test_thumb.png", zf.namelist())
     
+    def test_thumbnail_callback_runs_in_background(self):
+        """Test that thumbnails render off the calling thread and errors propagate."""
+        callback_threads = []
+        
+        def thumbnail_cb(output_path, context):
+            callback_threads.append(threading.current_thread())
+            return [("Metadata/test_thumb.png", b'\x89PNG\r\n\x1a\n')]
+        
+        writer = ThreeMFWriter(
+            naming_callback=self.naming_callback,
+            slot_callback=self.slot_callback,
+            transform_callback=self.transform_callback,
+            thumbnail_callback=thumbnail_cb
+        )
+        writer.write(self._create_temp_file(), [create_simple_mesh()])
+        
+        self.assertEqual(len(callback_threads), 1)
+        self.assertIsNot(callback_threads[0], threading.current_thread())
+        
+        def failing_cb(output_path, context):
+            raise RuntimeError("thumbnail failure")
+        
+        writer.thumbnail_callback = failing_cb
+        with self.assertRaises(RuntimeError):
+            writer.write(self._create_temp_file(), [create_simple_mesh()])
+    
+    def test_png_entries_stored_and_xml_deflated(self):
+        """Test that PNG thumbnails skip recompression while XML is deflated."""
+        fake_png = b'\x89PNG\r\n\x1a\n' + b'\x00' * 100
+        
+        writer = ThreeMFWriter(
+            naming_callback=self.naming_callback,
+            slot_callback=self.slot_callback,
+            transform_callback=self.transform_callback,
+            thumbnail_callback=lambda output_path, context: [("Metadata/top_1.png", fake_png)]
+        )
+        
+        output_path = self._create_temp_file()
+        writer.write(output_path, [create_simple_mesh()])
+        
+        with zipfile.ZipFile(output_path, 'r') as zf:
+            png_info = zf.getinfo("Metadata/top_1.png")
+            self.assertEqual(png_info.compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(png_info.compress_size, len(fake_png))
+            self.assertEqual(png_info.external_attr >> 16, 0o600)
+            self.assertGreaterEqual(png_info.date_time[0], 2020)
+            self.assertEqual(zf.read("Metadata/top_1.png"), fake_png)
+            model_info = zf.getinfo("3D/Objects/object_1.model")
+            self.assertEqual(model_info.compress_type, zipfile.ZIP_DEFLATED)
+    
     def test_model_title_metadata(self):
         """Test that model title appears in metadata."""
         custom_title = "My Custom Model Title"
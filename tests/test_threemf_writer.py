@@ -9,12 +9,15 @@ import sys
 import os
 import zipfile
 import tempfile
+import numpy as np
 from pathlib import Path
+from unittest.mock import patch
 
 # Add parent directory to path to import the package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from pixel_to_3mf.threemf_writer import write_3mf
+from pixel_to_3mf import threemf_writer
+from pixel_to_3mf.threemf_writer import write_3mf, get_color_name, get_color_names, generate_color_preview
 from pixel_to_3mf.threemf_core import format_float
 from pixel_to_3mf.mesh_generator import Mesh
 from pixel_to_3mf.image_processor import PixelData
@@ -51,6 +54,115 @@ class TestFormatFloat(unittest.TestCase):
         self.assertEqual(result, "0.001")
 
 
+class TestGetColorNames(unittest.TestCase):
+    """Test batched color naming."""
+    
+    def test_color_mode_matches_single_lookups(self):
+        """Test that batched CSS naming agrees with get_color_name."""
+        config = ConversionConfig(color_naming_mode="color")
+        rgbs = [
+            (255, 0, 0), (0, 255, 255), (18, 52, 86), (250, 128, 114),
+            (128, 128, 128), (255, 0, 0), (0, 0, 0), (255, 255, 255)
+        ]
+        
+        names = get_color_names(rgbs, config)
+        
+        self.assertEqual(names, [get_color_name(rgb, config) for rgb in rgbs])
+        self.assertEqual(names[0], names[5])
+    
+    def test_hex_mode(self):
+        """Test that non-CSS modes fall back to per-color naming."""
+        config = ConversionConfig(color_naming_mode="hex")
+        
+        names = get_color_names([(255, 0, 0), (0, 0, 255)], config)
+        
+        self.assertEqual(names, ["#FF0000", "#0000FF"])
+    
+    def test_empty_input(self):
+        """Test that an empty color list returns an empty name list."""
+        self.assertEqual(get_color_names([], ConversionConfig()), [])
+    
+    def test_filament_mode_matches_single_lookups(self):
+        """Test that batched hue-aware filament naming agrees with get_color_name."""
+        config = ConversionConfig(color_naming_mode="filament")
+        rgbs = [(0, 0, 255), (104, 108, 232), (255, 0, 0), (30, 30, 30), (0, 0, 255), (120, 60, 220)]
+        
+        names = get_color_names(rgbs, config)
+        
+        self.assertEqual(names, [get_color_name(rgb, config) for rgb in rgbs])
+    
+    def test_hue_aware_batch_matches_scalar_search(self):
+        """Test the vectorized hue penalty against a scalar weighted-distance scan."""
+        from color_tools import delta_e_2000, rgb_to_lab
+        
+        filters = (("Bambu Lab",), None, None)
+        filaments = threemf_writer._filtered_filaments(*filters)
+        rgbs = [(0, 0, 255), (104, 108, 232), (60, 20, 200), (90, 10, 180), (20, 200, 40), (200, 180, 160)]
+        
+        batched = threemf_writer._nearest_filaments_hue_aware(rgbs, *filters)
+        
+        def _weighted_distance(target_rgb, filament):
+            distance = delta_e_2000(rgb_to_lab(target_rgb), filament.lab)
+            categories = {
+                threemf_writer._rgb_to_blue_purple_category(target_rgb),
+                threemf_writer._rgb_to_blue_purple_category(filament.rgb)
+            }
+            if categories == {'blue', 'purple'}:
+                distance += threemf_writer._CATEGORY_MISMATCH_PENALTY
+            return distance
+        
+        for rgb, match in zip(rgbs, batched):
+            scores = [_weighted_distance(rgb, f) for f in filaments]
+            with self.subTest(rgb=rgb):
+                self.assertIs(match, filaments[scores.index(min(scores))])
+    
+    def test_blue_purple_codes_match_scalar_categories(self):
+        """Test that vectorized category codes agree with _rgb_to_blue_purple_category."""
+        expected_codes = {None: 0, 'boundary': 0, 'blue': 1, 'purple': 2}
+        rgbs = [(r, 0, b) for r in (0, 49, 50, 80, 81, 255) for b in (0, 149, 150, 255)]
+        
+        codes = threemf_writer._blue_purple_codes(np.array(rgbs))
+        
+        self.assertEqual(
+            codes.tolist(),
+            [expected_codes[threemf_writer._rgb_to_blue_purple_category(rgb)] for rgb in rgbs]
+        )
+    
+    def test_filament_palette_loaded_once(self):
+        """Test that filament lookups share one palette load across colors and filters."""
+        threemf_writer._filament_palette.cache_clear()
+        threemf_writer._filtered_filaments.cache_clear()
+        threemf_writer._get_filament_name_cached.cache_clear()
+        self.addCleanup(threemf_writer._filament_palette.cache_clear)
+        
+        load_default = threemf_writer.FilamentPalette.load_default
+        with patch.object(threemf_writer.FilamentPalette, 'load_default', side_effect=load_default) as mock_load:
+            for maker in ("Bambu Lab", None):
+                config = ConversionConfig(color_naming_mode="filament", filament_maker=maker)
+                names = [get_color_name(rgb, config) for rgb in [(255, 0, 0), (0, 128, 0), (10, 10, 200)]]
+                self.assertTrue(all(names))
+        
+        self.assertEqual(mock_load.call_count, 1)
+    
+    def test_greedy_matching_reuses_lab_conversions(self):
+        """Test that greedy matching gives distinct filaments and hits the LAB cache."""
+        from color_tools import rgb_to_lab
+        
+        threemf_writer._cached_rgb_to_lab.cache_clear()
+        config = ConversionConfig(color_naming_mode="filament", filament_maker="Bambu Lab")
+        rgbs = [(255, 0, 0), (250, 5, 5), (0, 128, 0), (10, 10, 200)]
+        
+        assignments = threemf_writer.greedy_filament_matching(rgbs, config)
+        
+        self.assertEqual(set(assignments), set(rgbs))
+        names = [name for name, _ in assignments.values()]
+        self.assertEqual(len(set(names)), len(names))
+        # Later passes of the pair search only hit the cache
+        info = threemf_writer._cached_rgb_to_lab.cache_info()
+        self.assertGreater(info.hits, info.misses)
+        self.assertEqual(threemf_writer._cached_rgb_to_lab((10, 10, 200)), rgb_to_lab((10, 10, 200)))
+
+
 class TestWrite3MF(unittest.TestCase):
     """Test 3MF file writing."""
     
@@ -287,5 +399,34 @@ class TestWrite3MFIntegration(unittest.TestCase):
         validate_3mf_structure(output_path)
 
 
+class TestGenerateColorPreview(unittest.TestCase):
+    """Test the original vs. matched color preview image."""
+    
+    def test_panels_show_original_and_mapped_colors(self):
+        """Test that the left panel keeps detected colors and the right one shows filaments."""
+        pixels = {
+            (0, 0): (200, 10, 10, 255),   # Bottom-left in model coords
+            (2, 1): (10, 10, 200, 255),   # Top-right, not in the mapping
+        }
+        pixel_data = PixelData(width=3, height=2, pixel_size_mm=1.0, pixels=pixels)
+        mapping = {(200, 10, 10): (255, 0, 0)}
+        
+        fd, output_path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        self.addCleanup(os.remove, output_path)
+        generate_color_preview(pixel_data, mapping, output_path)
+        
+        from PIL import Image
+        preview = Image.open(output_path).convert('RGB')
+        label_height, gap = 30, 20
+        right = 3 + gap
+        # Image rows run top to bottom, so model y=0 is the last row
+        self.assertEqual(preview.getpixel((0, label_height + 1)), (200, 10, 10))
+        self.assertEqual(preview.getpixel((right, label_height + 1)), (255, 0, 0))
+        self.assertEqual(preview.getpixel((right + 2, label_height)), (10, 10, 200))
+        # Transparent pixels show the white background
+        self.assertEqual(preview.getpixel((right + 1, label_height)), (255, 255, 255))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,198 @@
+"""
+Unit tests for the thumbnail_generator module.
+
+Tests that the 3MF thumbnail views are valid PNGs of the right size and
+that sharing intermediate rasters between views doesn't change them.
+"""
+
+import unittest
+import io
+import sys
+from pathlib import Path
+from unittest.mock import patch
+from PIL import Image
+
+# Add parent directory to path to import the package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pixel_to_3mf import thumbnail_generator
+from pixel_to_3mf.thumbnail_generator import (
+    generate_top_view,
+    generate_pick_view,
+    generate_plate_view,
+    generate_plate_small,
+    generate_plate_no_light,
+    generate_all_thumbnails,
+    _encode_png,
+    _iso_layout,
+    _ThumbContext
+)
+
+
+def _make_source() -> Image.Image:
+    """Create a small non-square RGBA image with a transparent corner."""
+    img = Image.new('RGBA', (12, 8), (200, 40, 40, 255))
+    for x in range(4):
+        for y in range(3):
+            img.putpixel((x, y), (0, 0, 0, 0))
+    img.putpixel((10, 6), (20, 90, 220, 255))
+    return img
+
+
+class TestThumbnailViews(unittest.TestCase):
+    """Test the individual thumbnail generators."""
+
+    def test_views_are_pngs_of_expected_size(self):
+        """Test that every view decodes as a PNG of the documented size."""
+        source = _make_source()
+        plate = generate_plate_view(source)
+
+        views = {
+            "top": (generate_top_view(source), (512, 512)),
+            "pick": (generate_pick_view(source), (512, 512)),
+            "plate": (plate, (512, 512)),
+            "plate_small": (generate_plate_small(plate), (128, 128)),
+            "plate_no_light": (generate_plate_no_light(source), (512, 512)),
+        }
+        for name, (data, size) in views.items():
+            with self.subTest(view=name):
+                img = Image.open(io.BytesIO(data))
+                self.assertEqual(img.format, 'PNG')
+                self.assertEqual(img.size, size)
+    
+    def test_pick_view_is_gray_where_source_is_opaque(self):
+        """Test that the silhouette is 50% gray exactly under non-transparent pixels."""
+        source = _make_source()
+        pick = Image.open(io.BytesIO(generate_pick_view(source))).convert('RGBA')
+        
+        # Compare against the scaled image the silhouette was built from
+        scaled, x_offset, y_offset = _ThumbContext(source).top(512)
+        for (x, y) in [(0, 0), (scaled.width - 1, scaled.height - 1), (scaled.width // 2, scaled.height // 2)]:
+            with self.subTest(pixel=(x, y)):
+                expected = (128, 128, 128, 255) if scaled.getpixel((x, y))[3] > 0 else (0, 0, 0, 0)
+                self.assertEqual(pick.getpixel((x + x_offset, y + y_offset)), expected)
+        # Padding outside the scaled image stays transparent
+        self.assertEqual(pick.getpixel((0, 0)), (0, 0, 0, 0))
+
+
+class TestEncodePng(unittest.TestCase):
+    """Test the thumbnail PNG encoder."""
+
+    def _assert_rgba_round_trip(self, data: bytes, img: Image.Image):
+        Image.open(io.BytesIO(data)).verify()  # Chunk CRCs and structure
+        decoded = Image.open(io.BytesIO(data))
+        self.assertEqual(decoded.mode, 'RGBA')
+        self.assertEqual(decoded.size, img.size)
+        self.assertEqual(decoded.tobytes(), img.tobytes())
+
+    def test_rgba_round_trip(self):
+        """Test that the filter-None RGBA encoding decodes to the same pixels."""
+        img = _make_source().resize((37, 23), Image.Resampling.LANCZOS)
+        with patch.object(thumbnail_generator, 'IMAGECODECS_AVAILABLE', False):
+            data = _encode_png(img)
+        self._assert_rgba_round_trip(data, img)
+
+    @unittest.skipUnless(thumbnail_generator.IMAGECODECS_AVAILABLE, "imagecodecs not installed")
+    def test_imagecodecs_round_trip(self):
+        """Test that the imagecodecs encoding decodes to the same pixels."""
+        img = _make_source().resize((37, 23), Image.Resampling.LANCZOS)
+        self._assert_rgba_round_trip(_encode_png(img), img)
+
+    def test_other_modes_use_pillow(self):
+        """Test that non-RGBA images still encode losslessly."""
+        img = _make_source().convert('RGB')
+        decoded = Image.open(io.BytesIO(_encode_png(img)))
+        self.assertEqual(decoded.mode, 'RGB')
+        self.assertEqual(decoded.tobytes(), img.tobytes())
+
+
+class TestThumbContext(unittest.TestCase):
+    """Test sharing intermediate rasters between thumbnail generators."""
+
+    def test_shared_context_matches_plain_image(self):
+        """Test that views rendered from one context equal views from the image."""
+        source = _make_source()
+        ctx = _ThumbContext(source)
+
+        for generate in (generate_top_view, generate_pick_view, generate_plate_view, generate_plate_no_light):
+            with self.subTest(view=generate.__name__):
+                self.assertEqual(generate(ctx), generate(source))
+
+    def test_rasters_are_computed_once(self):
+        """Test that repeated requests return the cached images."""
+        ctx = _ThumbContext(_make_source())
+
+        self.assertIs(ctx.scaled(512)[0], ctx.scaled(512)[0])
+        self.assertIs(ctx.iso(512), ctx.iso(512))
+        # The isometric view is built from the 70% scaled image
+        self.assertIn((int(512 * 0.7), Image.Resampling.NEAREST), ctx._scaled)
+
+    def test_whole_factor_upscale_uses_nearest(self):
+        """Test that top/pick keep pixel art crisp when the scale factor is whole."""
+        source = Image.new('RGBA', (16, 16), (200, 40, 40, 255))
+        source.putpixel((3, 5), (20, 90, 220, 255))
+        top = Image.open(io.BytesIO(generate_top_view(source))).convert('RGBA')
+
+        # 512 / 16 = 32: every output pixel is one of the two source colors
+        self.assertEqual(
+            {color for _, color in top.getcolors()},
+            {(200, 40, 40, 255), (20, 90, 220, 255)}
+        )
+        self.assertEqual(top.getpixel((3 * 32 + 31, 5 * 32)), (20, 90, 220, 255))
+
+    def test_iso_layout_matches_pillow_rotation(self):
+        """Test that the precomputed rotated size equals what Image.rotate produces."""
+        for size in [(12, 8), (8, 12), (16, 16), (1, 1), (100, 7), (33, 64)]:
+            with self.subTest(size=size):
+                ctx = _ThumbContext(Image.new('RGBA', size, (255, 0, 0, 255)))
+                _, rotated_width, rotated_height, _, _ = _iso_layout(*size, 512)
+                self.assertEqual(ctx.iso(512).size, (rotated_width, rotated_height))
+
+    def test_plate_small_from_canvas_matches_png_bytes(self):
+        """Test that downscaling the in-memory plate canvas equals decoding plate_1.png."""
+        ctx = _ThumbContext(_make_source())
+
+        self.assertEqual(
+            generate_plate_small(ctx.plate(512)),
+            generate_plate_small(generate_plate_view(ctx))
+        )
+
+
+class TestGenerateAllThumbnails(unittest.TestCase):
+    """Test the batch entry point used when writing a 3MF."""
+
+    def test_matches_individual_generators(self):
+        """Test that the batch output equals calling each generator separately."""
+        source = _make_source()
+        thumbnails = generate_all_thumbnails(source)
+
+        plate = generate_plate_view(source)
+        expected = {
+            "top_1.png": generate_top_view(source),
+            "pick_1.png": generate_pick_view(source),
+            "plate_1.png": plate,
+            "plate_1_small.png": generate_plate_small(plate),
+            "plate_no_light_1.png": generate_plate_no_light(source),
+        }
+        self.assertEqual(list(thumbnails), list(expected))
+        for name, data in expected.items():
+            with self.subTest(thumbnail=name):
+                self.assertEqual(thumbnails[name], data)
+
+    def test_each_scaled_raster_resized_once(self):
+        """Test that top/pick share one resize and both plate views share another."""
+        source = _make_source()
+        with patch.object(thumbnail_generator, '_scale_to_fit', wraps=thumbnail_generator._scale_to_fit) as mock_scale:
+            generate_all_thumbnails(source)
+
+        target_sizes = sorted(call.args[1] for call in mock_scale.call_args_list)
+        self.assertEqual(target_sizes, [int(512 * 0.7), 512])
+
+    def test_plate_views_share_encoded_bytes(self):
+        """Test that the identical plate views are encoded only once."""
+        thumbnails = generate_all_thumbnails(_make_source())
+        self.assertIs(thumbnails["plate_no_light_1.png"], thumbnails["plate_1.png"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -406,6 +406,17 @@ class TestTrimDisconnectedPixels(unittest.TestCase):
         
         # All red pixels should be preserved
         self.assertEqual(red_result.pixels, red_pixels)
+    
+    def test_caller_all_pixels_not_modified(self):
+        """Test that trimming leaves the caller's all_pixels dict untouched."""
+        region_pixels = {(0, 0), (1, 0), (2, 1), (4, 4)}
+        region = Region(color=(255, 0, 0), pixels=region_pixels)
+        all_pixels = _pixels_to_dict(region_pixels)
+        
+        result = trim_disconnected_pixels([region], all_pixels)
+        
+        self.assertEqual(result[0].pixels, {(0, 0), (1, 0)})
+        self.assertEqual(all_pixels, _pixels_to_dict(region_pixels))
 
 
 if __name__ == '__main__':